@@ -7,13 +7,21 @@ from multiple MCP servers.
 
 import argparse
 import asyncio
+import hashlib
+import importlib.util
 import json
 import os
+import sys
+import time
 import traceback
+from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     List,
+    Optional,
+    Tuple,
     Union,
 )
 
@@ -22,6 +30,7 @@ from dotenv import (
     load_dotenv,
 )
 from examples.support.mcp import (
+    ainput,
     convert_mcp_content_to_message,
     get_prompt_arguments,
     get_template_variables_from_user,
@@ -33,7 +42,10 @@ from mcp.types import (
     Resource,
     ResourceTemplate,
 )
-from mcp_multi_server import MultiServerClient
+from mcp_multi_server import (
+    MultiServerClient,
+    ServerCapabilities,
+)
 from mcp_multi_server.utils import (
     configure_logging,
     extract_template_variables,
@@ -43,11 +55,261 @@ from mcp_multi_server.utils import (
 )
 
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    import httpx
+    from openai import AsyncOpenAI
+
+
+try:
+    import orjson
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def _json_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def _json_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
 
 
 load_dotenv(find_dotenv())
 
+# Bound on the conversation size: beyond HISTORY_MAX_MESSAGES, older turns are folded into a summary
+HISTORY_MAX_MESSAGES = 40
+HISTORY_KEEP_RECENT = 10
+
+CAPABILITIES_CACHE_DIR = Path("~/.cache/mcp-multi-server").expanduser()
+CAPABILITIES_CACHE_TTL_SECONDS = 600
+
+
+def _capabilities_cache_path(config_path: str) -> Path:
+    """Return the capabilities cache file for a server configuration (keyed by the config file hash)."""
+    return CAPABILITIES_CACHE_DIR / f"{hashlib.sha256(Path(config_path).read_bytes()).hexdigest()}.json"
+
+
+def _load_cached_capabilities(cache_path: Path) -> Optional[Dict[str, ServerCapabilities]]:
+    """Load cached server capabilities if the cache file exists and is younger than the TTL.
+
+    Args:
+        cache_path: Path of the cache file.
+
+    Returns:
+        Capabilities keyed by server name, or None on a cache miss (missing, expired or unreadable).
+    """
+    try:
+        if time.time() - cache_path.stat().st_mtime > CAPABILITIES_CACHE_TTL_SECONDS:
+            return None
+        data = _json_loads(cache_path.read_bytes())
+        return {server_name: ServerCapabilities.model_validate(caps) for server_name, caps in data.items()}
+    except (OSError, ValueError):
+        return None
+
+
+def _save_capabilities_cache(cache_path: Path, capabilities: Dict[str, ServerCapabilities]) -> None:
+    """Write discovered server capabilities to the cache file (failures are ignored).
+
+    Args:
+        cache_path: Path of the cache file.
+        capabilities: Capabilities keyed by server name.
+    """
+    data = {server_name: caps.model_dump(mode="json", by_alias=True) for server_name, caps in capabilities.items()}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _create_http_client() -> "httpx.AsyncClient":
+    """Create a pooled keep-alive HTTP client shared by every OpenAI request of the session.
+
+    HTTP/2 is enabled only when the optional ``h2`` package is installed (``pip install httpx[http2]``).
+
+    Returns:
+        Async HTTP client to pass to AsyncOpenAI.
+    """
+    # Imported lazily: openai/httpx are only needed once the chat actually starts
+    import httpx
+    from openai import DefaultAsyncHttpxClient
+
+    return DefaultAsyncHttpxClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
+def _to_response_input(message: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert a chat-style message into Responses API input items.
+
+    Args:
+        message: Message with a role and either string content or a list of chat content parts.
+            Tool messages become function call outputs, and the tool calls of an assistant
+            message become function call items.
+
+    Returns:
+        Equivalent input items for the Responses API.
+    """
+    if message["role"] == "tool":
+        return [{"type": "function_call_output", "call_id": message["tool_call_id"], "output": message["content"]}]
+
+    items: List[Dict[str, Any]] = []
+    content = message["content"]
+    if isinstance(content, str):
+        items.append({"role": message["role"], "content": content})
+    elif content:
+        text_type = "output_text" if message["role"] == "assistant" else "input_text"
+        parts: List[Dict[str, Any]] = []
+        for part in content:
+            if part["type"] == "image_url":
+                parts.append({"type": "input_image", "image_url": part["image_url"]["url"], "detail": "auto"})
+            else:
+                parts.append({"type": text_type, "text": part["text"]})
+        items.append({"role": message["role"], "content": parts})
+
+    for tool_call in message.get("tool_calls") or []:
+        items.append(
+            {
+                "type": "function_call",
+                "call_id": tool_call["id"],
+                "name": tool_call["function"]["name"],
+                "arguments": tool_call["function"]["arguments"],
+            }
+        )
+    return items
+
+
+def _render_transcript(messages: List[Dict[str, Any]]) -> str:
+    """Render messages as plain text for summarization (media parts become placeholders)."""
+    lines = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "[image]") for part in content)
+        if content:
+            lines.append(f"{message['role']}: {content}")
+        for tool_call in message.get("tool_calls") or []:
+            lines.append(
+                f"{message['role']}: called {tool_call['function']['name']}({tool_call['function']['arguments']})"
+            )
+    return "\n".join(lines)
+
+
+async def _trim_history(
+    openai_client: "AsyncOpenAI", messages: List[Dict[str, Any]], summary_model: str
+) -> List[Dict[str, Any]]:
+    """Fold the older part of the conversation into a summary message.
+
+    The most recent HISTORY_KEEP_RECENT messages are kept verbatim. The split point never
+    separates an assistant tool call from its tool responses.
+
+    Args:
+        openai_client: Async OpenAI client instance.
+        messages: Conversation history in chat message format.
+        summary_model: Model used for the one-shot summarization request.
+
+    Returns:
+        New history made of a system summary message followed by the recent messages.
+    """
+    split = len(messages) - HISTORY_KEEP_RECENT
+    while split < len(messages) and messages[split]["role"] == "tool":
+        split += 1
+
+    response = await openai_client.responses.create(
+        model=summary_model,
+        input=(
+            "Summarize the following conversation turns in at most 200 words, keeping any facts, "
+            "names and figures needed to continue the conversation:\n\n" + _render_transcript(messages[:split])
+        ),
+    )
+    return [{"role": "system", "content": f"Summary so far: {response.output_text}"}, *messages[split:]]
+
+
+async def _stream_response(
+    openai_client: "AsyncOpenAI",
+    input_items: List[Dict[str, Any]],
+    previous_response_id: Optional[str],
+    response_kwargs: Dict[str, Any],
+) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Stream a Responses API turn, printing the assistant text as it arrives.
+
+    Only the items that are new since ``previous_response_id`` are uploaded; the
+    conversation history is kept server-side by OpenAI.
+
+    Args:
+        openai_client: Async OpenAI client instance.
+        input_items: New input items (user messages or function call outputs).
+        previous_response_id: Id of the previous response in the conversation, if any.
+        response_kwargs: Precomputed keyword arguments for the request (model, tools, tool_choice).
+
+    Returns:
+        Tuple of the response id (None if the response failed or the stream ended without a final
+        response event) and the assistant message as a chat-style dict, with any function calls listed
+        under ``tool_calls`` (the call id is used as the tool call id).
+    """
+    from openai.types.responses import (
+        ResponseCompletedEvent,
+        ResponseErrorEvent,
+        ResponseFailedEvent,
+        ResponseFunctionToolCall,
+        ResponseIncompleteEvent,
+        ResponseOutputItemDoneEvent,
+        ResponseTextDeltaEvent,
+    )
+
+    stream = await openai_client.responses.create(
+        input=input_items,  # type: ignore[arg-type]
+        previous_response_id=previous_response_id,
+        stream=True,
+        **response_kwargs,
+    )
+
+    content_parts: List[str] = []
+    tool_calls: List[Dict[str, Any]] = []
+    response_id: Optional[str] = None
+
+    async for event in stream:  # type: ignore[union-attr]
+        if isinstance(event, ResponseTextDeltaEvent):
+            if not content_parts:
+                sys.stdout.write("\n\033[34m")
+            content_parts.append(event.delta)
+            sys.stdout.write(event.delta)
+            # Flush on line breaks or every few deltas rather than once per token
+            if "\n" in event.delta or len(content_parts) % 8 == 0:
+                sys.stdout.flush()
+        elif isinstance(event, ResponseOutputItemDoneEvent) and isinstance(event.item, ResponseFunctionToolCall):
+            tool_calls.append(
+                {
+                    "id": event.item.call_id,
+                    "type": "function",
+                    "function": {"name": event.item.name, "arguments": event.item.arguments},
+                }
+            )
+        elif isinstance(event, (ResponseCompletedEvent, ResponseIncompleteEvent)):
+            response_id = event.response.id
+        elif isinstance(event, ResponseFailedEvent):
+            # A failed response cannot be chained on, so the next request uploads the full history
+            error = event.response.error
+            print(f"\n[Error] Response failed: {error.message if error else 'unknown error'}")
+        elif isinstance(event, ResponseErrorEvent):
+            print(f"\n[Error] {event.code or 'stream error'}: {event.message}")
+
+    if content_parts:
+        sys.stdout.write("\033[0m\n\n")
+        sys.stdout.flush()
+
+    message: Dict[str, Any] = {"role": "assistant", "content": "".join(content_parts) or None}
+    if tool_calls:
+        message["tool_calls"] = tool_calls
+
+    return response_id, message
+
 
 async def search_and_instantiate_prompt(
     client: MultiServerClient, prompts: Dict[str, Prompt], name: str
@@ -63,21 +325,21 @@ async def search_and_instantiate_prompt(
         List of OpenAI-formatted messages with proper image/audio support.
 
     """
-    prompt: Union[Prompt, None]
-    if prompts:
-        prompt = prompts.get(name)
-        if prompt:
-            prompt_result = await client.get_prompt(name, arguments=get_prompt_arguments(prompt))
-            if prompt_result.messages:
-                openai_messages = []
-                for msg in prompt_result.messages:
-                    # Display content to user (shows images/audio locally)
-                    handle_content_block(msg.content)
-                    # Convert to OpenAI message format (string for text, array for media)
-                    content = convert_mcp_content_to_message(msg.content)
-                    openai_messages.append({"role": msg.role, "content": content})
-                return openai_messages
-    return []
+    prompt = prompts.get(name) if prompts else None
+    if prompt is None:
+        return []
+
+    prompt_arguments = await asyncio.to_thread(get_prompt_arguments, prompt)
+    prompt_result = await client.get_prompt(name, arguments=prompt_arguments)
+
+    # Display content to user (shows images/audio locally)
+    for msg in prompt_result.messages:
+        await asyncio.to_thread(handle_content_block, msg.content)
+
+    # Convert to OpenAI message format (string for text, array for media)
+    return [
+        {"role": msg.role, "content": convert_mcp_content_to_message(msg.content)} for msg in prompt_result.messages
+    ]
 
 
 async def search_and_instantiate_resource(
@@ -97,43 +359,59 @@ async def search_and_instantiate_resource(
         The resource content.
 
     """
-    if resources:
-        resource = resources.get(name)
-        if resource:
-            if not is_template:
-                uri = resource.uri  # type: ignore[union-attr]
-            else:
-                uri_template = resource.uriTemplate  # type: ignore[union-attr]
-                variables = extract_template_variables(uri_template)
-                print(f"Variables in template: {variables}")
-                if variables:
-                    var_values = get_template_variables_from_user(uri_template)
-                    uri = substitute_template_variables(uri_template, var_values)
-                else:
-                    uri = uri_template
-            resource_result = await client.read_resource(uri=uri)
-            # Assuming single text message resource
-            resource_result_text = resource_result.contents[0].text if resource_result.contents else ""  # type: ignore[union-attr]
-            print(f"[Result] {resource_result_text}\n")
-            return resource_result_text
-    return ""
-
-
-async def chat(config_path: str = "examples/mcp_servers.json", verbose: bool = False, model: str = "gpt-5.2") -> None:
+    resource = resources.get(name) if resources else None
+    if resource is None:
+        return ""
+
+    if not is_template:
+        uri = resource.uri  # type: ignore[union-attr]
+    else:
+        uri_template = resource.uriTemplate  # type: ignore[union-attr]
+        variables = extract_template_variables(uri_template)
+        print(f"Variables in template: {variables}")
+        if variables:
+            var_values = await asyncio.to_thread(get_template_variables_from_user, uri_template)
+            uri = substitute_template_variables(uri_template, var_values)
+        else:
+            uri = uri_template
+    resource_result = await client.read_resource(uri=uri)
+    # Assuming single text message resource
+    resource_result_text = resource_result.contents[0].text if resource_result.contents else ""  # type: ignore[union-attr]
+    print(f"[Result] {resource_result_text}\n")
+    return resource_result_text
+
+
+async def chat(
+    config_path: str = "examples/mcp_servers.json",
+    verbose: bool = False,
+    model: str = "gpt-5.2",
+    use_cache: bool = True,
+    summary_model: str = "gpt-4o-mini",
+) -> None:
     """Run the multi-server chat interface.
 
     Args:
         config_path: Path to the server configuration file.
         verbose: Enable verbose output for tool calls and results.
         model: OpenAI model to use for chat completions.
+        use_cache: Reuse server capabilities cached on disk by a previous run (see CAPABILITIES_CACHE_TTL_SECONDS).
+        summary_model: OpenAI model used to summarize older turns once the history exceeds HISTORY_MAX_MESSAGES.
     """
 
     assert os.getenv("OPENAI_API_KEY"), "Error: OPENAI_API_KEY not found in environment"
 
     configure_logging(level="INFO" if verbose else "WARNING")
 
+    http_client = _create_http_client()
+
     try:
-        async with MultiServerClient.from_config(config_path) as client:
+        # Capabilities cached by a recent run with the same config skip discovery on connect
+        cache_path = _capabilities_cache_path(config_path) if use_cache else None
+        cached_capabilities = _load_cached_capabilities(cache_path) if cache_path else None
+
+        async with MultiServerClient.from_config(config_path, cached_capabilities=cached_capabilities) as client:
+            if cache_path and cached_capabilities is None:
+                _save_capabilities_cache(cache_path, client.capabilities)
 
             await client.set_logging_level(level="info" if verbose else "warning")
 
@@ -147,19 +425,31 @@ async def chat(config_path: str = "examples/mcp_servers.json", verbose: bool = F
                 template.name: template for template in client.list_resource_templates().resourceTemplates
             }
 
-            # Get tools from all servers and convert them to OpenAI format
+            # Get tools from all servers and convert them to OpenAI (Responses API) format
             tools_result = client.list_tools().tools or []
-            openai_tools = mcp_tools_to_openai_format(tools_result)
+            openai_tools = [
+                {"type": "function", **tool["function"], "strict": False}
+                for tool in mcp_tools_to_openai_format(tools_result)
+            ]
+            response_kwargs: Dict[str, Any] = (
+                {"model": model, "tools": openai_tools, "tool_choice": "auto"} if openai_tools else {"model": model}
+            )
 
             # Initialize OpenAI client
-            openai_client = OpenAI()
+            from openai import AsyncOpenAI
+
+            openai_client = AsyncOpenAI(http_client=http_client)
 
             # Chat loop
+            # messages mirrors the conversation locally; OpenAI keeps the history server-side, so each
+            # request only uploads messages[sent_count:] and chains on previous_response_id
             messages: List[Dict[str, Any]] = []
+            sent_count = 0
+            previous_response_id: Optional[str] = None
             print("Multi-Server MCP Chat Client")
             print("Type 'exit' or 'quit' to end the conversation\n")
 
-            query = input("> ")
+            query = await ainput("> ")
 
             while query.lower() not in ("exit", "quit"):
 
@@ -174,7 +464,7 @@ async def chat(config_path: str = "examples/mcp_servers.json", verbose: bool = F
                         messages.extend(prompt_messages)
                     else:
                         print(f"Prompt '{prompt}' not found.")
-                    query = input("> ")
+                    query = await ainput("> ")
                     continue
 
                 if query.startswith("+resource:"):
@@ -186,7 +476,7 @@ async def chat(config_path: str = "examples/mcp_servers.json", verbose: bool = F
                         messages.append({"role": "user", "content": resource})
                     else:
                         print(f"Resource '{resource_name}' not found.")
-                    query = input("> ")
+                    query = await ainput("> ")
                     continue
 
                 if query.startswith("+template:"):
@@ -200,80 +490,84 @@ async def chat(config_path: str = "examples/mcp_servers.json", verbose: bool = F
                         messages.append({"role": "user", "content": resource})
                     else:
                         print(f"Resource Template '{template_name}' not found.")
-                    query = input("> ")
+                    query = await ainput("> ")
                     continue
 
                 messages.append({"role": "user", "content": query})
 
-                # Make OpenAI LLM call to answer the user query
-                response = openai_client.chat.completions.create(  # type: ignore[call-overload]
-                    model=model,
-                    messages=messages,
-                    tools=openai_tools if openai_tools else None,
-                    tool_choice="auto" if openai_tools else None,
-                ).choices[0]
+                # Make OpenAI LLM call to answer the user query (assistant text is streamed to stdout)
+                previous_response_id, assistant_message = await _stream_response(
+                    openai_client,
+                    [item for message in messages[sent_count:] for item in _to_response_input(message)],
+                    previous_response_id,
+                    response_kwargs,
+                )
 
                 # Handle tool calls
-                while response.finish_reason == "tool_calls":
-                    messages.append(response.message)
-
-                    for tool_call in response.message.tool_calls:
-                        tool_name = tool_call.function.name
-                        tool_args = json.loads(tool_call.function.arguments)
-
-                        if verbose:
-                            print(f"****[Tool Call] {tool_name}")
-                            print(f"****[Arguments] {json.dumps(tool_args, indent=2)}")
-
-                        # Execute tool via appropriate server
-                        try:
-                            tool_result = await client.call_tool(tool_name, tool_args)
-
-                            # Process tool result content (handles images, audio, text, etc.)
-                            # Returns string content (images are converted to text descriptions)
-                            result_content = process_tool_result_content(tool_result, verbose=verbose)
-
-                            # Add tool response to conversation
-                            # Tool messages must always have string content (not arrays)
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "content": result_content,
-                                }
-                            )
-
-                        except Exception as e:
-                            error_msg = f"Error executing tool {tool_name}: {str(e)}"
-                            print(f"[Error] {error_msg}\n")
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "content": error_msg,
-                                }
+                while assistant_message.get("tool_calls"):
+                    messages.append(assistant_message)
+                    # Without a response id to chain on, the next request uploads the full history
+                    sent_count = len(messages) if previous_response_id else 0
+
+                    tool_calls = assistant_message["tool_calls"]
+                    tool_names = [tool_call["function"]["name"] for tool_call in tool_calls]
+                    tool_args_list = [_json_loads(tool_call["function"]["arguments"]) for tool_call in tool_calls]
+
+                    if verbose:
+                        sys.stdout.write(
+                            "".join(
+                                f"****[Tool Call] {tool_name}\n****[Arguments] {_json_pretty(tool_args)}\n"
+                                for tool_name, tool_args in zip(tool_names, tool_args_list)
                             )
+                        )
+                        sys.stdout.flush()
+
+                    # Execute all tool calls concurrently; calls owned by the same server are sent as a
+                    # single batch request when that server supports it
+                    tool_results = await client.call_tools(list(zip(tool_names, tool_args_list)))
+
+                    # Tool messages are appended in the original order (one per tool_call_id)
+                    for tool_call, tool_result in zip(tool_calls, tool_results):
+                        # Process tool result content (handles images, audio, text, etc.)
+                        # Returns string content (images are converted to text descriptions)
+                        # Tool messages must always have string content (not arrays)
+                        messages.append(
+                            {
+                                "role": "tool",
+                                "tool_call_id": tool_call["id"],
+                                "content": process_tool_result_content(tool_result, verbose=verbose),
+                            }
+                        )
+
+                    # Get next response from LLM with tool results (only the tool outputs are uploaded)
+                    previous_response_id, assistant_message = await _stream_response(
+                        openai_client,
+                        [item for message in messages[sent_count:] for item in _to_response_input(message)],
+                        previous_response_id,
+                        response_kwargs,
+                    )
 
-                    # Get next response from LLM with tool results
-                    response = openai_client.chat.completions.create(  # type: ignore[call-overload]
-                        model=model,
-                        messages=messages,
-                        tools=openai_tools if openai_tools else None,
-                        tool_choice="auto" if openai_tools else None,
-                    ).choices[0]
+                # Assistant response was already printed while streaming
+                messages.append(assistant_message)
+                sent_count = len(messages) if previous_response_id else 0
 
-                # Print assistant response
-                print(f"\n\033[34m{response.message.content}\033[0m\n")
-                messages.append(response.message)
+                # Keep the conversation bounded: summarize older turns and start a new response chain
+                # from the trimmed history (it is uploaded in full on the next turn)
+                if len(messages) > HISTORY_MAX_MESSAGES:
+                    messages = await _trim_history(openai_client, messages, summary_model)
+                    sent_count = 0
+                    previous_response_id = None
 
                 # Get next user input
-                query = input("> ")
+                query = await ainput("> ")
 
     except FileNotFoundError as e:
         print(f"Configuration error: {e}")
     except Exception:
         print("An error occurred:")
         traceback.print_exc()
+    finally:
+        await http_client.aclose()
 
 
 def main() -> None:
@@ -311,8 +605,21 @@ Examples:
         help="OpenAI model to use (default: %(default)s)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached server capabilities and rediscover them from every server",
+    )
+
     args = parser.parse_args()
-    asyncio.run(chat(config_path=args.config, verbose=args.verbose, model=args.model))
+
+    # uvloop (optional, Linux/macOS) speeds up the event loop's pipe/socket I/O and task scheduling
+    try:
+        from uvloop import run as run_event_loop
+    except ImportError:
+        run_event_loop = asyncio.run
+
+    run_event_loop(chat(config_path=args.config, verbose=args.verbose, model=args.model, use_cache=not args.no_cache))
 
 
 if __name__ == "__main__":
@@ -6,16 +6,31 @@ from multiple MCP servers.
 """
 
 import argparse
+import functools
+import importlib.util
 import json
 import os
+import sys
+import threading
+import time
 import traceback
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     List,
+    Optional,
+    Tuple,
+    TypeVar,
     Union,
 )
 
+import httpx
 from dotenv import (
     find_dotenv,
     load_dotenv,
@@ -28,9 +43,11 @@ from examples.support.mcp import (
     process_tool_result_content,
 )
 from mcp.types import (
+    CallToolResult,
     Prompt,
     Resource,
     ResourceTemplate,
+    TextContent,
 )
 from mcp_multi_server import SyncMultiServerClient
 from mcp_multi_server.utils import (
@@ -40,11 +57,364 @@ from mcp_multi_server.utils import (
     print_capabilities_summary,
     substitute_template_variables,
 )
-from openai import OpenAI
+from openai import (
+    DefaultHttpxClient,
+    OpenAI,
+    Stream,
+)
+from openai.types.chat import ChatCompletionChunk
+
+
+try:
+    import orjson
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+try:
+    # libuv-based event loop for the MCP client's background thread (not available on Windows)
+    from uvloop import new_event_loop
+except ImportError:
+    from asyncio import new_event_loop
 
 
 load_dotenv(find_dotenv())
 
+NamedT = TypeVar("NamedT", bound=Union[Prompt, Resource, ResourceTemplate])
+
+# Handler of a "+command: name" input, returning the messages to add to the conversation
+CommandHandler = Callable[[str], List[Dict[str, Any]]]
+
+# Seconds between status checks of a submitted batch
+BATCH_POLL_INTERVAL_SECONDS = 30
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def create_http_client() -> httpx.Client:
+    """Create a pooled keep-alive HTTP client shared by every OpenAI request of the session.
+
+    Connections are kept alive across turns and batch polling; the client is closed with the OpenAI client.
+
+    HTTP/2 is enabled only when the optional ``h2`` package is installed (``pip install httpx[http2]``).
+
+    Returns:
+        HTTP client to pass to OpenAI.
+    """
+    return DefaultHttpxClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
+def warm_up_openai_connection(openai_client: OpenAI) -> None:
+    """Resolve, connect and complete the TLS handshake with the OpenAI API ahead of the first request."""
+    try:
+        openai_client.models.list()
+    except Exception:
+        # Only a latency optimization, any real problem is reported by the first chat request
+        pass
+
+
+def read_query() -> str:
+    """Read the next user query, treating end of input as a request to quit.
+
+    Scripted (non-TTY) input is read straight from sys.stdin, input() is only used for line editing on a terminal.
+    """
+    if sys.stdin.isatty():
+        try:
+            return input("> ")
+        except EOFError:
+            return "exit"
+
+    sys.stdout.write("> ")
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    return line.rstrip("\r\n") if line else "exit"
+
+
+def submit_batch(
+    openai_client: OpenAI,
+    conversations: Dict[str, List[Dict[str, Any]]],
+    request_body: Dict[str, Any],
+    limiter: "RequestLimiter",
+) -> Dict[str, Dict[str, Any]]:
+    """Run one chat completion per conversation through the OpenAI Batch API and wait for the results.
+
+    Args:
+        openai_client: OpenAI client instance.
+        conversations: Message lists keyed by an id unique within the batch.
+        request_body: Chat completion parameters shared by every request (model, tools, ...).
+        limiter: Rate limits every Files and Batches API request has to fit in.
+
+    Returns:
+        Assistant message (as a dict) keyed by conversation id. Requests that failed are omitted.
+
+    Raises:
+        RuntimeError: If the batch does not complete.
+    """
+    lines = [
+        _json_dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {**request_body, "messages": messages},
+            }
+        )
+        for custom_id, messages in conversations.items()
+    ]
+    limiter.wait()
+    batch_file = openai_client.files.create(file=("batch.jsonl", b"\n".join(lines)), purpose="batch")
+    limiter.wait()
+    batch = openai_client.batches.create(
+        input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+    )
+    print(f"Submitted batch {batch.id} with {len(lines)} request(s), waiting for completion...")
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(BATCH_POLL_INTERVAL_SECONDS)
+        limiter.wait()
+        batch = openai_client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+    results = {}
+    limiter.wait()
+    for line in openai_client.files.content(batch.output_file_id).text.splitlines():
+        record = _json_loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") == 200:
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]
+        else:
+            print(f"[Error] Request {record['custom_id']} failed: {record.get('error') or response.get('body')}")
+    return results
+
+
+def run_batch_conversations(
+    client: SyncMultiServerClient,
+    openai_client: OpenAI,
+    conversations: Dict[str, List[Dict[str, Any]]],
+    request_body: Dict[str, Any],
+    limiter: "RequestLimiter",
+    verbose: bool = False,
+) -> None:
+    """Answer independent conversations through the Batch API, resolving tool calls in further batch rounds.
+
+    Args:
+        client: SyncMultiServerClient instance used to execute tool calls.
+        openai_client: OpenAI client instance.
+        conversations: Message lists keyed by conversation id.
+        request_body: Chat completion parameters shared by every request.
+        limiter: Rate limits the Batch API requests have to fit in.
+        verbose: Enable verbose output for tool calls and results.
+    """
+    pending = conversations
+    while pending:
+        replies = submit_batch(openai_client, pending, request_body, limiter)
+        next_round: Dict[str, List[Dict[str, Any]]] = {}
+        calls: List[Tuple[str, str, Dict[str, Any]]] = []
+
+        for custom_id, reply in replies.items():
+            if not reply.get("tool_calls"):
+                print(f"[{custom_id}]\n\033[34m{reply.get('content')}\033[0m\n")
+                continue
+            # Only send back the fields the chat completions API accepts for assistant messages
+            pending[custom_id].append(
+                {"role": "assistant", "content": reply.get("content"), "tool_calls": reply["tool_calls"]}
+            )
+            next_round[custom_id] = pending[custom_id]
+            for tool_call in reply["tool_calls"]:
+                calls.append((custom_id, tool_call["id"], tool_call["function"]))
+
+        # Execute the tool calls of every conversation of this round together
+        tool_calls = [(function["name"], _json_loads(function["arguments"])) for _, _, function in calls]
+        if verbose:
+            for tool_name, tool_args in tool_calls:
+                print(f"****[Tool Call] {tool_name}")
+                print(f"****[Arguments] {_json_pretty(tool_args)}")
+        tool_results = client.call_tools(tool_calls) if tool_calls else []
+
+        for (custom_id, tool_call_id, _), tool_result in zip(calls, tool_results):
+            next_round[custom_id].append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call_id,
+                    "content": process_tool_result_content(tool_result, verbose=verbose),
+                }
+            )
+        pending = next_round
+
+
+class RequestLimiter:
+    """Pace the OpenAI requests by requests and tokens per minute.
+
+    Both rates are token buckets refilled continuously, so bursts up to one minute of budget are allowed.
+    A request estimated above the whole tokens-per-minute budget waits for a full bucket instead of forever.
+    """
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._lock = threading.Lock()
+        self._available_requests = float(rpm or 0)
+        self._available_tokens = float(tpm or 0)
+        self._last_refill = time.monotonic()
+
+    def wait(self, token_estimate: Optional[Callable[[], int]] = None) -> None:
+        """Block until the rate budget allows one more request and reserve it.
+
+        The token estimate is only computed when a tokens-per-minute limit is set.
+        """
+        estimated_tokens = 0
+        if self.tpm and token_estimate is not None:
+            estimated_tokens = min(token_estimate(), self.tpm)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed_minutes = (now - self._last_refill) / 60
+                self._last_refill = now
+
+                wait_seconds = 0.0
+                if self.rpm:
+                    self._available_requests = min(self.rpm, self._available_requests + elapsed_minutes * self.rpm)
+                    if self._available_requests < 1:
+                        wait_seconds = (1 - self._available_requests) * 60 / self.rpm
+                if self.tpm:
+                    self._available_tokens = min(self.tpm, self._available_tokens + elapsed_minutes * self.tpm)
+                    if self._available_tokens < estimated_tokens:
+                        wait_seconds = max(wait_seconds, (estimated_tokens - self._available_tokens) * 60 / self.tpm)
+
+                if not wait_seconds:
+                    self._available_requests -= 1
+                    self._available_tokens -= estimated_tokens
+                    return
+            time.sleep(wait_seconds)
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Roughly estimate the prompt tokens of a conversation (about 4 characters per token)."""
+    return len(_json_dumps(messages)) // 4
+
+
+def tool_error_result(tool_name: str, error: Exception) -> CallToolResult:
+    """Build the error result reported to the model for a tool call that could not be executed."""
+    return CallToolResult(
+        content=[TextContent(type="text", text=f"Error executing tool {tool_name}: {error}")], isError=True
+    )
+
+
+def call_tool_as_result(client: SyncMultiServerClient, tool_name: str, tool_args: Dict[str, Any]) -> CallToolResult:
+    """Execute a tool call, turning any failure into an error result for the model instead of raising it."""
+    try:
+        return client.call_tool(tool_name, tool_args)
+    except Exception as e:
+        return tool_error_result(tool_name, e)
+
+
+def stream_completion(
+    openai_client: OpenAI,
+    messages: List[Dict[str, Any]],
+    request_kwargs: Dict[str, Any],
+    dispatch_tool_call: Callable[[Dict[str, Any]], "Future[CallToolResult]"],
+    limiter: "RequestLimiter",
+) -> Tuple[Dict[str, Any], List["Future[CallToolResult]"]]:
+    """Stream a chat completion, printing text as it arrives and dispatching tool calls as soon as they are complete.
+
+    Tool call fragments arrive in index order, so a tool call is complete once the next one starts
+    or the stream ends.
+
+    Args:
+        openai_client: OpenAI client instance.
+        messages: Conversation history.
+        request_kwargs: Chat completion parameters (model, tools, ...).
+        dispatch_tool_call: Starts the execution of a complete tool call and returns its pending result.
+        limiter: Rate limits the request has to fit in.
+
+    Returns:
+        Tuple of the assistant message (as a dict) and the pending tool results, in tool call order.
+    """
+    text_parts: List[str] = []
+    tool_calls: List[Dict[str, Any]] = []
+    tool_futures: List["Future[CallToolResult]"] = []
+
+    limiter.wait(functools.partial(estimate_tokens, messages))
+    stream: Stream[ChatCompletionChunk] = openai_client.chat.completions.create(  # type: ignore[assignment]
+        messages=messages, stream=True, **request_kwargs  # type: ignore[arg-type]
+    )
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+
+        if delta.content:
+            if not text_parts:
+                sys.stdout.write("\n\033[34m")
+            text_parts.append(delta.content)
+            sys.stdout.write(delta.content)
+            sys.stdout.flush()
+
+        for fragment in delta.tool_calls or []:
+            if fragment.index == len(tool_calls):
+                if tool_calls:
+                    tool_futures.append(dispatch_tool_call(tool_calls[-1]))
+                tool_calls.append({"id": fragment.id, "type": "function", "function": {"name": "", "arguments": ""}})
+            if fragment.function:
+                function = tool_calls[fragment.index]["function"]
+                function["name"] += fragment.function.name or ""
+                function["arguments"] += fragment.function.arguments or ""
+
+    if tool_calls:
+        tool_futures.append(dispatch_tool_call(tool_calls[-1]))
+    if text_parts:
+        sys.stdout.write("\033[0m\n\n")
+        sys.stdout.flush()
+
+    message: Dict[str, Any] = {"role": "assistant", "content": "".join(text_parts) or None}
+    if tool_calls:
+        message["tool_calls"] = tool_calls
+    return message, tool_futures
+
+
+def index_by_name(items: Iterable[NamedT]) -> Dict[str, NamedT]:
+    """Index prompts, resources or templates by exact name, plus lowercased name for case-insensitive lookups.
+
+    Exact names always win; when several names differ only in case, the lowercased alias goes to the first one.
+    """
+    index = {item.name: item for item in items}
+    lowercased: Dict[str, NamedT] = {}
+    for item in index.values():
+        first = lowercased.setdefault(item.name.lower(), item)
+        if first is not item:
+            print(f"Warning: '{first.name}' and '{item.name}' differ only in case, use the exact name to pick one")
+    for name, item in lowercased.items():
+        index.setdefault(name, item)
+    return index
+
+
+def find_by_name(index: Dict[str, NamedT], name: str) -> Optional[NamedT]:
+    """Look up a name built by index_by_name, trying the exact name before the lowercased one."""
+    return index.get(name) or index.get(name.lower())
+
 
 def search_and_instantiate_prompt(
     client: SyncMultiServerClient, prompts: Dict[str, Prompt], name: str
@@ -53,28 +423,27 @@ def search_and_instantiate_prompt(
 
     Args:
         client: SyncMultiServerClient instance.
-        prompts: Dict of prompts available from all MCP servers connected to the client.
-        name: Name of the prompt to retrieve.
+        prompts: Prompts available from all MCP servers connected to the client, indexed by index_by_name.
+        name: Name of the prompt to retrieve (exact, else case-insensitive).
 
     Returns:
         List of OpenAI-formatted messages with proper image/audio support.
 
     """
-    prompt: Union[Prompt, None]
-    if prompts:
-        prompt = prompts.get(name)
-        if prompt:
-            prompt_result = client.get_prompt(name, arguments=get_prompt_arguments(prompt))
-            if prompt_result.messages:
-                openai_messages = []
-                for msg in prompt_result.messages:
-                    # Display content to user (shows images/audio locally)
-                    handle_content_block(msg.content)
-                    # Convert to OpenAI message format (string for text, array for media)
-                    content = convert_mcp_content_to_message(msg.content)
-                    openai_messages.append({"role": msg.role, "content": content})
-                return openai_messages
-    return []
+    prompt = find_by_name(prompts, name) if prompts else None
+    if prompt is None:
+        return []
+
+    prompt_result = client.get_prompt(prompt.name, arguments=get_prompt_arguments(prompt))
+
+    # Display content to user (shows images/audio locally)
+    for msg in prompt_result.messages:
+        handle_content_block(msg.content)
+
+    # Convert to OpenAI message format (string for text, array for media)
+    return [
+        {"role": msg.role, "content": convert_mcp_content_to_message(msg.content)} for msg in prompt_result.messages
+    ]
 
 
 def search_and_instantiate_resource(
@@ -87,15 +456,15 @@ def search_and_instantiate_resource(
 
     Args:
         client: SyncMultiServerClient instance.
-        resources: Dict of resources available from all MCP servers connected to the client.
-        name: Name of the resource to retrieve.
+        resources: Resources available from all MCP servers connected to the client, indexed by index_by_name.
+        name: Name of the resource to retrieve (exact, else case-insensitive).
 
     Returns:
         The resource content.
 
     """
     if resources:
-        resource = resources.get(name)
+        resource = find_by_name(resources, name)
         if resource:
             if not is_template:
                 uri = resource.uri  # type: ignore[union-attr]
@@ -116,155 +485,234 @@ def search_and_instantiate_resource(
     return ""
 
 
-def sync_chat(config_path: str = "examples/mcp_servers.json", verbose: bool = False, model: str = "gpt-5.2") -> None:
+def build_command_handlers(client: SyncMultiServerClient, verbose: bool = False) -> Dict[str, CommandHandler]:
+    """Fetch the prompts, resources and templates of all servers and build the "+command: name" input handlers.
+
+    Args:
+        client: SyncMultiServerClient instance.
+        verbose: Enable verbose output for the retrieved content.
+
+    Returns:
+        The +prompt, +resource and +template handlers, keyed by command.
+    """
+    # Fetch all prompts and resources from all servers
+    all_prompts = index_by_name(client.list_prompts().prompts)
+    all_resources = index_by_name(client.list_resources().resources)
+    all_resource_templates = index_by_name(client.list_resource_templates().resourceTemplates)
+
+    def add_prompt(prompt: str) -> List[Dict[str, Any]]:
+        prompt_messages = search_and_instantiate_prompt(client, all_prompts, prompt)
+        if not prompt_messages:
+            print(f"Prompt '{prompt}' not found.")
+        elif verbose:
+            print("****Retrieved prompt content (displayed above)\n")
+        # All prompt messages are added to the conversation (supports multiple messages)
+        return prompt_messages
+
+    def add_resource(resource_name: str) -> List[Dict[str, Any]]:
+        resource = search_and_instantiate_resource(client, all_resources, resource_name)  # type: ignore[arg-type]
+        if not resource:
+            print(f"Resource '{resource_name}' not found.")
+            return []
+        if verbose:
+            print("****Retrieved resource content (displayed above)\n")
+        return [{"role": "user", "content": resource}]
+
+    def add_template(template_name: str) -> List[Dict[str, Any]]:
+        resource = search_and_instantiate_resource(
+            client, all_resource_templates, template_name, is_template=True  # type: ignore[arg-type]
+        )
+        if not resource:
+            print(f"Resource Template '{template_name}' not found.")
+            return []
+        if verbose:
+            print("****Instantiated template content (displayed above)\n")
+        return [{"role": "user", "content": resource}]
+
+    # Input commands, keyed by the text before the first ":"
+    return {
+        "+prompt": add_prompt,
+        "+resource": add_resource,
+        "+template": add_template,
+    }
+
+
+def collect_batch_conversations(command_handlers: Dict[str, CommandHandler]) -> Dict[str, List[Dict[str, Any]]]:
+    """Read scripted queries until exit, turning each one into an independent conversation for the Batch API.
+
+    Args:
+        command_handlers: Handlers of the "+command: name" inputs, keyed by command. The messages they
+            return seed the conversation of the next query.
+
+    Returns:
+        Message lists keyed by conversation id, in input order. Trailing command messages without a
+        query form a last conversation of their own.
+    """
+    conversations: Dict[str, List[Dict[str, Any]]] = {}
+    messages: List[Dict[str, Any]] = []
+
+    query = read_query()
+    while query.lower() not in ("exit", "quit"):
+        command, separator, argument = query.partition(":")
+        if separator and command in command_handlers:
+            messages.extend(command_handlers[command](argument.strip()))
+        else:
+            messages.append({"role": "user", "content": query})
+            conversations[f"query-{len(conversations) + 1}"] = messages
+            messages = []
+        query = read_query()
+
+    if messages:
+        conversations[f"query-{len(conversations) + 1}"] = messages
+    return conversations
+
+
+def sync_chat(
+    config_path: str = "examples/mcp_servers.json",
+    verbose: bool = False,
+    model: str = "gpt-5.2",
+    batch_mode: bool = False,
+    rpm: Optional[int] = None,
+    tpm: Optional[int] = None,
+) -> None:
     """Run the multi-server chat interface.
 
     Args:
         config_path: Path to the server configuration file.
         verbose: Enable verbose output for tool calls and results.
         model: OpenAI model to use for chat completions.
+        batch_mode: When input is scripted (stdin is not a TTY), answer every query as an independent
+            conversation through the OpenAI Batch API instead of one request per turn. Messages added
+            with +prompt/+resource/+template seed the conversation of the next query.
+        rpm: OpenAI requests per minute allowed (None for no limit).
+        tpm: Estimated OpenAI tokens per minute allowed (None for no limit).
     """
 
     assert os.getenv("OPENAI_API_KEY"), "Error: OPENAI_API_KEY not found in environment"
 
     configure_logging(level="INFO" if verbose else "WARNING")
 
+    # Open the OpenAI connection in the background while the MCP servers start
+    openai_client = OpenAI(http_client=create_http_client())
+    threading.Thread(target=warm_up_openai_connection, args=(openai_client,), daemon=True).start()
+
     try:
-        with SyncMultiServerClient.from_config(config_path) as client:
+        with (
+            openai_client,
+            SyncMultiServerClient.from_config(config_path, loop_factory=new_event_loop) as client,
+            ThreadPoolExecutor() as executor,
+        ):
 
             client.set_logging_level(level="info" if verbose else "warning")
 
             # Print capabilities summary
             print_capabilities_summary(client)
 
-            # Fetch all prompts and resources from all servers
-            all_prompts = {prompt.name: prompt for prompt in client.list_prompts().prompts}
-            all_resources = {resource.name: resource for resource in client.list_resources().resources}
-            all_resource_templates = {
-                template.name: template for template in client.list_resource_templates().resourceTemplates
-            }
-
             # Get tools from all servers and convert them to OpenAI format
             tools_result = client.list_tools().tools or []
             openai_tools = mcp_tools_to_openai_format(tools_result)
 
-            # Initialize OpenAI client
-            openai_client = OpenAI()
+            # Request parameters are the same for every completion, build them once
+            request_kwargs: Dict[str, Any] = (
+                {"model": model, "tools": openai_tools, "tool_choice": "auto"} if openai_tools else {"model": model}
+            )
+
+            # Initialize the OpenAI request limits
+            limiter = RequestLimiter(rpm=rpm, tpm=tpm)
+
+            # Handlers of the +prompt, +resource and +template inputs
+            command_handlers = build_command_handlers(client, verbose=verbose)
+
+            def dispatch_tool_call(tool_call: Dict[str, Any]) -> "Future[CallToolResult]":
+                # Execute the tool via the appropriate server without waiting for the result
+                tool_name = tool_call["function"]["name"]
+                try:
+                    tool_args = _json_loads(tool_call["function"]["arguments"] or "{}")
+                except ValueError as e:
+                    # Malformed arguments streamed by the model are reported back to it as a tool error
+                    failed: "Future[CallToolResult]" = Future()
+                    failed.set_result(tool_error_result(tool_name, e))
+                    return failed
+                if verbose:
+                    print(f"****[Tool Call] {tool_name}")
+                    print(f"****[Arguments] {_json_pretty(tool_args)}")
+                return executor.submit(call_tool_as_result, client, tool_name, tool_args)
+
+            # Every completion of the session shares the client, parameters, tool dispatch and limits
+            complete = functools.partial(
+                stream_completion,
+                openai_client,
+                request_kwargs=request_kwargs,
+                dispatch_tool_call=dispatch_tool_call,
+                limiter=limiter,
+            )
+
+            # Batching only makes sense for scripted input, interactive turns need immediate answers
+            batching = batch_mode and not sys.stdin.isatty()
+            if batch_mode and not batching:
+                print("Batch mode requires scripted input on stdin, running interactively")
 
-            # Chat loop
-            messages: List[Dict[str, Any]] = []
             print("Sync-Multi-Server MCP Chat Client")
             print("Type 'exit' or 'quit' to end the conversation\n")
 
-            query = input("> ")
-
-            while query.lower() not in ("exit", "quit"):
+            if batching:
+                batch_conversations = collect_batch_conversations(command_handlers)
+                run_batch_conversations(
+                    client, openai_client, batch_conversations, request_kwargs, limiter, verbose=verbose
+                )
+                return
 
-                # Add user message, prompt or resource
-                if query.startswith("+prompt:"):
-                    prompt = query[len("+prompt:") :].strip()
-                    prompt_messages = search_and_instantiate_prompt(client, all_prompts, prompt)
-                    if prompt_messages:
-                        if verbose:
-                            print("****Retrieved prompt content (displayed above)\n")
-                        # Add all prompt messages to conversation (supports multiple messages)
-                        messages.extend(prompt_messages)
-                    else:
-                        print(f"Prompt '{prompt}' not found.")
-                    query = input("> ")
-                    continue
+            # Chat loop
+            messages: List[Dict[str, Any]] = []
+            query = read_query()
 
-                if query.startswith("+resource:"):
-                    resource_name = query[len("+resource:") :].strip()
-                    resource = search_and_instantiate_resource(client, all_resources, resource_name)  # type: ignore[arg-type]
-                    if resource:
-                        if verbose:
-                            print("****Retrieved resource content (displayed above)\n")
-                        messages.append({"role": "user", "content": resource})
-                    else:
-                        print(f"Resource '{resource_name}' not found.")
-                    query = input("> ")
-                    continue
+            while query.lower() not in ("exit", "quit"):
 
-                if query.startswith("+template:"):
-                    template_name = query[len("+template:") :].strip()
-                    resource = search_and_instantiate_resource(
-                        client, all_resource_templates, template_name, is_template=True  # type: ignore[arg-type]
-                    )
-                    if resource:
-                        if verbose:
-                            print("****Instantiated template content (displayed above)\n")
-                        messages.append({"role": "user", "content": resource})
-                    else:
-                        print(f"Resource Template '{template_name}' not found.")
-                    query = input("> ")
+                # Add prompt or resource messages for "+command: name" input
+                command, separator, argument = query.partition(":")
+                if separator and command in command_handlers:
+                    messages.extend(command_handlers[command](argument.strip()))
+                    query = read_query()
                     continue
 
                 messages.append({"role": "user", "content": query})
 
                 # Make OpenAI LLM call to answer the user query
-                response = openai_client.chat.completions.create(  # type: ignore[call-overload]
-                    model=model,
-                    messages=messages,
-                    tools=openai_tools if openai_tools else None,
-                    tool_choice="auto" if openai_tools else None,
-                ).choices[0]
+                # (text is printed as it streams, tool calls start as soon as their arguments are complete)
+                assistant_message, tool_futures = complete(messages)
 
                 # Handle tool calls
-                while response.finish_reason == "tool_calls":
-                    messages.append(response.message)
-
-                    for tool_call in response.message.tool_calls:
-                        tool_name = tool_call.function.name
-                        tool_args = json.loads(tool_call.function.arguments)
-
-                        if verbose:
-                            print(f"****[Tool Call] {tool_name}")
-                            print(f"****[Arguments] {json.dumps(tool_args, indent=2)}")
-
-                        # Execute tool via appropriate server
-                        try:
-                            tool_result = client.call_tool(tool_name, tool_args)
-
-                            # Process tool result content (handles images, audio, text, etc.)
-                            # Returns string content (images are converted to text descriptions)
-                            result_content = process_tool_result_content(tool_result, verbose=verbose)
-
-                            # Add tool response to conversation
-                            # Tool messages must always have string content (not arrays)
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "content": result_content,
-                                }
-                            )
-
-                        except Exception as e:
-                            error_msg = f"Error executing tool {tool_name}: {str(e)}"
-                            print(f"[Error] {error_msg}\n")
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "content": error_msg,
-                                }
-                            )
+                while assistant_message.get("tool_calls"):
+                    messages.append(assistant_message)
+
+                    for tool_call, tool_future in zip(assistant_message["tool_calls"], tool_futures):
+                        # Failures come back as error results
+                        tool_result = tool_future.result()
+
+                        # Process tool result content (handles images, audio, text, etc.)
+                        # Returns string content (images are converted to text descriptions)
+                        result_content = process_tool_result_content(tool_result, verbose=verbose)
+                        if tool_result.isError and not verbose:
+                            print(f"[Error] {result_content}\n")
+
+                        # Add tool response to conversation
+                        # Tool messages must always have string content (not arrays)
+                        messages.append(
+                            {
+                                "role": "tool",
+                                "tool_call_id": tool_call["id"],
+                                "content": result_content,
+                            }
+                        )
 
                     # Get next response from LLM with tool results
-                    response = openai_client.chat.completions.create(  # type: ignore[call-overload]
-                        model=model,
-                        messages=messages,
-                        tools=openai_tools if openai_tools else None,
-                        tool_choice="auto" if openai_tools else None,
-                    ).choices[0]
+                    assistant_message, tool_futures = complete(messages)
 
-                # Print assistant response
-                print(f"\n\033[34m{response.message.content}\033[0m\n")
-                messages.append(response.message)
+                # Assistant response was already printed while streaming
+                messages.append(assistant_message)
 
                 # Get next user input
-                query = input("> ")
+                query = read_query()
 
     except FileNotFoundError as e:
         print(f"Configuration error: {e}")
@@ -284,6 +732,8 @@ Examples:
   %(prog)s --config my_servers.json
   %(prog)s --model gpt-4-turbo --verbose
   %(prog)s -c custom.json -m gpt-3.5-turbo -v
+  %(prog)s --batch < queries.txt
+  %(prog)s --rpm 60 --tpm 90000
         """,
     )
 
@@ -308,8 +758,35 @@ Examples:
         help="OpenAI model to use (default: %(default)s)",
     )
 
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Answer scripted queries read from stdin through the OpenAI Batch API (lower cost, delayed results)",
+    )
+
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=None,
+        help="OpenAI requests per minute allowed (default: no limit)",
+    )
+
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=None,
+        help="Estimated OpenAI tokens per minute allowed (default: no limit)",
+    )
+
     args = parser.parse_args()
-    sync_chat(config_path=args.config, verbose=args.verbose, model=args.model)
+    sync_chat(
+        config_path=args.config,
+        verbose=args.verbose,
+        model=args.model,
+        batch_mode=args.batch,
+        rpm=args.rpm,
+        tpm=args.tpm,
+    )
 
 
 if __name__ == "__main__":
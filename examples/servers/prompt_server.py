@@ -1,6 +1,5 @@
-import base64
-import mimetypes
 from typing import List
+from urllib.parse import urlsplit
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.prompts.base import (
@@ -21,19 +20,37 @@ from mcp_multi_server.utils import configure_logging
 
 try:
     from ..support.media_handler import (
+        encode_file_base64,
         get_audio,
         get_image,
+        guess_mime_type,
     )
 except ImportError:
     from examples.support.media_handler import (
+        encode_file_base64,
         get_audio,
         get_image,
+        guess_mime_type,
     )
 
 
 # Create server
 mcp = FastMCP("Inventory Prompt Server")
 
+# Static prompt text, built once at import
+INVENTORY_CHECK_PROMPT = """
+    Consult the inventory database and list every product that needs restocking, providing its name, SKU,
+    on-hand quantity, and supplier.
+    """
+
+CATEGORY_PROMOTION_TEMPLATE = """
+    Find all inventory items for products in the {category} category.
+    Update the prices of all of the above inventory item by reducing them by a {discount_percentage}%.
+    List the updated products names and their new prices.
+    """
+
+RESTOCK_BRIEF_ASSISTANT_MESSAGE = AssistantMessage(content="Only show the information requested in the next message.")
+
 
 @mcp._mcp_server.set_logging_level()
 async def set_logging_level(level: str) -> None:
@@ -47,13 +64,7 @@ def inventory_check() -> str:
     Args:
         category: the product category to check
     """
-
-    prompt = """
-    Consult the inventory database and list every product that needs restocking, providing its name, SKU,
-    on-hand quantity, and supplier.
-    """
-
-    return prompt
+    return INVENTORY_CHECK_PROMPT
 
 
 @mcp.prompt()
@@ -65,17 +76,7 @@ def category_promotion(category: str, discount_percentage: str) -> str:
         category: the product category to promote
         discount_percentage: the discount percentage to offer
     """
-
-    prompt = """
-    Find all inventory items for products in the {category} category.
-    Update the prices of all of the above inventory item by reducing them by a {discount_percentage}%.
-    List the updated products names and their new prices.
-    """
-
-    return prompt.format(
-        category=category,
-        discount_percentage=discount_percentage,
-    )
+    return CATEGORY_PROMOTION_TEMPLATE.format_map({"category": category, "discount_percentage": discount_percentage})
 
 
 @mcp.prompt()
@@ -88,7 +89,7 @@ def inventory_restock_brief(category: str, min_stock: int) -> List[Message]:
     """
     return [
         UserMessage(content=f"Consult the inventory database and list every product in the {category} category."),
-        AssistantMessage(content="Only show the information requested in the next message."),
+        RESTOCK_BRIEF_ASSISTANT_MESSAGE,
         UserMessage(
             content=TextContent(
                 type="text",
@@ -119,10 +120,8 @@ def load_audio(file_path: str) -> List[Message]:
 @mcp.prompt()
 def load_file(file_path: str) -> List[Message]:
     """Loads a file and returns its contents as an embedded resource."""
-    with open(file_path, "rb") as file:
-        file_data = file.read()
-    encoded = base64.b64encode(file_data).decode("utf-8")
-    mime_type, _ = mimetypes.guess_type(file_path)
+    encoded = encode_file_base64(file_path)
+    mime_type = guess_mime_type(file_path)
     return [
         UserMessage(
             content=EmbeddedResource(
@@ -130,7 +129,7 @@ def load_file(file_path: str) -> List[Message]:
                 resource=BlobResourceContents(
                     uri=f"file://{file_path}",  # type: ignore[arg-type]
                     blob=encoded,
-                    mimeType=mime_type or "application/octet-stream",
+                    mimeType=mime_type,
                 ),
             )
         )
@@ -140,14 +139,14 @@ def load_file(file_path: str) -> List[Message]:
 @mcp.prompt()
 def load_uri_content(content_uri: str) -> List[Message]:
     """Sends a content URI as an resource link."""
-    mime_type, _ = mimetypes.guess_type(content_uri)
+    mime_type = guess_mime_type(urlsplit(content_uri).path)
     return [
         UserMessage(
             content=ResourceLink(
                 type="resource_link",
                 name=content_uri.split("/")[-1],
                 uri=content_uri,  # type: ignore[arg-type]
-                mimeType=mime_type or "application/octet-stream",
+                mimeType=mime_type,
             )
         )
     ]
@@ -1,15 +1,27 @@
-import base64
-import mimetypes
+import functools
 from datetime import datetime
-from decimal import Decimal
+from decimal import (
+    Decimal,
+    InvalidOperation,
+)
 from typing import (
+    Annotated,
+    Any,
+    Callable,
     Dict,
     List,
     Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
     Union,
 )
+from urllib.parse import urlsplit
 from uuid import UUID
 
+from pydantic import BaseModel
+
+import pydantic_core
 from mcp.server.fastmcp import FastMCP
 from mcp.types import (
     AudioContent,
@@ -18,6 +30,7 @@ from mcp.types import (
     EmbeddedResource,
     ImageContent,
     ResourceLink,
+    TextContent,
 )
 from mcp_multi_server.utils import configure_logging
 
@@ -35,11 +48,9 @@ try:
         SupplierProduct,
         db,
     )
-    from ..support.media_handler import (
-        get_audio,
-        get_image,
-    )
-    from .resource_server import (
+    from ..support.inventory_service import (
+        clear_cache,
+        get_cache_stats,
         get_category_statistics,
         get_database_schema,
         get_inventory_overview,
@@ -54,8 +65,28 @@ try:
         list_suppliers,
         search_inventory,
     )
+    from ..support.media_handler import (
+        encode_file_base64,
+        get_audio,
+        get_image,
+        guess_mime_type,
+    )
 except ImportError:
-    from examples.servers.resource_server import (
+    from examples.support.inventory_db import (
+        CategoryStatistics,
+        DatabaseSchema,
+        EnrichedInventoryItem,
+        InventoryItem,
+        InventoryOverview,
+        ItemStatus,
+        Product,
+        Supplier,
+        SupplierProduct,
+        db,
+    )
+    from examples.support.inventory_service import (
+        clear_cache,
+        get_cache_stats,
         get_category_statistics,
         get_database_schema,
         get_inventory_overview,
@@ -70,26 +101,102 @@ except ImportError:
         list_suppliers,
         search_inventory,
     )
-    from examples.support.inventory_db import (
-        CategoryStatistics,
-        DatabaseSchema,
-        EnrichedInventoryItem,
-        InventoryItem,
-        InventoryOverview,
-        ItemStatus,
-        Product,
-        Supplier,
-        SupplierProduct,
-        db,
-    )
     from examples.support.media_handler import (
+        encode_file_base64,
         get_audio,
         get_image,
+        guess_mime_type,
     )
 
+try:
+    # C implementation of ISO 8601 parsing, several times faster than datetime.fromisoformat
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
+# Bound once at import for the most frequently called tools, saving an attribute lookup and a bound-method
+# allocation per call. db is the module-level database singleton and is never rebound.
+_update_product = db.update_product
+_update_supplier_product = db.update_supplier_product
+_update_inventory_item = db.update_inventory_item
+_update_inventory_items = db.update_inventory_items
+_get_supplier_products_by_supplier_id = db.get_supplier_products_by_supplier_id
+
 # Create server
 mcp = FastMCP("Inventory Tool Server")
 
+T = TypeVar("T")
+
+
+def invalidates_resource_cache(func: Callable[..., T]) -> Callable[..., T]:
+    """Invalidate the cached read-only results once a mutation tool has run, with a single cache epoch bump."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Also invalidated on failure, as cascade deletes may have removed data before raising
+            clear_cache()
+
+    return wrapper
+
+
+# Agents tend to repeat the same prices and IDs across calls, and both result types are immutable.
+# typed=True keeps 2 and 2.0 apart, since they produce different Decimals ("2" and "2.0").
+@functools.lru_cache(maxsize=4096, typed=True)
+def _to_decimal(value: Union[str, float]) -> Decimal:
+    if not isinstance(value, str):
+        return Decimal(str(value))
+    # Strings are parsed as given, so no digits are lost to a float on the way in
+    try:
+        decimal_value = Decimal(value)
+    except InvalidOperation:
+        decimal_value = Decimal("NaN")
+    if not decimal_value.is_finite():
+        raise ValueError(f"Invalid decimal number '{value}'")
+    return decimal_value
+
+
+def _optional_decimal(value: Union[str, float], allow_zero: bool = False) -> Optional[Decimal]:
+    """Parse an optional update value, where "" or a value below the allowed range means "keep the current value"."""
+    if value == "":
+        return None
+    decimal_value = _to_decimal(value)
+    return decimal_value if decimal_value > 0 or (allow_zero and decimal_value == 0) else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_uuid(value: str) -> UUID:
+    return UUID(value)
+
+
+# A plain dict hit instead of the Enum constructor's lookup chain
+_STATUS_LOOKUP = {status.value: status for status in ItemStatus}
+
+
+def _to_status(value: str) -> ItemStatus:
+    status = _STATUS_LOOKUP.get(value)
+    if status is None:
+        raise ValueError(f"Invalid status '{value}'. Valid statuses: {', '.join(_STATUS_LOOKUP)}")
+    return status
+
+
+def _list_result(items: Sequence[BaseModel]) -> CallToolResult:
+    """
+    Build the result of a list tool with the same content and structured output FastMCP would produce, encoded in
+    one pass by pydantic-core. Tools annotated as Annotated[CallToolResult, List[X]] keep List[X] as their output
+    schema, and FastMCP validates the structured output against it with pydantic instead of the low-level server
+    re-validating it in pure Python with jsonschema, which dominates the response time of large lists.
+    """
+    return CallToolResult(
+        content=[
+            TextContent(type="text", text=pydantic_core.to_json(item, fallback=str, indent=2).decode())
+            for item in items
+        ],
+        structuredContent={"result": pydantic_core.to_jsonable_python(items, fallback=str, by_alias=True)},
+    )
+
 
 @mcp._mcp_server.set_logging_level()
 async def set_logging_level(level: str) -> None:
@@ -101,7 +208,90 @@ async def set_logging_level(level: str) -> None:
 # ==============================================================================
 
 
+def _new_supplier(
+    supplier_id: str,
+    name: str,
+    contact_email: Optional[str] = None,
+    contact_phone: Optional[str] = None,
+    address: Optional[str] = None,
+) -> Supplier:
+    return Supplier(
+        id=supplier_id,
+        name=name,
+        contact_email=contact_email,
+        contact_phone=contact_phone,
+        address=address,
+    )
+
+
+def _new_product(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    name: str,
+    category: str,
+    description: Optional[str] = None,
+    sku: Optional[str] = None,
+    barcode: Optional[str] = None,
+    weight: float = 0.0,
+    dimensions: Optional[str] = None,
+) -> Product:
+    return Product(
+        name=name,
+        category=category,
+        description=description,
+        sku=sku,
+        barcode=barcode,
+        weight=_to_decimal(weight) if weight > 0 else None,
+        dimensions=dimensions,
+    )
+
+
+def _new_supplier_product(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    product_id: str,
+    supplier_id: str,
+    supplier_part_number: Optional[str] = None,
+    cost: float = -1.0,
+    lead_time_days: int = -1,
+    minimum_order_quantity: int = 0,
+    is_primary_supplier: bool = False,
+) -> SupplierProduct:
+    return SupplierProduct(
+        product_id=_to_uuid(product_id),
+        supplier_id=supplier_id,
+        supplier_part_number=supplier_part_number,
+        cost=_to_decimal(cost) if cost >= 0 else None,
+        lead_time_days=lead_time_days if lead_time_days >= 0 else None,
+        minimum_order_quantity=minimum_order_quantity if minimum_order_quantity >= 1 else None,
+        is_primary_supplier=is_primary_supplier,
+    )
+
+
+def _new_inventory_item(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    product_id: str,
+    price: float,
+    location_id: Optional[str] = None,
+    status: str = "active",
+    quantity_on_hand: int = 0,
+    quantity_reserved: int = 0,
+    quantity_allocated: int = 0,
+    reorder_point: int = 10,
+    max_stock: int = 1000,
+) -> InventoryItem:
+    return InventoryItem(
+        product_id=_to_uuid(product_id),
+        price=_to_decimal(price),
+        location_id=location_id,
+        status=_to_status(status),
+        quantity_on_hand=quantity_on_hand,
+        quantity_reserved=quantity_reserved,
+        quantity_allocated=quantity_allocated,
+        reorder_point=reorder_point,
+        max_stock=max_stock,
+        last_restocked_at=None,
+        last_counted_at=None,
+    )
+
+
 @mcp.tool(name="add_category")
+@invalidates_resource_cache
 def add_category_tool(name: str, description: str = "") -> Dict[str, str]:
     """Add a new product category to the inventory database.
 
@@ -125,6 +315,7 @@ def add_category_tool(name: str, description: str = "") -> Dict[str, str]:
 
 
 @mcp.tool(name="add_supplier")
+@invalidates_resource_cache
 def add_supplier_tool(
     supplier_id: str,
     name: str,
@@ -152,17 +343,11 @@ def add_supplier_tool(
     Example:
         add_supplier("SUP001", "Acme Corp", "contact@acme.com", "+1-555-0100", "123 Main St")
     """
-    supplier = Supplier(
-        id=supplier_id,
-        name=name,
-        contact_email=contact_email,
-        contact_phone=contact_phone,
-        address=address,
-    )
-    return db.add_supplier(supplier)
+    return db.add_supplier(_new_supplier(supplier_id, name, contact_email, contact_phone, address))
 
 
 @mcp.tool(name="add_product")
+@invalidates_resource_cache
 def add_product_tool(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     name: str,
     category: str,
@@ -198,20 +383,11 @@ def add_product_tool(  # pylint: disable=too-many-arguments,too-many-positional-
     Note:
         Use list_categories tool to see valid category names before adding products.
     """
-
-    product = Product(
-        name=name,
-        category=category,
-        description=description,
-        sku=sku,
-        barcode=barcode,
-        weight=Decimal(str(weight)) if weight > 0 else None,
-        dimensions=dimensions,
-    )
-    return db.add_product(product)
+    return db.add_product(_new_product(name, category, description, sku, barcode, weight, dimensions))
 
 
 @mcp.tool(name="add_supplier_product")
+@invalidates_resource_cache
 def add_supplier_product_tool(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     product_id: str,
     supplier_id: str,
@@ -251,20 +427,21 @@ def add_supplier_product_tool(  # pylint: disable=too-many-arguments,too-many-po
         - Use list_suppliers to get valid supplier IDs
         - Product UUIDs are returned when adding products via add_product tool
     """
-
-    supplier_product = SupplierProduct(
-        product_id=UUID(product_id),
-        supplier_id=supplier_id,
-        supplier_part_number=supplier_part_number,
-        cost=Decimal(str(cost)) if cost >= 0 else None,
-        lead_time_days=lead_time_days if lead_time_days >= 0 else None,
-        minimum_order_quantity=minimum_order_quantity if minimum_order_quantity >= 1 else None,
-        is_primary_supplier=is_primary_supplier,
+    return db.add_supplier_product(
+        _new_supplier_product(
+            product_id,
+            supplier_id,
+            supplier_part_number,
+            cost,
+            lead_time_days,
+            minimum_order_quantity,
+            is_primary_supplier,
+        )
     )
-    return db.add_supplier_product(supplier_product)
 
 
 @mcp.tool(name="add_inventory_item")
+@invalidates_resource_cache
 def add_inventory_item_tool(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     product_id: str,
     price: float,
@@ -310,21 +487,145 @@ def add_inventory_item_tool(  # pylint: disable=too-many-arguments,too-many-posi
         - Valid status values: 'active', 'inactive', 'out_of_stock', 'discontinued'
         - This supports Many-to-One: multiple items can track the same product at different locations
     """
+    return db.add_inventory_item(
+        _new_inventory_item(
+            product_id,
+            price,
+            location_id,
+            status,
+            quantity_on_hand,
+            quantity_reserved,
+            quantity_allocated,
+            reorder_point,
+            max_stock,
+        )
+    )
 
-    inventory_item = InventoryItem(
-        product_id=UUID(product_id),
-        price=Decimal(str(price)),
-        location_id=location_id,
-        status=ItemStatus(status),
-        quantity_on_hand=quantity_on_hand,
-        quantity_reserved=quantity_reserved,
-        quantity_allocated=quantity_allocated,
-        reorder_point=reorder_point,
-        max_stock=max_stock,
-        last_restocked_at=None,
-        last_counted_at=None,
+
+@mcp.tool(name="add_products_bulk")
+@invalidates_resource_cache
+def add_products_bulk_tool(products: List[Dict[str, Any]]) -> List[Product]:
+    """Add several products to the inventory database in a single batch.
+
+    Each entry takes the same fields as the add_product tool. All entries are validated
+    before any is inserted, so one invalid entry leaves the database unchanged.
+
+    Parameters:
+        products (list): Product entries, each a dict with keys:
+            - name (str): Product name (required, unique, 1-100 chars)
+            - category (str): Product category (required, must exist in database)
+            - description, sku, barcode, dimensions (str): Optional product details
+            - weight (float): Weight in kilograms (optional, must be > 0 if provided)
+
+    Returns:
+        List of Product objects with auto-generated UUIDs and timestamps, in the given order
+
+    Raises:
+        ValueError if a category doesn't exist, or a name or SKU exists or repeats within the batch
+
+    Example:
+        add_products_bulk([
+            {"name": "Laptop Pro 15", "category": "electronics", "sku": "LAP-001", "weight": 2.5},
+            {"name": "Laptop Pro 13", "category": "electronics", "sku": "LAP-002", "weight": 1.9},
+        ])
+    """
+    return db.add_products([_new_product(**entry) for entry in products])
+
+
+@mcp.tool(name="add_inventory_items_bulk")
+@invalidates_resource_cache
+def add_inventory_items_bulk_tool(inventory_items: List[Dict[str, Any]]) -> List[InventoryItem]:
+    """Add several inventory items in a single batch.
+
+    Each entry takes the same fields as the add_inventory_item tool. All entries are validated
+    before any is inserted, so one invalid entry leaves the database unchanged.
+
+    Parameters:
+        inventory_items (list): Inventory item entries, each a dict with keys:
+            - product_id (str): Product UUID (required, must exist)
+            - price (float): Current selling price (required, must be > 0)
+            - location_id (str): Storage location identifier (optional)
+            - status (str): 'active', 'inactive', 'out_of_stock' or 'discontinued' (optional)
+            - quantity_on_hand, quantity_reserved, quantity_allocated, reorder_point, max_stock (int): Optional
+
+    Returns:
+        List of InventoryItem objects with auto-generated UUIDs and timestamps, in the given order
+
+    Raises:
+        ValueError if a product_id doesn't exist or constraints are violated
+
+    Example:
+        add_inventory_items_bulk([
+            {"product_id": "550e8400-e29b-41d4-a716-446655440000", "price": 1299.99, "location_id": "WH-A"},
+            {"product_id": "550e8400-e29b-41d4-a716-446655440000", "price": 1299.99, "location_id": "WH-B"},
+        ])
+    """
+    return db.add_inventory_items([_new_inventory_item(**entry) for entry in inventory_items])
+
+
+def _resolve_product_name(entry: Dict[str, Any], product_ids: Dict[str, str]) -> Dict[str, Any]:
+    """Replace the product_name key of a bulk entry with the product_id of the product of that name in the batch."""
+    if "product_name" not in entry:
+        return entry
+    resolved = dict(entry)
+    product_name = resolved.pop("product_name")
+    if product_name not in product_ids:
+        raise ValueError(f"Product '{product_name}' is not part of this batch; use product_id for existing products")
+    resolved["product_id"] = product_ids[product_name]
+    return resolved
+
+
+@mcp.tool(name="bulk_insert")
+@invalidates_resource_cache
+def bulk_insert_tool(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    categories: Optional[List[Dict[str, str]]] = None,
+    suppliers: Optional[List[Dict[str, Any]]] = None,
+    products: Optional[List[Dict[str, Any]]] = None,
+    supplier_products: Optional[List[Dict[str, Any]]] = None,
+    inventory_items: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, List[Any]]:
+    """Add categories, suppliers, products, supplier-products and inventory items in a single call.
+
+    Use this instead of a sequence of add_* calls when creating related entities together, e.g. a new
+    supplier with its products and their stock. Each entry takes the same fields as the matching add_* tool.
+    Supplier-product and inventory item entries may give the product_name of a product in the same call
+    instead of its product_id. All entries are validated before any is inserted, so one invalid entry
+    leaves the database unchanged.
+
+    Parameters:
+        categories (list): Category entries, each a dict with 'name' and optional 'description'
+        suppliers (list): Supplier entries, with the fields of add_supplier (supplier_id, name, ...)
+        products (list): Product entries, with the fields of add_product (name, category, ...)
+        supplier_products (list): Supplier-product entries, with the fields of add_supplier_product
+        inventory_items (list): Inventory item entries, with the fields of add_inventory_item
+
+    Returns:
+        Dict with the added categories, suppliers, products, supplier_products and inventory_items
+
+    Raises:
+        ValueError if an entity already exists, repeats within the call, or references one that doesn't exist
+
+    Example:
+        bulk_insert(
+            suppliers=[{"supplier_id": "SUP010", "name": "Acme Corp"}],
+            products=[{"name": "Laptop Pro 15", "category": "electronics", "sku": "LAP-001"}],
+            supplier_products=[{"product_name": "Laptop Pro 15", "supplier_id": "SUP010", "cost": 899.99}],
+            inventory_items=[{"product_name": "Laptop Pro 15", "price": 1299.99, "quantity_on_hand": 25}],
+        )
+    """
+    new_products = [_new_product(**entry) for entry in products or []]
+    product_ids = {product.name: str(product.id) for product in new_products}
+    return db.add_bulk(
+        categories=categories,
+        suppliers=[_new_supplier(**entry) for entry in suppliers or []],
+        products=new_products,
+        supplier_products=[
+            _new_supplier_product(**_resolve_product_name(entry, product_ids)) for entry in supplier_products or []
+        ],
+        inventory_items=[
+            _new_inventory_item(**_resolve_product_name(entry, product_ids)) for entry in inventory_items or []
+        ],
     )
-    return db.add_inventory_item(inventory_item)
 
 
 # ==============================================================================
@@ -382,7 +683,7 @@ def get_database_schema_tool() -> DatabaseSchema:
 
 
 @mcp.tool(name="list_categories")
-def list_categories_tool() -> List[Dict[str, str]]:
+def list_categories_tool() -> Tuple[Dict[str, str], ...]:
     """Get the list of all valid product categories with names and descriptions.
 
     Returns all categories that can be assigned to products. Use this before
@@ -392,7 +693,7 @@ def list_categories_tool() -> List[Dict[str, str]]:
         None
 
     Returns:
-        List of dictionaries, each containing:
+        List of dictionaries sorted by name, each containing:
         - name: Category name (lowercase string)
         - description: Category description (string, may be empty)
 
@@ -435,7 +736,7 @@ def get_category_statistics_tool(category: str) -> CategoryStatistics:
 
 
 @mcp.tool(name="products_by_category")
-def get_products_by_category_tool(category: str) -> Union[List[Product], str]:
+def get_products_by_category_tool(category: str) -> Annotated[CallToolResult, List[Product]]:
     """Get all products in a specific category with complete product information.
 
     Returns detailed product records for all products assigned to the specified category.
@@ -456,7 +757,8 @@ def get_products_by_category_tool(category: str) -> Union[List[Product], str]:
         - created_at: Creation timestamp
         - updated_at: Last update timestamp
 
-        Returns error message string if category doesn't exist.
+    Raises:
+        NotFoundError if the category doesn't exist or has no products (reported as a tool error)
 
     Example:
         products = products_by_category("electronics")
@@ -465,11 +767,11 @@ def get_products_by_category_tool(category: str) -> Union[List[Product], str]:
     Note:
         Use list_categories tool to see valid category names.
     """
-    return get_products_by_category(category)
+    return _list_result(get_products_by_category(category))
 
 
 @mcp.tool(name="items_by_category")
-def get_items_by_category_tool(category: str) -> Union[List[EnrichedInventoryItem], str]:
+def get_items_by_category_tool(category: str) -> Annotated[CallToolResult, List[EnrichedInventoryItem]]:
     """Get all inventory items in a specific category with enriched product details.
 
     Returns inventory records with joined product and supplier information for items in the category.
@@ -483,7 +785,8 @@ def get_items_by_category_tool(category: str) -> Union[List[EnrichedInventoryIte
         - Product fields: product_id, name, category, description, sku, barcode, weight, dimensions
         - Supplier fields: supplier_id, supplier_name, supplier_part_number, cost, profit_margin
 
-        Returns error message string if category doesn't exist.
+    Raises:
+        NotFoundError if the category doesn't exist or has no items (reported as a tool error)
 
     Example:
         items = items_by_category("electronics")
@@ -494,7 +797,7 @@ def get_items_by_category_tool(category: str) -> Union[List[EnrichedInventoryIte
         - This returns actual inventory stock records, not just product definitions
         - Supports Many-to-One: same product may appear multiple times at different locations
     """
-    return get_items_by_category(category)
+    return _list_result(get_items_by_category(category))
 
 
 @mcp.tool(name="list_suppliers")
@@ -528,7 +831,7 @@ def list_suppliers_tool() -> List[Supplier]:
 
 
 @mcp.tool(name="products_by_supplier")
-def get_products_by_supplier_tool(supplier_name: str) -> Union[List[Product], str]:
+def get_products_by_supplier_tool(supplier_name: str) -> Annotated[CallToolResult, List[Product]]:
     """Get all products supplied by a specific supplier with complete product details.
 
     Returns product records for all products that have a supplier-product relationship
@@ -550,7 +853,8 @@ def get_products_by_supplier_tool(supplier_name: str) -> Union[List[Product], st
         - created_at: Creation timestamp
         - updated_at: Last update timestamp
 
-        Returns error message string if supplier not found.
+    Raises:
+        NotFoundError if the supplier is not found or supplies no products (reported as a tool error)
 
     Example:
         products = products_by_supplier("Acme Corp")
@@ -561,11 +865,11 @@ def get_products_by_supplier_tool(supplier_name: str) -> Union[List[Product], st
         - Supplier name must match exactly (case-sensitive)
         - Products may have multiple suppliers; this shows one supplier's products
     """
-    return get_products_by_supplier(supplier_name)
+    return _list_result(get_products_by_supplier(supplier_name))
 
 
 @mcp.tool(name="items_by_supplier")
-def get_items_by_supplier_tool(supplier_name: str) -> Union[List[EnrichedInventoryItem], str]:
+def get_items_by_supplier_tool(supplier_name: str) -> Annotated[CallToolResult, List[EnrichedInventoryItem]]:
     """Get all inventory items for products supplied by a specific supplier.
 
     Returns inventory stock records with enriched product details for items whose
@@ -580,7 +884,8 @@ def get_items_by_supplier_tool(supplier_name: str) -> Union[List[EnrichedInvento
         - Product fields: product_id, name, category, description, sku, barcode, weight, dimensions
         - Supplier fields: supplier_id, supplier_name, supplier_part_number, cost, profit_margin
 
-        Returns error message string if supplier not found.
+    Raises:
+        NotFoundError if the supplier is not found or has no inventory items (reported as a tool error)
 
     Example:
         items = items_by_supplier("Acme Corp")
@@ -592,7 +897,7 @@ def get_items_by_supplier_tool(supplier_name: str) -> Union[List[EnrichedInvento
         - Shows actual inventory stock, not just product definitions
         - Supports Many-to-One: same product may appear at multiple locations
     """
-    return get_items_by_supplier(supplier_name)
+    return _list_result(get_items_by_supplier(supplier_name))
 
 
 @mcp.tool(name="supplier_products_by_supplier")
@@ -607,7 +912,7 @@ def get_supplier_products_by_supplier_tool(supplier_id: str) -> List[SupplierPro
 
     Returns: List of supplier-product relationship objects
     """
-    return db.get_supplier_products_by_supplier_id(supplier_id)
+    return _get_supplier_products_by_supplier_id(supplier_id)
 
 
 @mcp.tool(name="supplier_products_by_product")
@@ -622,18 +927,20 @@ def get_supplier_products_by_product_tool(product_id: str) -> List[SupplierProdu
 
     Returns: List of supplier-product relationship objects
     """
-    return db.get_supplier_products_by_product_id(UUID(product_id))
+    return db.get_supplier_products_by_product_id(_to_uuid(product_id))
 
 
 @mcp.tool(name="list_products")
-def list_products_tool() -> List[Product]:
-    """Get the complete list of all products in the system with full details.
+def list_products_tool(offset: int = 0, limit: int = -1) -> Annotated[CallToolResult, List[Product]]:
+    """Get the list of all products in the system with full details, sorted by name.
 
     Returns all product records across all categories. Use this to discover product
-    IDs for inventory operations or to browse the product catalog.
+    IDs for inventory operations or to browse the product catalog. Large catalogs can
+    be read one page at a time with offset and limit.
 
     Parameters:
-        None
+        offset (int): Number of products to skip (optional, default 0)
+        limit (int): Maximum number of products to return (optional, all remaining products if not provided)
 
     Returns:
         List of Product objects, each containing:
@@ -648,18 +955,25 @@ def list_products_tool() -> List[Product]:
         - created_at: Product creation timestamp
         - updated_at: Last modification timestamp
 
+    Raises:
+        ValueError if offset is negative
+
     Example:
         products = list_products()
         # Returns complete product catalog with all details
+        page = list_products(offset=100, limit=50)
+        # Returns products 101 to 150 in name order
 
     Note:
         Product UUIDs (id field) are required for creating inventory items and supplier relationships.
     """
-    return list_products()
+    if offset < 0:
+        raise ValueError("offset must be >= 0")
+    return _list_result(list_products(offset, limit if limit >= 0 else None))
 
 
 @mcp.tool(name="items_by_name")
-def get_items_by_name_tool(product_name: str) -> Union[List[EnrichedInventoryItem], str]:
+def get_items_by_name_tool(product_name: str) -> Annotated[CallToolResult, List[EnrichedInventoryItem]]:
     """Find all inventory items for a product by its exact name.
 
     Returns inventory stock records with enriched product details for items matching
@@ -675,7 +989,8 @@ def get_items_by_name_tool(product_name: str) -> Union[List[EnrichedInventoryIte
         - Product fields: product_id, name, category, description, sku, barcode, weight, dimensions
         - Supplier fields: supplier_id, supplier_name, supplier_part_number, cost, profit_margin
 
-        Returns error message string if no product with this exact name exists.
+    Raises:
+        NotFoundError if no product with this exact name exists (reported as a tool error)
 
     Example:
         items = items_by_name("Laptop Pro 15")
@@ -687,11 +1002,11 @@ def get_items_by_name_tool(product_name: str) -> Union[List[EnrichedInventoryIte
         - URL-encode names with spaces (e.g., "Laptop%20Pro%2015")
         - Multiple items may be returned for the same product at different locations
     """
-    return get_items_by_name(product_name)
+    return _list_result(get_items_by_name(product_name))
 
 
 @mcp.tool(name="search_inventory")
-def search_inventory_tool(query: str) -> Union[List[EnrichedInventoryItem], str]:
+def search_inventory_tool(query: str) -> Annotated[CallToolResult, List[EnrichedInventoryItem]]:
     """Search inventory items by keyword across product names, descriptions, and SKUs.
 
     Performs case-insensitive partial matching across multiple product fields to find
@@ -706,7 +1021,8 @@ def search_inventory_tool(query: str) -> Union[List[EnrichedInventoryItem], str]
         - Product fields: product_id, name, category, description, sku, barcode, weight, dimensions
         - Supplier fields: supplier_id, supplier_name, supplier_part_number, cost, profit_margin
 
-        Returns error message string if no matches found.
+    Raises:
+        NotFoundError if no matches are found (reported as a tool error)
 
     Example:
         items = search_inventory("laptop")
@@ -720,7 +1036,7 @@ def search_inventory_tool(query: str) -> Union[List[EnrichedInventoryItem], str]
         - Results sorted alphabetically by product name
         - More flexible than items_by_name which requires exact match
     """
-    return search_inventory(query)
+    return _list_result(search_inventory(query))
 
 
 @mcp.tool(name="low_stock_items")
@@ -755,12 +1071,61 @@ def get_low_stock_items_tool() -> Union[List[EnrichedInventoryItem], str]:
     return get_low_stock_items()
 
 
+@mcp.tool(name="cache_stats")
+def get_cache_stats_tool() -> Dict[str, int]:
+    """Get hit and miss counters for the caches of read-only inventory results.
+
+    List results are cached for a short time, while overview and statistics results are kept
+    until the data changes. Both caches are invalidated by every add, update and delete tool.
+
+    Parameters:
+        None
+
+    Returns:
+        Dict with 'hits', 'misses', 'size' (cached results) and 'maxsize' (cache capacity), summed over both caches
+
+    Example:
+        cache_stats()
+        # Returns: {"hits": 42, "misses": 7, "size": 5, "maxsize": 256}
+    """
+    return get_cache_stats()
+
+
 # ==============================================================================
 # UPDATE Tools - Data Modification Operations
 # ==============================================================================
 
 
+def _inventory_item_update(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    inventory_item_id: str,
+    location_id: Optional[str] = None,
+    status: Optional[str] = None,
+    price: Union[str, float] = "",
+    quantity_on_hand: int = -1,
+    quantity_reserved: int = -1,
+    quantity_allocated: int = -1,
+    reorder_point: int = -1,
+    max_stock: int = -1,
+    last_restocked_at: Optional[str] = None,
+    last_counted_at: Optional[str] = None,
+) -> Tuple[UUID, Dict[str, Any]]:
+    # Sentinel values (negative numbers, "", None) mean "keep the current value"
+    return _to_uuid(inventory_item_id), {
+        "location_id": location_id,
+        "status": _to_status(status) if status else None,
+        "price": _optional_decimal(price),
+        "quantity_on_hand": quantity_on_hand if quantity_on_hand >= 0 else None,
+        "quantity_reserved": quantity_reserved if quantity_reserved >= 0 else None,
+        "quantity_allocated": quantity_allocated if quantity_allocated >= 0 else None,
+        "reorder_point": reorder_point if reorder_point >= 0 else None,
+        "max_stock": max_stock if max_stock > 0 else None,
+        "last_restocked_at": parse_datetime(last_restocked_at) if last_restocked_at is not None else None,
+        "last_counted_at": parse_datetime(last_counted_at) if last_counted_at is not None else None,
+    }
+
+
 @mcp.tool(name="update_category")
+@invalidates_resource_cache
 def update_category_tool(name: str, description: str = "") -> Dict[str, str]:
     """Update an existing product category's description.
 
@@ -789,6 +1154,7 @@ def update_category_tool(name: str, description: str = "") -> Dict[str, str]:
 
 
 @mcp.tool(name="update_supplier")
+@invalidates_resource_cache
 def update_supplier_tool(
     supplier_id: str,
     name: Optional[str] = None,
@@ -832,6 +1198,7 @@ def update_supplier_tool(
 
 
 @mcp.tool(name="update_product")
+@invalidates_resource_cache
 def update_product_tool(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     product_id: str,
     name: Optional[str] = None,
@@ -839,7 +1206,7 @@ def update_product_tool(  # pylint: disable=too-many-arguments,too-many-position
     category: Optional[str] = None,
     sku: Optional[str] = None,
     barcode: Optional[str] = None,
-    weight: float = -1.0,
+    weight: Union[str, float] = "",
     dimensions: Optional[str] = None,
 ) -> Product:
     """Update an existing product's information.
@@ -855,7 +1222,8 @@ def update_product_tool(  # pylint: disable=too-many-arguments,too-many-position
         category (str): New product category (optional, must exist in database)
         sku (str): New SKU code (optional, must be unique if provided, max 50 chars)
         barcode (str): New barcode (optional, max 50 chars)
-        weight (float): New weight in kilograms (optional, must be > 0 if provided)
+        weight (str or float): New weight in kilograms (optional, must be > 0 if provided;
+                               a string such as "2.75" keeps its exact decimal digits)
         dimensions (str): New dimensions as LxWxH string (optional, max 50 chars)
 
     Returns:
@@ -875,23 +1243,24 @@ def update_product_tool(  # pylint: disable=too-many-arguments,too-many-position
         - Only provided parameters are updated (partial updates supported)
         - Product ID cannot be changed (it's the primary key)
     """
-    return db.update_product(
-        product_id=UUID(product_id),
+    return _update_product(
+        product_id=_to_uuid(product_id),
         name=name,
         description=description,
         category=category,
         sku=sku,
         barcode=barcode,
-        weight=Decimal(str(weight)) if weight > 0 else None,
+        weight=_optional_decimal(weight),
         dimensions=dimensions,
     )
 
 
 @mcp.tool(name="update_supplier_product")
+@invalidates_resource_cache
 def update_supplier_product_tool(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     supplier_product_id: str,
     supplier_part_number: Optional[str] = None,
-    cost: float = -1.0,
+    cost: Union[str, float] = "",
     lead_time_days: int = -1,
     minimum_order_quantity: int = 0,
     is_primary_supplier: Optional[bool] = None,
@@ -905,7 +1274,8 @@ def update_supplier_product_tool(  # pylint: disable=too-many-arguments,too-many
     Parameters:
         supplier_product_id (str): SupplierProduct UUID to update (required)
         supplier_part_number (str): New supplier part number (optional, max 50 chars)
-        cost (float): New supplier cost (optional, must be >= 0)
+        cost (str or float): New supplier cost (optional, must be >= 0;
+                             a string such as "925.50" keeps its exact decimal digits)
         lead_time_days (int): New lead time in days (optional, must be >= 0)
         minimum_order_quantity (int): New minimum order quantity (optional, must be >= 1)
         is_primary_supplier (bool): New primary supplier flag (optional)
@@ -927,10 +1297,10 @@ def update_supplier_product_tool(  # pylint: disable=too-many-arguments,too-many
         - Use supplier_products_by_supplier or supplier_products_by_product tools
           to get valid supplier-product relationship IDs
     """
-    return db.update_supplier_product(
-        supplier_product_id=UUID(supplier_product_id),
+    return _update_supplier_product(
+        supplier_product_id=_to_uuid(supplier_product_id),
         supplier_part_number=supplier_part_number,
-        cost=Decimal(str(cost)) if cost >= 0 else None,
+        cost=_optional_decimal(cost, allow_zero=True),
         lead_time_days=lead_time_days if lead_time_days >= 0 else None,
         minimum_order_quantity=minimum_order_quantity if minimum_order_quantity >= 1 else None,
         is_primary_supplier=is_primary_supplier,
@@ -938,11 +1308,12 @@ def update_supplier_product_tool(  # pylint: disable=too-many-arguments,too-many
 
 
 @mcp.tool(name="update_inventory_item")
+@invalidates_resource_cache
 def update_inventory_item_tool(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     inventory_item_id: str,
     location_id: Optional[str] = None,
     status: Optional[str] = None,
-    price: float = -1.0,
+    price: Union[str, float] = "",
     quantity_on_hand: int = -1,
     quantity_reserved: int = -1,
     quantity_allocated: int = -1,
@@ -962,7 +1333,8 @@ def update_inventory_item_tool(  # pylint: disable=too-many-arguments,too-many-p
         location_id (str): New storage location identifier (optional, max 50 chars)
         status (str): New inventory status (optional, one of: 'active', 'inactive',
                      'out_of_stock', 'discontinued')
-        price (float): New selling price (optional, must be > 0)
+        price (str or float): New selling price (optional, must be > 0;
+                              a string such as "19.99" keeps its exact decimal digits)
         quantity_on_hand (int): New current stock quantity (optional, must be >= 0)
         quantity_reserved (int): New reserved quantity (optional, must be >= 0)
         quantity_allocated (int): New allocated quantity (optional, must be >= 0)
@@ -993,23 +1365,52 @@ def update_inventory_item_tool(  # pylint: disable=too-many-arguments,too-many-p
         - Timestamps should be in ISO 8601 format (YYYY-MM-DDTHH:MM:SS)
         - This supports Many-to-One: multiple items can track same product at different locations
     """
-    # Parse datetime strings if provided
-    restocked_dt = datetime.fromisoformat(last_restocked_at) if last_restocked_at is not None else None
-    counted_dt = datetime.fromisoformat(last_counted_at) if last_counted_at is not None else None
-
-    return db.update_inventory_item(
-        inventory_item_id=UUID(inventory_item_id),
+    item_id, fields = _inventory_item_update(
+        inventory_item_id=inventory_item_id,
         location_id=location_id,
-        status=ItemStatus(status) if status else None,
-        price=Decimal(str(price)) if price > 0 else None,
-        quantity_on_hand=quantity_on_hand if quantity_on_hand >= 0 else None,
-        quantity_reserved=quantity_reserved if quantity_reserved >= 0 else None,
-        quantity_allocated=quantity_allocated if quantity_allocated >= 0 else None,
-        reorder_point=reorder_point if reorder_point >= 0 else None,
-        max_stock=max_stock if max_stock > 0 else None,
-        last_restocked_at=restocked_dt,
-        last_counted_at=counted_dt,
+        status=status,
+        price=price,
+        quantity_on_hand=quantity_on_hand,
+        quantity_reserved=quantity_reserved,
+        quantity_allocated=quantity_allocated,
+        reorder_point=reorder_point,
+        max_stock=max_stock,
+        last_restocked_at=last_restocked_at,
+        last_counted_at=last_counted_at,
     )
+    return _update_inventory_item(item_id, **fields)
+
+
+@mcp.tool(name="update_inventory_items_bulk")
+@invalidates_resource_cache
+def update_inventory_items_bulk_tool(inventory_items: List[Dict[str, Any]]) -> List[InventoryItem]:
+    """Update several inventory items in a single batch, e.g. to restock many items at once.
+
+    Each entry takes the same fields as the update_inventory_item tool. All item IDs are checked
+    before any item is updated, so one unknown ID leaves the database unchanged.
+
+    Parameters:
+        inventory_items (list): Update entries, each a dict with keys:
+            - inventory_item_id (str): InventoryItem UUID to update (required)
+            - location_id, status (str): Optional new location and status
+            - price (str or float): Optional new selling price (must be > 0; strings keep exact digits)
+            - quantity_on_hand, quantity_reserved, quantity_allocated, reorder_point, max_stock (int): Optional
+            - last_restocked_at, last_counted_at (str): Optional ISO 8601 timestamps
+
+    Returns:
+        List of updated InventoryItem objects, in the given order
+
+    Raises:
+        ValueError if an inventory item does not exist or an entry has an unknown field
+
+    Example:
+        update_inventory_items_bulk([
+            {"inventory_item_id": "750e8400-e29b-41d4-a716-446655440000", "quantity_on_hand": 150,
+             "last_restocked_at": "2024-01-15T10:30:00"},
+            {"inventory_item_id": "750e8400-e29b-41d4-a716-446655440001", "quantity_on_hand": 80},
+        ])
+    """
+    return _update_inventory_items([_inventory_item_update(**entry) for entry in inventory_items])
 
 
 # ==============================================================================
@@ -1018,7 +1419,8 @@ def update_inventory_item_tool(  # pylint: disable=too-many-arguments,too-many-p
 
 
 @mcp.tool(name="delete_inventory_item")
-def delete_inventory_item_tool(inventory_item_id: str) -> str:
+@invalidates_resource_cache
+def delete_inventory_item_tool(inventory_item_id: UUID) -> str:
     """Delete an inventory item from the database.
 
     WARNING: This permanently removes the inventory tracking record.
@@ -1034,12 +1436,44 @@ def delete_inventory_item_tool(inventory_item_id: str) -> str:
     Example:
         delete_inventory_item("123e4567-e89b-12d3-a456-426614174000")
     """
-    db.delete_inventory_item(UUID(inventory_item_id))
+    db.delete_inventory_item(inventory_item_id)
     return f"Successfully deleted inventory item '{inventory_item_id}'"
 
 
+@mcp.tool(name="delete_inventory_items_bulk")
+@invalidates_resource_cache
+def delete_inventory_items_bulk_tool(inventory_item_ids: List[UUID]) -> Dict[str, int]:
+    """Delete several inventory items in a single batch, e.g. to clean up a set of items at once.
+
+    WARNING: This permanently removes the inventory tracking records.
+
+    All item IDs are checked before any item is deleted, so one unknown ID leaves the database
+    unchanged. Repeated IDs are deleted once.
+
+    Parameter: inventory_item_ids (list of strings) - Inventory item UUIDs
+    Use search_inventory or items_by_name tools to get valid inventory item IDs.
+
+    Returns:
+        Dictionary with the count of deleted items:
+        {
+            "deleted_inventory_items": int
+        }
+
+    Raises:
+        ValueError if an inventory item does not exist
+
+    Example:
+        delete_inventory_items_bulk([
+            "123e4567-e89b-12d3-a456-426614174000",
+            "123e4567-e89b-12d3-a456-426614174001",
+        ])
+    """
+    return db.delete_inventory_items(inventory_item_ids)
+
+
 @mcp.tool(name="delete_supplier_product")
-def delete_supplier_product_tool(supplier_product_id: str) -> str:
+@invalidates_resource_cache
+def delete_supplier_product_tool(supplier_product_id: UUID) -> str:
     """Delete a supplier-product relationship.
 
     Removes the link between a supplier and product. Does not delete the
@@ -1057,12 +1491,13 @@ def delete_supplier_product_tool(supplier_product_id: str) -> str:
     Example:
         delete_supplier_product("123e4567-e89b-12d3-a456-426614174000")
     """
-    db.delete_supplier_product(UUID(supplier_product_id))
+    db.delete_supplier_product(supplier_product_id)
     return f"Successfully deleted supplier-product relationship '{supplier_product_id}'"
 
 
 @mcp.tool(name="delete_product")
-def delete_product_tool(product_id: str) -> Dict[str, int]:
+@invalidates_resource_cache
+def delete_product_tool(product_id: UUID) -> Dict[str, int]:
     """Delete a product and all related data (CASCADE).
 
     WARNING: This will also delete:
@@ -1088,10 +1523,11 @@ def delete_product_tool(product_id: str) -> Dict[str, int]:
     Example:
         delete_product("123e4567-e89b-12d3-a456-426614174000")
     """
-    return db.delete_product(UUID(product_id))
+    return db.delete_product(product_id)
 
 
 @mcp.tool(name="delete_supplier")
+@invalidates_resource_cache
 def delete_supplier_tool(supplier_id: str) -> Dict[str, int]:
     """Delete a supplier and all related relationships (CASCADE).
 
@@ -1120,6 +1556,7 @@ def delete_supplier_tool(supplier_id: str) -> Dict[str, int]:
 
 
 @mcp.tool(name="delete_category")
+@invalidates_resource_cache
 def delete_category_tool(name: str) -> Dict[str, int]:
     """Delete a category and all related data (CASCADE).
 
@@ -1263,10 +1700,8 @@ def get_file_tool(file_path: str) -> CallToolResult:
         - File contents are base64-encoded for safe transmission
         - For images use get_image, for audio use get_audio (they provide optimized formats)
     """
-    with open(file_path, "rb") as file:
-        file_data = file.read()
-    encoded = base64.b64encode(file_data).decode("utf-8")
-    mime_type, _ = mimetypes.guess_type(file_path)
+    encoded = encode_file_base64(file_path)
+    mime_type = guess_mime_type(file_path)
     return CallToolResult(
         isError=False,
         content=[
@@ -1275,7 +1710,7 @@ def get_file_tool(file_path: str) -> CallToolResult:
                 resource=BlobResourceContents(
                     uri=f"file://{file_path}",  # type: ignore[arg-type]
                     blob=encoded,
-                    mimeType=mime_type or "application/octet-stream",
+                    mimeType=mime_type,
                 ),
             )
         ],
@@ -1317,7 +1752,7 @@ def get_uri_content_tool(content_uri: str) -> CallToolResult:
         - Useful for remote resources, streaming, or avoiding large file transfers
         - Name is extracted from the last segment of the URI path
     """
-    mime_type, _ = mimetypes.guess_type(content_uri)
+    mime_type = guess_mime_type(urlsplit(content_uri).path)
     return CallToolResult(
         isError=False,
         content=[
@@ -1325,7 +1760,7 @@ def get_uri_content_tool(content_uri: str) -> CallToolResult:
                 type="resource_link",
                 name=content_uri.split("/")[-1],
                 uri=content_uri,  # type: ignore[arg-type]
-                mimeType=mime_type or "application/octet-stream",
+                mimeType=mime_type,
             )
         ],
     )
@@ -2,17 +2,24 @@
 
 # pylint: disable=too-many-lines
 
+import functools
+import heapq
 import pickle
+import re
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
-    Union,
+    Set,
+    Tuple,
 )
 from uuid import (
     UUID,
@@ -21,6 +28,7 @@ from uuid import (
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     field_validator,
 )
@@ -38,6 +46,11 @@ class ItemStatus(str, Enum):
 class Supplier(BaseModel):
     """Supplier entity."""
 
+    # Instances are shared by the database, its enriched view and cached results, so they are never mutated;
+    # updates replace them with model_copy(). No __weakref__ slot is needed either.
+    model_config = ConfigDict(frozen=True)
+    __slots__ = ()
+
     id: str = Field(..., max_length=50, description="Supplier identifier")
     name: str = Field(..., min_length=1, max_length=100, description="Supplier name")
     contact_email: Optional[str] = Field(None, max_length=100, description="Contact email")
@@ -50,6 +63,9 @@ class Supplier(BaseModel):
 class Product(BaseModel):
     """Product master data entity."""
 
+    model_config = ConfigDict(frozen=True)
+    __slots__ = ()
+
     id: UUID = Field(default_factory=uuid4, description="Unique product identifier")
     name: str = Field(..., min_length=1, max_length=100, description="Product name")
     description: Optional[str] = Field(None, max_length=500, description="Product description")
@@ -71,6 +87,9 @@ class Product(BaseModel):
 class SupplierProduct(BaseModel):
     """Product-Supplier relationship entity."""
 
+    model_config = ConfigDict(frozen=True)
+    __slots__ = ()
+
     id: UUID = Field(default_factory=uuid4, description="Unique relationship identifier")
     product_id: UUID = Field(..., description="Product identifier")
     supplier_id: str = Field(..., description="Supplier identifier")
@@ -86,6 +105,9 @@ class SupplierProduct(BaseModel):
 class InventoryItem(BaseModel):
     """Normalized inventory item - focuses only on inventory tracking."""
 
+    model_config = ConfigDict(frozen=True)
+    __slots__ = ()
+
     id: UUID = Field(default_factory=uuid4, description="Unique inventory item identifier")
     product_id: UUID = Field(..., description="Reference to product")
     location_id: Optional[str] = Field(None, max_length=50, description="Storage location identifier")
@@ -128,6 +150,9 @@ class InventoryItem(BaseModel):
 class EnrichedInventoryItem(BaseModel):
     """Inventory item enriched with product and supplier data for API responses."""
 
+    model_config = ConfigDict(frozen=True)
+    __slots__ = ()
+
     # Inventory data
     id: UUID
     status: ItemStatus
@@ -163,6 +188,14 @@ class EnrichedInventoryItem(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    def model_post_init(self, context: Any, /) -> None:
+        # Every field is always set, so all instances share one fields-set instead of each holding a set of
+        # 27 names (about 2 KB, more than the field values dict). Safe because frozen models never add to it.
+        object.__setattr__(self, "__pydantic_fields_set__", _ENRICHED_ITEM_FIELDS_SET)
+
+
+_ENRICHED_ITEM_FIELDS_SET = set(EnrichedInventoryItem.model_fields)
+
 
 # Summary and statistics models
 
@@ -190,6 +223,9 @@ class CategoryStatistics(BaseModel):
 class DatabaseSchema(BaseModel):
     """Complete database schema definition."""
 
+    # A single validated instance is shared by every schema request, so it must not be reassigned
+    model_config = ConfigDict(frozen=True)
+
     entities: Dict[str, Dict[str, str]]
     relationships: List[Dict[str, str]]
     indexes: Dict[str, List[str]]
@@ -197,6 +233,33 @@ class DatabaseSchema(BaseModel):
     description: str
 
 
+# Length of the character n-grams indexed for product search
+SEARCH_NGRAM_SIZE = 3
+
+
+# Inventory item fields that update_inventory_item and update_inventory_items may change
+_UPDATABLE_INVENTORY_ITEM_FIELDS = frozenset(
+    {
+        "location_id",
+        "status",
+        "price",
+        "quantity_on_hand",
+        "quantity_reserved",
+        "quantity_allocated",
+        "reorder_point",
+        "max_stock",
+        "last_restocked_at",
+        "last_counted_at",
+    }
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_query(query: str) -> Callable[[str], Optional[re.Match[str]]]:
+    """Compile a search query into a case-insensitive literal matcher, cached for repeated queries."""
+    return re.compile(re.escape(query), re.IGNORECASE).search
+
+
 class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Normalized in-memory inventory database with CRUD operations.
 
@@ -242,6 +305,43 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
             self._supplier_product_index: Dict[UUID, List[UUID]] = {}  # product_id -> supplier_product ids
             self._inventory_product_index: Dict[UUID, UUID] = {}  # inventory_id -> product_id
 
+        # Denormalized view of all enriched items (None when stale), rebuilt on first read after a write
+        self._enriched_items: Optional[List[EnrichedInventoryItem]] = None  # sorted by product name
+        self._enriched_by_category: Dict[str, List[EnrichedInventoryItem]] = {}  # category -> enriched items
+        self._enriched_by_product: Dict[UUID, List[EnrichedInventoryItem]] = {}  # product_id -> enriched items
+        self._enriched_by_supplier_name: Dict[str, List[EnrichedInventoryItem]] = {}  # lowercase name -> items
+
+        # Products sorted by name, the same order grouped by lowercase category, and a trigram index over their
+        # names, descriptions and SKUs (None when stale), rebuilt only after product writes
+        self._products_by_name: Optional[List[Product]] = None
+        self._products_by_category: Optional[Dict[str, List[Product]]] = None  # category -> products by name
+        self._search_index: Optional[Dict[str, Set[int]]] = None  # trigram -> positions in _products_by_name
+
+        # Inventory totals rolled up by lowercase category (None when stale), rebuilt on first read after a write
+        self._category_rollup: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # Categories sorted by name, shared by every list_categories() caller (None when stale)
+        self._categories_view: Optional[Tuple[Dict[str, str], ...]] = None
+
+        # Supplier-product relationship ids by supplier_id, derived from the stored relationships (not persisted)
+        self._supplier_relationship_index: Dict[str, List[UUID]] = {}  # supplier_id -> supplier_product ids
+        for supplier_product_obj in self._supplier_products.values():
+            self._supplier_relationship_index.setdefault(supplier_product_obj.supplier_id, []).append(
+                supplier_product_obj.id
+            )
+
+        # Inventory item ids by product_id, the reverse of _inventory_product_index (not persisted)
+        self._product_inventory_index: Dict[UUID, Set[UUID]] = {}  # product_id -> inventory ids
+        for inventory_id, product_id in self._inventory_product_index.items():
+            self._product_inventory_index.setdefault(product_id, set()).add(inventory_id)
+
+        # Ids of the inventory items that need reorder, kept current by every inventory item write
+        self._low_stock_ids: Set[UUID] = {
+            inventory_id
+            for inventory_id, inventory_item_obj in self._inventory_items.items()
+            if inventory_item_obj.needs_reorder
+        }
+
     def _load_from_file(self, filepath: str) -> None:
         """Load database state from pickle file.
 
@@ -338,6 +438,7 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
 
         self._categories[name_lower] = category_info
         self._category_index[name_lower] = []
+        self._categories_view = None
 
         return category_info
 
@@ -366,21 +467,70 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if product_obj.sku and product_obj.sku in self._product_sku_index:
             raise ValueError(f"Product with SKU '{product_obj.sku}' already exists")
 
+        self._insert_product(product_obj)
+        return product_obj
+
+    def add_products(self, product_objs: List[Product]) -> List[Product]:
+        """Add several products in one batch.
+
+        Every product is validated before any is inserted, so an invalid entry leaves the database unchanged.
+
+        Args:
+            product_objs: Products to add
+
+        Returns:
+            The added Product objects, in the given order
+
+        Raises:
+            ValueError: If a category does not exist, or a name or SKU already exists or repeats within the batch
+        """
+        self._validate_new_products(product_objs)
+        for product_obj in product_objs:
+            self._insert_product(product_obj)
+        return product_objs
+
+    def _validate_new_products(self, product_objs: List[Product], new_categories: Optional[Set[str]] = None) -> None:
+        """Check that a batch of products can be added, raising ValueError for the first one that cannot.
+
+        Args:
+            product_objs: Products to check
+            new_categories: Lowercase names of categories added in the same batch
+        """
+        # Build the duplicate-check sets once for the whole batch instead of once per product
+        names_lower = {name.lower() for name in self._product_name_index}
+        skus = set(self._product_sku_index)
+        for product_obj in product_objs:
+            category_lower = product_obj.category.lower()
+            if category_lower not in self._categories and not (new_categories and category_lower in new_categories):
+                raise ValueError(
+                    f"Category '{product_obj.category}' does not exist. Please create it first using add_category()."
+                )
+            name_lower = product_obj.name.lower()
+            if name_lower in names_lower:
+                raise ValueError(f"Product with name '{product_obj.name}' already exists")
+            names_lower.add(name_lower)
+            if product_obj.sku:
+                if product_obj.sku in skus:
+                    raise ValueError(f"Product with SKU '{product_obj.sku}' already exists")
+                skus.add(product_obj.sku)
+
+    def _insert_product(self, product_obj: Product) -> None:
+        """Store an already validated product and add it to the indexes."""
         # Add to main storage and indexes
         self._products[product_obj.id] = product_obj
+        self._invalidate_product_views()
         self._product_name_index[product_obj.name] = product_obj.id
         if product_obj.sku:
             self._product_sku_index[product_obj.sku] = product_obj.id
 
         # Initialize category index if needed and add product
+        category_lower = product_obj.category.lower()
         if category_lower not in self._category_index:
             self._category_index[category_lower] = []
         self._category_index[category_lower].append(product_obj.id)
 
         self._supplier_product_index[product_obj.id] = []
 
-        return product_obj
-
     def add_supplier_product(self, supplier_product_obj: SupplierProduct) -> SupplierProduct:
         """Add a supplier-product relationship."""
         if supplier_product_obj.product_id not in self._products:
@@ -389,25 +539,338 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if supplier_product_obj.supplier_id not in self._suppliers:
             raise ValueError(f"Supplier with ID '{supplier_product_obj.supplier_id}' does not exist")
 
-        self._supplier_products[supplier_product_obj.id] = supplier_product_obj
-        self._supplier_product_index[supplier_product_obj.product_id].append(supplier_product_obj.id)
+        self._insert_supplier_product(supplier_product_obj)
+        self._invalidate_enriched_view()
 
         return supplier_product_obj
 
+    def _insert_supplier_product(self, supplier_product_obj: SupplierProduct) -> None:
+        """Store an already validated supplier-product relationship and index it by product and by supplier."""
+        self._supplier_products[supplier_product_obj.id] = supplier_product_obj
+        self._supplier_product_index[supplier_product_obj.product_id].append(supplier_product_obj.id)
+        self._supplier_relationship_index.setdefault(supplier_product_obj.supplier_id, []).append(
+            supplier_product_obj.id
+        )
+
     def add_inventory_item(self, inventory_item_obj: InventoryItem) -> InventoryItem:
         """Add a new inventory item."""
         if inventory_item_obj.product_id not in self._products:
             raise ValueError(f"Product with ID '{inventory_item_obj.product_id}' does not exist")
 
+        self._replace_inventory_item(inventory_item_obj)
+        self._invalidate_enriched_view(keep_category_rollup=True)
+
+        return inventory_item_obj
+
+    def add_inventory_items(self, inventory_item_objs: List[InventoryItem]) -> List[InventoryItem]:
+        """Add several inventory items in one batch.
+
+        Every item is validated before any is inserted, so an invalid entry leaves the database unchanged.
+
+        Args:
+            inventory_item_objs: Inventory items to add
+
+        Returns:
+            The added InventoryItem objects, in the given order
+
+        Raises:
+            ValueError: If an item references a product that does not exist
+        """
+        for inventory_item_obj in inventory_item_objs:
+            if inventory_item_obj.product_id not in self._products:
+                raise ValueError(f"Product with ID '{inventory_item_obj.product_id}' does not exist")
+
+        for inventory_item_obj in inventory_item_objs:
+            self._replace_inventory_item(inventory_item_obj)
+        self._invalidate_enriched_view(keep_category_rollup=True)
+
+        return inventory_item_objs
+
+    def _replace_inventory_item(self, inventory_item_obj: InventoryItem) -> None:
+        """Store an inventory item under its id, replacing any item already stored there, and update the indexes."""
+        previous_item = self._inventory_items.get(inventory_item_obj.id)
+        if previous_item:
+            self._roll_up_item(previous_item, -1)
         self._inventory_items[inventory_item_obj.id] = inventory_item_obj
+        self._index_inventory_item(inventory_item_obj)
+        self._track_low_stock(inventory_item_obj)
+        self._roll_up_item(inventory_item_obj, 1)
+
+    def _index_inventory_item(self, inventory_item_obj: InventoryItem) -> None:
+        """Record an inventory item's product in both directions, moving it off any product it replaced."""
+        if inventory_item_obj.id in self._inventory_product_index:
+            self._unindex_inventory_item(inventory_item_obj.id)
         self._inventory_product_index[inventory_item_obj.id] = inventory_item_obj.product_id
+        self._product_inventory_index.setdefault(inventory_item_obj.product_id, set()).add(inventory_item_obj.id)
+
+    def _unindex_inventory_item(self, inventory_item_id: UUID) -> None:
+        """Remove an inventory item from both directions of the inventory-product index."""
+        product_id = self._inventory_product_index.pop(inventory_item_id)
+        inventory_ids = self._product_inventory_index[product_id]
+        inventory_ids.discard(inventory_item_id)
+        if not inventory_ids:
+            del self._product_inventory_index[product_id]
+
+    def _track_low_stock(self, inventory_item_obj: InventoryItem) -> None:
+        """Add an inventory item to the low-stock id set if it needs reorder, or remove it otherwise."""
+        if inventory_item_obj.needs_reorder:
+            self._low_stock_ids.add(inventory_item_obj.id)
+        else:
+            self._low_stock_ids.discard(inventory_item_obj.id)
 
-        return inventory_item_obj
+    def _roll_up_item(self, inventory_item_obj: InventoryItem, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an inventory item's share of the category roll-up, if it is built.
+
+        Inventory item writes keep the roll-up current this way, so reads after a stock or price change do not
+        rescan every item. Rows and product counts that drop to zero are removed, as a rebuild would omit them.
+        """
+        if self._category_rollup is None:
+            return
+        product_obj = self._products.get(inventory_item_obj.product_id)
+        if not product_obj:
+            return
+
+        item_category = product_obj.category.lower()
+        row = self._category_rollup.get(item_category)
+        if row is None:
+            row = {"total_items": 0, "total_value": Decimal(0), "low_stock_count": 0, "product_stats": {}}
+            self._category_rollup[item_category] = row
+        row["total_items"] += sign
+        row["total_value"] += sign * inventory_item_obj.price * inventory_item_obj.quantity_on_hand
+        if inventory_item_obj.needs_reorder:
+            row["low_stock_count"] += sign
+        product_stats = row["product_stats"]
+        product_count = product_stats.get(product_obj.name, 0) + sign
+        if product_count:
+            product_stats[product_obj.name] = product_count
+        else:
+            del product_stats[product_obj.name]
+        if not row["total_items"]:
+            del self._category_rollup[item_category]
+
+    def _validate_new_categories(self, categories: List[Dict[str, str]]) -> Set[str]:
+        """Check that a batch of categories can be added, raising ValueError for the first one that cannot.
+
+        Args:
+            categories: Categories to check, each a dict with a "name"
+
+        Returns:
+            Lowercase names of the new categories
+        """
+        new_categories: Set[str] = set()
+        for category in categories:
+            name_lower = category["name"].lower()
+            if name_lower in self._categories or name_lower in new_categories:
+                raise ValueError(f"Category '{category['name']}' already exists")
+            new_categories.add(name_lower)
+        return new_categories
+
+    def _validate_new_suppliers(self, supplier_objs: List[Supplier]) -> Set[str]:
+        """Check that a batch of suppliers can be added, raising ValueError for the first one that cannot.
+
+        Args:
+            supplier_objs: Suppliers to check
+
+        Returns:
+            IDs of the new suppliers
+        """
+        new_suppliers: Set[str] = set()
+        for supplier_obj in supplier_objs:
+            if supplier_obj.id in self._suppliers or supplier_obj.id in new_suppliers:
+                raise ValueError(f"Supplier with ID '{supplier_obj.id}' already exists")
+            new_suppliers.add(supplier_obj.id)
+        return new_suppliers
+
+    def _validate_new_supplier_products(
+        self, supplier_product_objs: List[SupplierProduct], new_products: Set[UUID], new_suppliers: Set[str]
+    ) -> None:
+        """Check that every supplier-product of a batch references an existing or new product and supplier.
+
+        Args:
+            supplier_product_objs: Supplier-product relationships to check
+            new_products: IDs of products added in the same batch
+            new_suppliers: IDs of suppliers added in the same batch
+        """
+        for supplier_product_obj in supplier_product_objs:
+            if (
+                supplier_product_obj.product_id not in self._products
+                and supplier_product_obj.product_id not in new_products
+            ):
+                raise ValueError(f"Product with ID '{supplier_product_obj.product_id}' does not exist")
+            if (
+                supplier_product_obj.supplier_id not in self._suppliers
+                and supplier_product_obj.supplier_id not in new_suppliers
+            ):
+                raise ValueError(f"Supplier with ID '{supplier_product_obj.supplier_id}' does not exist")
+
+    def _validate_new_inventory_items(self, inventory_item_objs: List[InventoryItem], new_products: Set[UUID]) -> None:
+        """Check that every inventory item of a batch references an existing or new product.
+
+        Args:
+            inventory_item_objs: Inventory items to check
+            new_products: IDs of products added in the same batch
+        """
+        for inventory_item_obj in inventory_item_objs:
+            if (
+                inventory_item_obj.product_id not in self._products
+                and inventory_item_obj.product_id not in new_products
+            ):
+                raise ValueError(f"Product with ID '{inventory_item_obj.product_id}' does not exist")
+
+    def add_bulk(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        categories: Optional[List[Dict[str, str]]] = None,
+        suppliers: Optional[List[Supplier]] = None,
+        products: Optional[List[Product]] = None,
+        supplier_products: Optional[List[SupplierProduct]] = None,
+        inventory_items: Optional[List[InventoryItem]] = None,
+    ) -> Dict[str, List[Any]]:
+        """Add categories, suppliers, products, supplier-products and inventory items in one batch.
+
+        Entities may reference others added in the same batch (e.g. a product in a new category, or an
+        inventory item for a new product). Every entity is validated before any is inserted, so an invalid
+        entry leaves the database unchanged, and the enriched view is invalidated only once.
+
+        Args:
+            categories: Categories to add, each a dict with a "name" and an optional "description"
+            suppliers: Suppliers to add
+            products: Products to add
+            supplier_products: Supplier-product relationships to add
+            inventory_items: Inventory items to add
+
+        Returns:
+            Dictionary with the added entities under the same keys as the arguments
+
+        Raises:
+            ValueError: If an entity already exists, repeats within the batch, or references one that does not exist
+        """
+        categories = categories or []
+        suppliers = suppliers or []
+        products = products or []
+        supplier_products = supplier_products or []
+        inventory_items = inventory_items or []
+
+        new_categories = self._validate_new_categories(categories)
+        new_suppliers = self._validate_new_suppliers(suppliers)
+        self._validate_new_products(products, new_categories)
+        new_products = {product_obj.id for product_obj in products}
+        self._validate_new_supplier_products(supplier_products, new_products, new_suppliers)
+        self._validate_new_inventory_items(inventory_items, new_products)
+
+        added_categories = []
+        for category in categories:
+            name_lower = category["name"].lower()
+            category_info = {"name": name_lower, "description": category.get("description") or ""}
+            self._categories[name_lower] = category_info
+            self._category_index[name_lower] = []
+            added_categories.append(category_info)
+        if added_categories:
+            self._categories_view = None
+
+        for supplier_obj in suppliers:
+            self._suppliers[supplier_obj.id] = supplier_obj
+
+        for product_obj in products:
+            self._insert_product(product_obj)
+
+        for supplier_product_obj in supplier_products:
+            self._insert_supplier_product(supplier_product_obj)
+
+        for inventory_item_obj in inventory_items:
+            self._inventory_items[inventory_item_obj.id] = inventory_item_obj
+            self._index_inventory_item(inventory_item_obj)
+            self._track_low_stock(inventory_item_obj)
+
+        self._invalidate_enriched_view()
+        return {
+            "categories": added_categories,
+            "suppliers": suppliers,
+            "products": products,
+            "supplier_products": supplier_products,
+            "inventory_items": inventory_items,
+        }
 
     # ==============================================================================
     # READ Methods - Query and Retrieval Operations
     # ==============================================================================
 
+    def _invalidate_enriched_view(self, keep_category_rollup: bool = False) -> None:
+        """Mark the enriched item view as stale. Called by every write that can change an enriched item.
+        Inventory item writes pass keep_category_rollup=True after updating the roll-up with _roll_up_item.
+        """
+        self._enriched_items = None
+        if not keep_category_rollup:
+            self._category_rollup = None
+
+    def _ensure_enriched_view(self) -> List[EnrichedInventoryItem]:
+        """Return all enriched items sorted by product name, rebuilding the view and its indexes if stale."""
+        if self._enriched_items is not None:
+            return self._enriched_items
+
+        # Join products and their primary supplier once per product rather than once per inventory item
+        primary_suppliers: Dict[UUID, Tuple[Optional[SupplierProduct], Optional[str]]] = {}
+        enriched_items = []
+        for inventory_item_obj in self._inventory_items.values():
+            product_obj = self._products.get(inventory_item_obj.product_id)
+            if not product_obj:
+                continue
+            primary_supplier = primary_suppliers.get(product_obj.id)
+            if primary_supplier is None:
+                primary_supplier = primary_suppliers[product_obj.id] = self._get_primary_supplier(product_obj.id)
+            enriched_items.append(self._build_enriched_item(inventory_item_obj, product_obj, *primary_supplier))
+        # Stable sort, so items of the same product keep their insertion order
+        enriched_items.sort(key=lambda x: x.name)
+
+        by_category: Dict[str, List[EnrichedInventoryItem]] = {}
+        by_product: Dict[UUID, List[EnrichedInventoryItem]] = {}
+        by_supplier_name: Dict[str, List[EnrichedInventoryItem]] = {}
+        for enriched_item in enriched_items:
+            by_category.setdefault(enriched_item.category, []).append(enriched_item)
+            by_product.setdefault(enriched_item.product_id, []).append(enriched_item)
+            if enriched_item.supplier_name:
+                by_supplier_name.setdefault(enriched_item.supplier_name.lower(), []).append(enriched_item)
+
+        self._enriched_by_category = by_category
+        self._enriched_by_product = by_product
+        self._enriched_by_supplier_name = by_supplier_name
+        self._enriched_items = enriched_items
+        return enriched_items
+
+    def _invalidate_product_views(self) -> None:
+        """Mark the name-sorted products and the search index as stale. Called by every product write."""
+        self._products_by_name = None
+        self._products_by_category = None
+        self._search_index = None
+
+    def _ensure_products_by_name(self) -> List[Product]:
+        """Return all products sorted by name, sorting them only if stale."""
+        if self._products_by_name is None:
+            self._products_by_name = sorted(self._products.values(), key=lambda x: x.name)
+        return self._products_by_name
+
+    def _ensure_products_by_category(self) -> Dict[str, List[Product]]:
+        """Return the products of each category in name order, grouping the name-sorted products only if stale."""
+        if self._products_by_category is None:
+            products_by_category: Dict[str, List[Product]] = {}
+            for product_obj in self._ensure_products_by_name():
+                products_by_category.setdefault(product_obj.category.lower(), []).append(product_obj)
+            self._products_by_category = products_by_category
+        return self._products_by_category
+
+    def _ensure_search_index(self) -> Dict[str, Set[int]]:
+        """Return the trigram index over product names, descriptions and SKUs, building it if stale."""
+        if self._search_index is None:
+            search_index: Dict[str, Set[int]] = {}
+            for position, product_obj in enumerate(self._ensure_products_by_name()):
+                for text in (product_obj.name, product_obj.description, product_obj.sku):
+                    if not text:
+                        continue
+                    text_lower = text.lower()
+                    for start in range(len(text_lower) - SEARCH_NGRAM_SIZE + 1):
+                        search_index.setdefault(text_lower[start : start + SEARCH_NGRAM_SIZE], set()).add(position)
+            self._search_index = search_index
+        return self._search_index
+
     def get_category_by_name(self, category_name: str) -> Optional[Dict[str, str]]:
         """Get category by name (case-insensitive).
         Args:
@@ -417,9 +880,14 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         """
         return self._categories.get(category_name.lower())
 
-    def list_categories(self) -> List[Dict[str, str]]:
-        """List all categories with names and descriptions."""
-        return sorted(self._categories.values(), key=lambda x: x["name"])
+    def list_categories(self) -> Tuple[Dict[str, str], ...]:
+        """List all categories with names and descriptions, sorted by name.
+
+        The same tuple is returned until a category is added or deleted, so callers must not modify it.
+        """
+        if self._categories_view is None:
+            self._categories_view = tuple(sorted(self._categories.values(), key=lambda x: x["name"]))
+        return self._categories_view
 
     def get_products_by_category(self, category: str) -> List[Product]:
         """Get products by product category.
@@ -431,10 +899,7 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         category_lower = category.lower()
         if category_lower not in self._categories:
             return []
-        return sorted(
-            [self._products[product_id] for product_id in self._category_index.get(category_lower, [])],
-            key=lambda x: x.name,
-        )
+        return list(self._ensure_products_by_category().get(category_lower, []))
 
     def get_category_stats(self) -> Dict[str, int]:
         """Get item count by category."""
@@ -454,6 +919,15 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         """
         return self._suppliers.get(supplier_id)
 
+    def get_products_by_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """Get several products by ID in one call.
+        Args:
+            product_ids: Product UUIDs to look up (duplicates and unknown IDs are ignored)
+        Returns:
+            Dictionary of the Product objects found, keyed by product ID
+        """
+        return {product_id: self._products[product_id] for product_id in product_ids if product_id in self._products}
+
     def get_supplier_by_name(self, supplier_name: str) -> Optional[Supplier]:
         """Get supplier by name (case-insensitive).
         Args:
@@ -481,14 +955,12 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         supplier_obj = self.get_supplier_by_name(supplier_name)
         if not supplier_obj:
             return []
-        items = []
-        for product_id, supplier_product_obj_ids in self._supplier_product_index.items():
-            for supplier_product_obj_id in supplier_product_obj_ids:
-                supplier_product_obj = self._supplier_products[supplier_product_obj_id]
-                if supplier_product_obj.supplier_id == supplier_obj.id:
-                    items.append(self._products[product_id])
-                    break
-        return sorted(items, key=lambda x: x.name)
+        # Collect the distinct product IDs from the supplier's relationships, then resolve them all at once
+        product_ids = {
+            supplier_product_obj.product_id
+            for supplier_product_obj in self.get_supplier_products_by_supplier_id(supplier_obj.id)
+        }
+        return sorted(self.get_products_by_ids(product_ids).values(), key=lambda x: x.name)
 
     def get_supplier_products_by_supplier_id(self, supplier_id: str) -> List[SupplierProduct]:
         """Get all supplier-product relationships for a specific supplier.
@@ -498,9 +970,8 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
             List of SupplierProduct objects for the specified supplier (empty if none found)
         """
         return [
-            supplier_product
-            for supplier_product in self._supplier_products.values()
-            if supplier_product.supplier_id == supplier_id
+            self._supplier_products[supplier_product_id]
+            for supplier_product_id in self._supplier_relationship_index.get(supplier_id, [])
         ]
 
     def get_supplier_products_by_product_id(self, product_id: UUID) -> List[SupplierProduct]:
@@ -515,9 +986,16 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
             for supplier_product_id in self._supplier_product_index.get(product_id, [])
         ]
 
-    def list_products(self) -> List[Product]:
-        """List all products in the inventory."""
-        return sorted(self._products.values(), key=lambda x: x.name)
+    def list_products(self, offset: int = 0, limit: Optional[int] = None) -> List[Product]:
+        """List products in the inventory, sorted by name.
+        Args:
+            offset: Number of products to skip
+            limit: Maximum number of products to return (all remaining products if None)
+        Returns:
+            List of Product objects; only the requested page is copied from the name-sorted view
+        """
+        products = self._ensure_products_by_name()
+        return products[offset:] if limit is None else products[offset : offset + limit]
 
     def get_enriched_inventory_item(self, inventory_id: UUID) -> Optional[EnrichedInventoryItem]:
         """Get enriched inventory item with product and supplier data.
@@ -534,22 +1012,28 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if not product_obj:
             return None
 
-        # Get primary supplier information
-        supplier_id = None
-        supplier_name = None
-        supplier_part_number = None
-        cost = None
+        return self._build_enriched_item(inventory_item_obj, product_obj, *self._get_primary_supplier(product_obj.id))
 
-        supplier_product_ids = self._supplier_product_index.get(product_obj.id, [])
-        for supplier_product_id in supplier_product_ids:
+    def _get_primary_supplier(self, product_id: UUID) -> Tuple[Optional[SupplierProduct], Optional[str]]:
+        """Return a product's primary supplier product and the supplier's name, or (None, None) if it has none."""
+        for supplier_product_id in self._supplier_product_index.get(product_id, []):
             supplier_product_obj = self._supplier_products.get(supplier_product_id)
             if supplier_product_obj and supplier_product_obj.is_primary_supplier:
-                supplier_id = supplier_product_obj.supplier_id
-                supplier_part_number = supplier_product_obj.supplier_part_number
-                cost = supplier_product_obj.cost
-                supplier_obj = self._suppliers.get(supplier_id)
-                supplier_name = supplier_obj.name if supplier_obj else None
-                break
+                supplier_obj = self._suppliers.get(supplier_product_obj.supplier_id)
+                return supplier_product_obj, supplier_obj.name if supplier_obj else None
+        return None, None
+
+    @staticmethod
+    def _build_enriched_item(
+        inventory_item_obj: InventoryItem,
+        product_obj: Product,
+        supplier_product_obj: Optional[SupplierProduct],
+        supplier_name: Optional[str],
+    ) -> EnrichedInventoryItem:
+        """Combine an inventory item with its product and primary supplier data into an enriched item."""
+        supplier_id = supplier_product_obj.supplier_id if supplier_product_obj else None
+        supplier_part_number = supplier_product_obj.supplier_part_number if supplier_product_obj else None
+        cost = supplier_product_obj.cost if supplier_product_obj else None
 
         # Calculate profit margin
         profit_margin = None
@@ -597,15 +1081,8 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         Returns:
             List of EnrichedInventoryItem objects (empty list if none found)
         """
-        items = []
-        # Find all inventory items for this product
-        for inventory_id, inv_product_id in self._inventory_product_index.items():
-            if inv_product_id == product_id:
-                item = self.get_enriched_inventory_item(inventory_id)
-                if item:
-                    items.append(item)
-
-        return items
+        self._ensure_enriched_view()
+        return list(self._enriched_by_product.get(product_id, []))
 
     def get_enriched_items_by_name(self, name: str) -> List[EnrichedInventoryItem]:
         """Get enriched inventory items by product name.
@@ -648,7 +1125,8 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         Returns:
             List of EnrichedInventoryItem objects in the specified category
         """
-        return self.list_enriched_items(category=category)
+        self._ensure_enriched_view()
+        return list(self._enriched_by_category.get(category, []))
 
     def get_enriched_items_by_supplier_name(self, supplier_name: str) -> List[EnrichedInventoryItem]:
         """Get enriched inventoryitems by supplier name.
@@ -657,11 +1135,34 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         Returns:
             List of EnrichedInventoryItem objects supplied by the specified supplier
         """
-        return self.list_enriched_items(supplier_name=supplier_name)
+        if not supplier_name:
+            return self.list_enriched_items()
+        self._ensure_enriched_view()
+
+        # Partial names match as in list_enriched_items(supplier_name=...), so take the bucket of every supplier
+        # whose name contains it. Each bucket is sorted by product name and a product has a single primary
+        # supplier, so merging the buckets by name gives the same order as filtering the whole view.
+        supplier_name_lower = supplier_name.lower()
+        buckets = [items for name, items in self._enriched_by_supplier_name.items() if supplier_name_lower in name]
+        if len(buckets) == 1:
+            return list(buckets[0])
+        return list(heapq.merge(*buckets, key=lambda x: x.name))
 
     def get_low_stock_items(self, category: Optional[str] = None) -> List[EnrichedInventoryItem]:
-        """Get enriched items that need to be reordered."""
-        return self.list_enriched_items(needs_reorder=True, category=category)
+        """Get enriched items that need to be reordered, sorted by product name.
+        Only the items in the low-stock id set are enriched, so the cost follows the number of low-stock items
+        rather than the size of the inventory, and no write forces a rebuild of the full enriched view.
+        """
+        low_stock_items = []
+        for inventory_id in self._low_stock_ids:
+            product_obj = self._products.get(self._inventory_product_index[inventory_id])
+            if not product_obj or (category and product_obj.category != category):
+                continue
+            enriched_item = self.get_enriched_inventory_item(inventory_id)
+            if enriched_item:
+                low_stock_items.append(enriched_item)
+        low_stock_items.sort(key=lambda x: (x.name, x.created_at))
+        return low_stock_items
 
     def list_enriched_items(
         self,
@@ -680,31 +1181,24 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         Returns:
             List of EnrichedInventoryItem objects filtered by the specified criteria and sorted by product name
         """
-        items = []
+        # The view is already sorted by product name, and a category bucket is the narrowest starting point
+        all_items = self._ensure_enriched_view()
+        candidates = self._enriched_by_category.get(category, []) if category else all_items
+        supplier_name_lower = supplier_name.lower() if supplier_name else None
 
-        for inventory_id, inventory_item_obj in self._inventory_items.items():
-            # Pre-filter on raw inventory data before expensive enrichment
-            if status and inventory_item_obj.status != status:
-                continue
-            if needs_reorder is not None and inventory_item_obj.needs_reorder != needs_reorder:
-                continue
-
-            # Only enrich items that passed pre-filters
-            enriched_item = self.get_enriched_inventory_item(inventory_id)
-            if not enriched_item:
+        items = []
+        for enriched_item in candidates:
+            if status and enriched_item.status != status:
                 continue
-
-            # Filter on enriched data (required for product category or supplier lookup)
-            if category and enriched_item.category != category:
+            if needs_reorder is not None and enriched_item.needs_reorder != needs_reorder:
                 continue
-            if supplier_name and (
-                not enriched_item.supplier_name or supplier_name.lower() not in enriched_item.supplier_name.lower()
+            if supplier_name_lower and (
+                not enriched_item.supplier_name or supplier_name_lower not in enriched_item.supplier_name.lower()
             ):
                 continue
-
             items.append(enriched_item)
 
-        return sorted(items, key=lambda x: x.name)
+        return items
 
     def search_enriched_items(self, query: str) -> List[EnrichedInventoryItem]:
         """Search enriched items by product name, description, or SKU.
@@ -713,23 +1207,42 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         Returns:
             List of EnrichedInventoryItem objects matching the search query and sorted by product name
         """
-        query_lower = query.lower()
-        results = []
+        return list(self.iter_search_enriched_items(query))
 
-        for inventory_id in self._inventory_items:
-            enriched_item = self.get_enriched_inventory_item(inventory_id)
-            if not enriched_item:
-                continue
+    def iter_search_enriched_items(self, query: str) -> Iterator[EnrichedInventoryItem]:
+        """Yield the items search_enriched_items(query) returns, one at a time and in the same order.
 
+        Candidates are matched lazily, so a caller that stops early does not check the remaining ones.
+        """
+        query_lower = query.lower()
+        self._ensure_enriched_view()
+        search_index = self._ensure_search_index()
+        products_by_name = self._ensure_products_by_name()
+
+        candidates = products_by_name
+        if len(query_lower) >= SEARCH_NGRAM_SIZE:
+            # Only products containing every trigram of the query can contain the query itself
+            postings = sorted(
+                (
+                    search_index.get(query_lower[start : start + SEARCH_NGRAM_SIZE], set())
+                    for start in range(len(query_lower) - SEARCH_NGRAM_SIZE + 1)
+                ),
+                key=len,
+            )
+            positions = postings[0].intersection(*postings[1:])
+            # Positions follow the product name order, so sorting them keeps the results sorted by product name
+            candidates = [products_by_name[position] for position in sorted(positions)]
+
+        matches = _compile_query(query)
+        for product_obj in candidates:
             # Check if query matches name, description, or SKU
-            name_match = query_lower in enriched_item.name.lower()
-            desc_match = enriched_item.description and query_lower in enriched_item.description.lower()
-            sku_match = enriched_item.sku and query_lower in enriched_item.sku.lower()
+            name_match = matches(product_obj.name)
+            desc_match = product_obj.description and matches(product_obj.description)
+            sku_match = product_obj.sku and matches(product_obj.sku)
 
             if name_match or desc_match or sku_match:
-                results.append(enriched_item)
-
-        return sorted(results, key=lambda x: x.name)
+                # The items of a product are adjacent in the name-sorted view, so this keeps the view order
+                yield from self._enriched_by_product.get(product_obj.id, [])
 
     def get_product_stats(self, category: str) -> Dict[str, int]:
         """Get item count by product within a specific category."""
@@ -742,16 +1255,99 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
                 stats[product_name] = stats.get(product_name, 0) + 1
         return stats
 
+    def _iter_items_with_products(self, category: Optional[str] = None) -> Iterator[Tuple[InventoryItem, Product]]:
+        """Yield (inventory item, product) pairs, optionally restricted to a category, without enrichment.
+
+        The category is matched exactly, like list_enriched_items(category=...).
+        """
+        for inventory_item_obj in self._inventory_items.values():
+            product_obj = self._products.get(inventory_item_obj.product_id)
+            if not product_obj:
+                continue
+            if category and product_obj.category != category:
+                continue
+            yield inventory_item_obj, product_obj
+
     def get_inventory_value(self, category: Optional[str] = None) -> Decimal:
         """Calculate total inventory value."""
-        all_items: Union[List[EnrichedInventoryItem], List[InventoryItem]]
+        all_items: Iterable[InventoryItem]
         if category:
-            all_items = self.list_enriched_items(category=category)
+            all_items = (item for item, _ in self._iter_items_with_products(category))
         else:
-            all_items = list(self._inventory_items.values())
-        total = sum(item.price * item.quantity_on_hand for item in all_items)
+            all_items = self._inventory_items.values()
+        total = sum((item.price * item.quantity_on_hand for item in all_items), Decimal(0))
         return Decimal(str(total))
 
+    def _ensure_category_rollup(self) -> Dict[str, Dict[str, Any]]:
+        """Return the inventory totals of each category, computing them in a single pass if stale.
+
+        Each row holds total_items, total_value, low_stock_count and product_stats (item count by product name).
+        """
+        if self._category_rollup is not None:
+            return self._category_rollup
+
+        rollup: Dict[str, Dict[str, Any]] = {}
+        for inventory_item_obj, product_obj in self._iter_items_with_products():
+            item_category = product_obj.category.lower()
+            row = rollup.get(item_category)
+            if row is None:
+                row = {"total_items": 0, "total_value": Decimal(0), "low_stock_count": 0, "product_stats": {}}
+                rollup[item_category] = row
+            row["total_items"] += 1
+            row["total_value"] += inventory_item_obj.price * inventory_item_obj.quantity_on_hand
+            if inventory_item_obj.needs_reorder:
+                row["low_stock_count"] += 1
+            product_stats = row["product_stats"]
+            product_stats[product_obj.name] = product_stats.get(product_obj.name, 0) + 1
+
+        self._category_rollup = rollup
+        return rollup
+
+    def get_overview_bundle(self, category: Optional[str] = None) -> Dict[str, Any]:
+        """Compute overview totals from the per-category roll-up, so repeated calls do not rescan the items.
+        Args:
+            category: Optional category name (case-insensitive) to restrict the totals to
+        Returns:
+            Dictionary with total_items, total_value, low_stock_count, category_stats (item count by category),
+            product_stats (item count by product name), and category_percentages and product_percentages
+            (share of total_items for each category and product)
+        """
+        rollup = self._ensure_category_rollup()
+        if category:
+            category_lower = category.lower()
+            rows = {category_lower: rollup[category_lower]} if category_lower in rollup else {}
+        else:
+            rows = rollup
+
+        total_items = 0
+        total_value = Decimal(0)
+        low_stock_count = 0
+        category_stats: Dict[str, int] = {}
+        product_stats: Dict[str, int] = {}
+        for row_category, row in rows.items():
+            total_items += row["total_items"]
+            total_value += row["total_value"]
+            low_stock_count += row["low_stock_count"]
+            category_stats[row_category] = row["total_items"]
+            product_stats.update(row["product_stats"])
+
+        return {
+            "total_items": total_items,
+            "total_value": total_value,
+            "low_stock_count": low_stock_count,
+            "category_stats": category_stats,
+            "product_stats": product_stats,
+            "category_percentages": self._percentages(category_stats, total_items),
+            "product_percentages": self._percentages(product_stats, total_items),
+        }
+
+    @staticmethod
+    def _percentages(counts: Dict[str, int], total: int) -> Dict[str, float]:
+        """Convert counts into percentages of a total, or zeros when the total is zero."""
+        if total <= 0:
+            return dict.fromkeys(counts, 0.0)
+        return {key: count / total * 100 for key, count in counts.items()}
+
     # ==============================================================================
     # UPDATE Methods - Data Modification Operations
     # ==============================================================================
@@ -831,6 +1427,7 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         updated_supplier = existing_supplier.model_copy(update=updates)
 
         self._suppliers[supplier_id] = updated_supplier
+        self._invalidate_enriched_view()
         return updated_supplier
 
     def update_product(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-branches
@@ -956,6 +1553,8 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
             self._category_index[new_category_lower].append(product_id)
 
         self._products[product_id] = updated_product
+        self._invalidate_product_views()
+        self._invalidate_enriched_view()
         return updated_product
 
     def update_supplier_product(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -1022,6 +1621,7 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         updated_supplier_product = existing_supplier_product.model_copy(update=updates)
 
         self._supplier_products[supplier_product_id] = updated_supplier_product
+        self._invalidate_enriched_view()
         return updated_supplier_product
 
     def update_inventory_item(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -1103,11 +1703,64 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if last_counted_at is not None:
             updates["last_counted_at"] = last_counted_at
 
+        updated_inventory_item = self._store_inventory_item_updates(existing_inventory_item, updates)
+        self._invalidate_enriched_view(keep_category_rollup=True)
+        return updated_inventory_item
+
+    def update_inventory_items(self, updates: List[Tuple[UUID, Dict[str, Any]]]) -> List[InventoryItem]:
+        """Update several inventory items in one batch.
+
+        Every item id is checked before any item is updated, so an unknown id leaves the database unchanged.
+        Derived views are invalidated once for the whole batch.
+
+        Args:
+            updates: (inventory_item_id, fields) pairs, where fields takes the keyword arguments of
+                update_inventory_item; fields set to None keep their current values
+
+        Returns:
+            The updated InventoryItem objects, in the given order
+
+        Raises:
+            ValueError: If an inventory item does not exist or a field cannot be updated
+
+        Example:
+            db.update_inventory_items([
+                (first_item_id, {"quantity_on_hand": 100, "last_restocked_at": datetime.now()}),
+                (second_item_id, {"price": Decimal("19.99")}),
+            ])
+        """
+        for inventory_item_id, fields in updates:
+            if inventory_item_id not in self._inventory_items:
+                raise ValueError(f"Inventory item with ID '{inventory_item_id}' does not exist")
+            unknown_fields = fields.keys() - _UPDATABLE_INVENTORY_ITEM_FIELDS
+            if unknown_fields:
+                raise ValueError(f"Inventory item fields {sorted(unknown_fields)} cannot be updated")
+
+        updated_inventory_items = []
+        for inventory_item_id, fields in updates:
+            # Read the stored item inside the loop, so repeated ids apply their updates in order
+            updated_inventory_items.append(
+                self._store_inventory_item_updates(
+                    self._inventory_items[inventory_item_id],
+                    {field: value for field, value in fields.items() if value is not None},
+                )
+            )
+        self._invalidate_enriched_view(keep_category_rollup=True)
+
+        return updated_inventory_items
+
+    def _store_inventory_item_updates(
+        self, existing_inventory_item: InventoryItem, updates: Dict[str, Any]
+    ) -> InventoryItem:
+        """Store a copy of an inventory item with the given fields changed, keeping the low-stock set and roll-up."""
         # Create updated inventory item using Pydantic's model_copy
         # This automatically updates the updated_at field via field validator
         updated_inventory_item = existing_inventory_item.model_copy(update=updates)
 
-        self._inventory_items[inventory_item_id] = updated_inventory_item
+        self._inventory_items[updated_inventory_item.id] = updated_inventory_item
+        self._track_low_stock(updated_inventory_item)
+        self._roll_up_item(existing_inventory_item, -1)
+        self._roll_up_item(updated_inventory_item, 1)
         return updated_inventory_item
 
     # ==============================================================================
@@ -1136,13 +1789,54 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if inventory_item_id not in self._inventory_items:
             raise ValueError(f"Inventory item with ID '{inventory_item_id}' does not exist")
 
-        # Remove from main storage
-        del self._inventory_items[inventory_item_id]
+        self._delete_inventory_items([inventory_item_id])
+        return True
 
-        # Clean up indexes
-        del self._inventory_product_index[inventory_item_id]
+    def delete_inventory_items(self, inventory_item_ids: List[UUID]) -> Dict[str, int]:
+        """Delete several inventory items in one batch.
 
-        return True
+        Every item id is checked before any item is deleted, so an unknown id leaves the database unchanged.
+        Repeated ids are deleted once, and derived views are invalidated once for the whole batch.
+
+        Args:
+            inventory_item_ids: Inventory item UUIDs to delete
+
+        Returns:
+            Dictionary with the count of deleted items:
+            {
+                "deleted_inventory_items": int
+            }
+
+        Raises:
+            ValueError: If an inventory item does not exist
+
+        Example:
+            result = db.delete_inventory_items([first_item_id, second_item_id])
+            print(f"Deleted {result['deleted_inventory_items']} inventory items")
+        """
+        unique_ids = list(dict.fromkeys(inventory_item_ids))
+        for inventory_item_id in unique_ids:
+            if inventory_item_id not in self._inventory_items:
+                raise ValueError(f"Inventory item with ID '{inventory_item_id}' does not exist")
+
+        return {"deleted_inventory_items": self._delete_inventory_items(unique_ids)}
+
+    def _delete_inventory_items(self, inventory_item_ids: List[UUID]) -> int:
+        """Delete existing inventory items in one batch, invalidating the enriched view once.
+
+        This is the only place inventory items are removed, for single deletes and cascades alike.
+
+        Returns:
+            The number of deleted inventory items
+        """
+        if not inventory_item_ids:
+            return 0
+        for inventory_item_id in inventory_item_ids:
+            self._roll_up_item(self._inventory_items.pop(inventory_item_id), -1)
+            self._unindex_inventory_item(inventory_item_id)
+            self._low_stock_ids.discard(inventory_item_id)
+        self._invalidate_enriched_view(keep_category_rollup=True)
+        return len(inventory_item_ids)
 
     def delete_supplier_product(self, supplier_product_id: UUID) -> bool:
         """Delete a supplier-product relationship.
@@ -1162,17 +1856,43 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if supplier_product_id not in self._supplier_products:
             raise ValueError(f"Supplier-Product relationship with ID '{supplier_product_id}' does not exist")
 
-        # Get the relationship before deleting
-        supplier_product = self._supplier_products[supplier_product_id]
+        self._delete_supplier_products([supplier_product_id])
+        return True
 
-        # Remove from main storage
-        del self._supplier_products[supplier_product_id]
+    def _delete_supplier_products(self, supplier_product_ids: List[UUID]) -> int:
+        """Delete existing supplier-product relationships in one batch.
 
-        # Clean up indexes - remove from product's supplier list
-        if supplier_product.product_id in self._supplier_product_index:
-            self._supplier_product_index[supplier_product.product_id].remove(supplier_product_id)
+        This is the only place relationships are removed, for single deletes and cascades alike. The per-product
+        and per-supplier indexes are filtered once per affected list, and the enriched view is invalidated once.
 
-        return True
+        Returns:
+            The number of deleted relationships
+        """
+        if not supplier_product_ids:
+            return 0
+        doomed_ids = set(supplier_product_ids)
+        affected_products = set()
+        affected_suppliers = set()
+        for supplier_product_id in supplier_product_ids:
+            supplier_product = self._supplier_products.pop(supplier_product_id)
+            affected_products.add(supplier_product.product_id)
+            affected_suppliers.add(supplier_product.supplier_id)
+        self._invalidate_enriched_view()
+
+        for product_id in affected_products:
+            if product_id in self._supplier_product_index:
+                self._supplier_product_index[product_id] = [
+                    sp_id for sp_id in self._supplier_product_index[product_id] if sp_id not in doomed_ids
+                ]
+        for supplier_id in affected_suppliers:
+            remaining_ids = [
+                sp_id for sp_id in self._supplier_relationship_index[supplier_id] if sp_id not in doomed_ids
+            ]
+            if remaining_ids:
+                self._supplier_relationship_index[supplier_id] = remaining_ids
+            else:
+                del self._supplier_relationship_index[supplier_id]
+        return len(supplier_product_ids)
 
     def delete_product(self, product_id: UUID) -> Dict[str, int]:
         """Delete a product and all related data (CASCADE).
@@ -1203,48 +1923,48 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if product_id not in self._products:
             raise ValueError(f"Product with ID '{product_id}' does not exist")
 
-        product = self._products[product_id]
-        deleted_counts = {
-            "deleted_supplier_products": 0,
-            "deleted_inventory_items": 0,
-            "deleted_product": 0,
-        }
+        # CASCADE: Delete the product with its supplier-product relationships and inventory items
+        deleted_supplier_products, deleted_inventory_items = self._delete_products({product_id})
 
-        # CASCADE: Delete all supplier-product relationships for this product
-        # Collect IDs first to avoid modifying dict during iteration
-        supplier_product_ids = list(self._supplier_product_index.get(product_id, []))
-        for sp_id in supplier_product_ids:
-            self.delete_supplier_product(sp_id)
-            deleted_counts["deleted_supplier_products"] += 1
-
-        # CASCADE: Delete all inventory items for this product
-        # Collect IDs first to avoid modifying dict during iteration
-        inventory_item_ids = [
-            inv_id for inv_id, prod_id in self._inventory_product_index.items() if prod_id == product_id
-        ]
-        for inv_id in inventory_item_ids:
-            self.delete_inventory_item(inv_id)
-            deleted_counts["deleted_inventory_items"] += 1
-
-        # Remove from main storage
-        del self._products[product_id]
+        return {
+            "deleted_supplier_products": deleted_supplier_products,
+            "deleted_inventory_items": deleted_inventory_items,
+            "deleted_product": 1,
+        }
 
-        # Clean up indexes
-        if product.name in self._product_name_index:
-            del self._product_name_index[product.name]
+    def _delete_products(self, product_ids: Set[UUID]) -> Tuple[int, int]:
+        """Delete existing products with all their supplier-product relationships and inventory items.
 
-        if product.sku and product.sku in self._product_sku_index:
-            del self._product_sku_index[product.sku]
+        Each dependent table is cleaned up once for the whole batch, children first, rather than once per product.
 
-        category_lower = product.category.lower()
-        if category_lower in self._category_index and product_id in self._category_index[category_lower]:
-            self._category_index[category_lower].remove(product_id)
+        Returns:
+            The numbers of deleted supplier-product relationships and inventory items
+        """
+        deleted_supplier_products = self._delete_supplier_products(
+            [sp_id for product_id in product_ids for sp_id in self._supplier_product_index.get(product_id, [])]
+        )
 
-        if product_id in self._supplier_product_index:
-            del self._supplier_product_index[product_id]
+        deleted_inventory_items = self._delete_inventory_items(
+            [inv_id for product_id in product_ids for inv_id in self._product_inventory_index.get(product_id, ())]
+        )
 
-        deleted_counts["deleted_product"] = 1
-        return deleted_counts
+        affected_categories = set()
+        for product_id in product_ids:
+            product = self._products.pop(product_id)
+            if product.name in self._product_name_index:
+                del self._product_name_index[product.name]
+            if product.sku and product.sku in self._product_sku_index:
+                del self._product_sku_index[product.sku]
+            self._supplier_product_index.pop(product_id, None)
+            affected_categories.add(product.category.lower())
+        for category_lower in affected_categories:
+            if category_lower in self._category_index:
+                self._category_index[category_lower] = [
+                    prod_id for prod_id in self._category_index[category_lower] if prod_id not in product_ids
+                ]
+        self._invalidate_product_views()
+
+        return deleted_supplier_products, deleted_inventory_items
 
     def delete_supplier(self, supplier_id: str) -> Dict[str, int]:
         """Delete a supplier and all related relationships (CASCADE).
@@ -1273,22 +1993,14 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if supplier_id not in self._suppliers:
             raise ValueError(f"Supplier with ID '{supplier_id}' does not exist")
 
-        deleted_counts = {"deleted_supplier_products": 0, "deleted_supplier": 0}
-
-        # CASCADE: Delete all supplier-product relationships for this supplier
-        # Collect IDs first to avoid modifying dict during iteration
-        supplier_product_ids = [
-            sp_id for sp_id, sp in self._supplier_products.items() if sp.supplier_id == supplier_id
-        ]
-        for sp_id in supplier_product_ids:
-            self.delete_supplier_product(sp_id)
-            deleted_counts["deleted_supplier_products"] += 1
+        # CASCADE: Delete all supplier-product relationships for this supplier in one batch
+        supplier_product_ids = list(self._supplier_relationship_index.get(supplier_id, []))
+        deleted_supplier_products = self._delete_supplier_products(supplier_product_ids)
 
         # Remove from main storage
         del self._suppliers[supplier_id]
 
-        deleted_counts["deleted_supplier"] = 1
-        return deleted_counts
+        return {"deleted_supplier_products": deleted_supplier_products, "deleted_supplier": 1}
 
     def delete_category(self, name: str) -> Dict[str, int]:
         """Delete a category and all related data (CASCADE).
@@ -1322,31 +2034,24 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes,too-man
         if name_lower not in self._categories:
             raise ValueError(f"Category '{name}' does not exist")
 
-        deleted_counts = {
-            "deleted_products": 0,
-            "deleted_supplier_products": 0,
-            "deleted_inventory_items": 0,
-            "deleted_category": 0,
-        }
-
-        # CASCADE: Delete all products in this category (which cascades further)
-        # Collect IDs first to avoid modifying dict during iteration
-        product_ids = list(self._category_index.get(name_lower, []))
-        for product_id in product_ids:
-            result = self.delete_product(product_id)
-            deleted_counts["deleted_products"] += 1
-            deleted_counts["deleted_supplier_products"] += result["deleted_supplier_products"]
-            deleted_counts["deleted_inventory_items"] += result["deleted_inventory_items"]
+        # CASCADE: Delete all products in this category, with their dependents, in one batch
+        product_ids = set(self._category_index.get(name_lower, []))
+        deleted_supplier_products, deleted_inventory_items = self._delete_products(product_ids)
 
         # Remove from main storage
         del self._categories[name_lower]
+        self._categories_view = None
 
         # Clean up indexes
         if name_lower in self._category_index:
             del self._category_index[name_lower]
 
-        deleted_counts["deleted_category"] = 1
-        return deleted_counts
+        return {
+            "deleted_products": len(product_ids),
+            "deleted_supplier_products": deleted_supplier_products,
+            "deleted_inventory_items": deleted_inventory_items,
+            "deleted_category": 1,
+        }
 
 
 # Module-level database instance
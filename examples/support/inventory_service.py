@@ -0,0 +1,494 @@
+"""Inventory service layer shared by the resource and tool servers.
+
+Functions take plain, already decoded arguments and return models or user-facing messages;
+lookups that match nothing raise NotFoundError with the message instead. Each server only adds
+its own transport concerns (e.g. URL decoding of resource parameters).
+Read results are cached for a short time, and statistics until the next mutation;
+clear_cache() must be called after any database mutation, and starts a new cache epoch.
+"""
+
+import functools
+import hashlib
+import math
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from mcp.types import ResourceLink
+
+
+try:
+    from .inventory_db import (
+        CategoryStatistics,
+        DatabaseSchema,
+        EnrichedInventoryItem,
+        InventoryOverview,
+        Product,
+        Supplier,
+        db,
+    )
+except ImportError:
+    from examples.support.inventory_db import (
+        CategoryStatistics,
+        DatabaseSchema,
+        EnrichedInventoryItem,
+        InventoryOverview,
+        Product,
+        Supplier,
+        db,
+    )
+
+T = TypeVar("T")
+
+
+class NotFoundError(Exception):
+    """Raised when a category, supplier, product or search matches nothing; the message is meant for the user."""
+
+
+# Read-only results are reused for this long unless a mutation starts a new cache epoch first
+CACHE_TTL_SECONDS = 60.0
+CACHE_MAX_ENTRIES = 256
+
+
+class CacheEpoch:
+    """Version of the data shared by every result cache, bumped once per mutation by clear_cache().
+
+    Cached results remember the epoch they were computed in and are only served in that epoch, so an
+    invalidation is a single increment instead of clearing (and locking) each cache.
+    """
+
+    value = 0
+
+
+class ResultCache:
+    """Thread-safe TTL cache for read-only service results with LRU eviction, and hit and miss counters.
+
+    Entries from an earlier CacheEpoch are never served; they are replaced on their next lookup or evicted
+    as least recently used.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, int, Any]] = {}  # key -> (expiry, epoch, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached value for key, calling compute() on a miss, after expiry or in a new epoch."""
+        epoch = CacheEpoch.value
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == epoch and entry[0] > time.monotonic():
+                self.hits += 1
+                # Move the entry to the end, so the least recently used one is evicted first
+                self._entries[key] = self._entries.pop(key)
+                return entry[2]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            # A result computed while a mutation started a new epoch may already be stale, so it is not stored
+            if epoch == CacheEpoch.value:
+                self._entries.pop(key, None)
+                if len(self._entries) >= self._maxsize:
+                    # Entries are kept in order of last use, so the first one is the least recently used
+                    del self._entries[next(iter(self._entries))]
+                self._entries[key] = (time.monotonic() + self._ttl, epoch, value)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and size counters, where size only counts results of the current epoch."""
+        epoch = CacheEpoch.value
+        with self._lock:
+            size = sum(1 for entry in self._entries.values() if entry[1] == epoch)
+            return {"hits": self.hits, "misses": self.misses, "size": size, "maxsize": self._maxsize}
+
+
+_RESULT_CACHE = ResultCache(ttl=CACHE_TTL_SECONDS, maxsize=CACHE_MAX_ENTRIES)
+
+# Statistics only change when the data does, so they never expire: a new cache epoch is their only invalidation
+_STATS_CACHE = ResultCache(ttl=math.inf, maxsize=CACHE_MAX_ENTRIES)
+
+
+def cached(func: Callable[..., T]) -> Callable[..., T]:
+    """Cache a read-only service function by function name and arguments."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        return _RESULT_CACHE.get_or_compute(key, lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+def stats_cached(func: Callable[..., T]) -> Callable[..., T]:
+    """Cache a statistics function by function name and arguments until the next clear_cache()."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        return _STATS_CACHE.get_or_compute(key, lambda: func(*args, **kwargs))
+
+    return wrapper
+
+
+def clear_cache() -> None:
+    """Invalidate all cached results by starting a new cache epoch. Must be called after any database mutation."""
+    CacheEpoch.value += 1
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Return the hit, miss and size counters of the result and statistics caches combined."""
+    result_stats = _RESULT_CACHE.stats()
+    stats_stats = _STATS_CACHE.stats()
+    return {name: count + stats_stats[name] for name, count in result_stats.items()}
+
+
+# Valid category names, their display titles and the "invalid name" messages, rebuilt lazily in a new cache epoch
+_VALID_CATEGORY_NAMES: FrozenSet[str] = frozenset()
+_TITLED: Dict[str, str] = {}
+_CATEGORIES_ERROR_MSG = ""
+_SUPPLIERS_ERROR_MSG = ""
+_CATALOGS_EPOCH = -1
+
+
+def _refresh_catalogs() -> None:
+    global _VALID_CATEGORY_NAMES, _TITLED, _CATEGORIES_ERROR_MSG, _SUPPLIERS_ERROR_MSG, _CATALOGS_EPOCH
+    if _CATALOGS_EPOCH == CacheEpoch.value:
+        return
+    _CATALOGS_EPOCH = CacheEpoch.value
+    category_names = [cat["name"] for cat in db.list_categories()]
+    _VALID_CATEGORY_NAMES = frozenset(category_names)
+    _TITLED = {name: name.title() for name in category_names}
+    _CATEGORIES_ERROR_MSG = f"Invalid category. Valid categories: {', '.join(category_names)}"
+    supplier_names = [supplier.name for supplier in db.list_suppliers()]
+    _SUPPLIERS_ERROR_MSG = f"Invalid supplier name. Valid supplier names: {', '.join(supplier_names)}"
+
+
+# Define all entities with their field types
+_SCHEMA_ENTITIES = {
+    "Category": {
+        "name": "str (Primary Key)",
+        "description": "Optional[str]",
+    },
+    "Supplier": {
+        "id": "str (Primary Key)",
+        "name": "str",
+        "contact_email": "Optional[str]",
+        "contact_phone": "Optional[str]",
+        "address": "Optional[str]",
+        "created_at": "datetime",
+        "updated_at": "datetime",
+    },
+    "Product": {
+        "id": "UUID (Primary Key)",
+        "name": "str",
+        "description": "Optional[str]",
+        "category": "str (Enum)",
+        "sku": "Optional[str]",
+        "barcode": "Optional[str]",
+        "weight": "Optional[Decimal]",
+        "dimensions": "Optional[str]",
+        "created_at": "datetime",
+        "updated_at": "datetime",
+    },
+    "SupplierProduct": {
+        "id": "UUID (Primary Key)",
+        "product_id": "UUID (Foreign Key → Product.id)",
+        "supplier_id": "str (Foreign Key → Supplier.id)",
+        "supplier_part_number": "Optional[str]",
+        "cost": "Optional[Decimal]",
+        "lead_time_days": "Optional[int]",
+        "minimum_order_quantity": "Optional[int]",
+        "is_primary_supplier": "bool",
+        "created_at": "datetime",
+        "updated_at": "datetime",
+    },
+    "InventoryItem": {
+        "id": "UUID (Primary Key)",
+        "product_id": "UUID (Foreign Key → Product.id)",
+        "location_id": "Optional[str]",
+        "status": "ItemStatus (Enum)",
+        "price": "Decimal",
+        "quantity_on_hand": "int",
+        "quantity_reserved": "int",
+        "quantity_allocated": "int",
+        "reorder_point": "int",
+        "max_stock": "int",
+        "created_at": "datetime",
+        "updated_at": "datetime",
+        "last_restocked_at": "Optional[datetime]",
+        "last_counted_at": "Optional[datetime]",
+    },
+    "EnrichedInventoryItem": {
+        "description": "View model combining data from all entities",
+        "note": "Used for API responses - not stored in database",
+    },
+}
+
+# Define relationships between entities
+_SCHEMA_RELATIONSHIPS = [
+    {
+        "from": "SupplierProduct",
+        "to": "Supplier",
+        "type": "Many-to-One",
+        "foreign_key": "supplier_id → Supplier.id",
+        "description": "Each supplier-product relationship belongs to one supplier",
+    },
+    {
+        "from": "SupplierProduct",
+        "to": "Product",
+        "type": "Many-to-One",
+        "foreign_key": "product_id → Product.id",
+        "description": "Each supplier-product relationship belongs to one product",
+    },
+    {
+        "from": "InventoryItem",
+        "to": "Product",
+        "type": "Many-to-One",
+        "foreign_key": "product_id → Product.id",
+        "description": "Each inventory item tracks stock for one product",
+    },
+    {
+        "from": "Supplier",
+        "to": "Product",
+        "type": "Many-to-Many",
+        "through": "SupplierProduct",
+        "description": "Suppliers can supply multiple products, products can have multiple suppliers",
+    },
+]
+
+# Define database indexes for performance
+_SCHEMA_INDEXES = {
+    "primary_keys": ["Supplier.id", "Product.id", "SupplierProduct.id", "InventoryItem.id"],
+    "foreign_key_indexes": [
+        "SupplierProduct.product_id",
+        "SupplierProduct.supplier_id",
+        "InventoryItem.product_id",
+    ],
+    "business_logic_indexes": [
+        "Product.name",
+        "Product.sku",
+        "Product.category",
+        "InventoryItem.status",
+        "InventoryItem.needs_reorder (computed)",
+    ],
+}
+
+# The schema is static, so it is built and validated once at import and shared by every request
+_SCHEMA_SINGLETON = DatabaseSchema(
+    entities=_SCHEMA_ENTITIES,
+    relationships=_SCHEMA_RELATIONSHIPS,
+    indexes=_SCHEMA_INDEXES,
+    normalization_level="Third Normal Form (3NF)",
+    description=(
+        "Fully normalized inventory management database schema. Eliminates all redundancy by separating "
+        "concerns into distinct entities: Supplier (vendor data), Product (item master data), "
+        "SupplierProduct (supplier-product relationships with pricing), and InventoryItem (stock tracking). "
+        "The EnrichedInventoryItem model provides a denormalized view for API consumption, combining data "
+        "from all entities."
+    ),
+)
+
+
+@stats_cached
+def get_inventory_overview() -> InventoryOverview:
+    """Return the inventory overview."""
+    bundle = db.get_overview_bundle()
+    return InventoryOverview(
+        total_items=bundle["total_items"],
+        total_value=bundle["total_value"],
+        low_stock_count=bundle["low_stock_count"],
+        category_stats=bundle["category_stats"],
+        category_percentages=bundle["category_percentages"],
+    )
+
+
+def get_database_schema() -> DatabaseSchema:
+    """Return the complete database schema definition."""
+    return _SCHEMA_SINGLETON
+
+
+def list_categories() -> Tuple[Dict[str, str], ...]:
+    """Return all valid product categories with names and descriptions (shared, not to be modified)."""
+    return db.list_categories()
+
+
+@stats_cached
+def get_category_statistics(category: str) -> CategoryStatistics:
+    """Return statistics for one category."""
+    bundle = db.get_overview_bundle(category=category)
+    return CategoryStatistics(
+        total_items=bundle["total_items"],
+        total_value=bundle["total_value"],
+        low_stock_count=bundle["low_stock_count"],
+        product_stats=bundle["product_stats"],
+        product_percentages=bundle["product_percentages"],
+    )
+
+
+def get_products_by_category(category: str) -> List[Product]:
+    """Return the products in a category, raising NotFoundError if the category is invalid or empty."""
+    category_lower = category.lower()
+    _refresh_catalogs()
+    if category_lower not in _VALID_CATEGORY_NAMES:
+        raise NotFoundError(_CATEGORIES_ERROR_MSG)
+    products = db.get_products_by_category(category=category_lower)
+
+    if not products:
+        raise NotFoundError(f"No products found in category '{_TITLED[category_lower]}'.")
+
+    return products
+
+
+def get_items_by_category(category: str) -> List[EnrichedInventoryItem]:
+    """Return the inventory items in a category, raising NotFoundError if the category is invalid or empty."""
+    category_lower = category.lower()
+    _refresh_catalogs()
+    if category_lower not in _VALID_CATEGORY_NAMES:
+        raise NotFoundError(_CATEGORIES_ERROR_MSG)
+    items = db.get_enriched_items_by_category(category=category_lower)
+
+    if not items:
+        raise NotFoundError(f"No items found in category '{_TITLED[category_lower]}'.")
+
+    return items
+
+
+@cached
+def list_suppliers() -> List[Supplier]:
+    """Return all suppliers."""
+    return db.list_suppliers()
+
+
+def get_products_by_supplier(supplier_name: str) -> List[Product]:
+    """Return the products of a supplier, raising NotFoundError if none are found."""
+    try:
+        products = db.get_products_by_supplier_name(supplier_name)
+    except ValueError:
+        _refresh_catalogs()
+        raise NotFoundError(_SUPPLIERS_ERROR_MSG) from None
+
+    if not products:
+        raise NotFoundError(f"No products found for supplier '{supplier_name}'.")
+
+    return products
+
+
+def get_items_by_supplier(supplier_name: str) -> List[EnrichedInventoryItem]:
+    """Return the inventory items of a supplier, raising NotFoundError if none are found."""
+    try:
+        items = db.get_enriched_items_by_supplier_name(supplier_name)
+    except ValueError:
+        _refresh_catalogs()
+        raise NotFoundError(_SUPPLIERS_ERROR_MSG) from None
+
+    if not items:
+        raise NotFoundError(f"No items found for supplier '{supplier_name}'.")
+
+    return items
+
+
+@cached
+def list_products(offset: int = 0, limit: Optional[int] = None) -> List[Product]:
+    """Return the products sorted by name, or one page of them."""
+    return db.list_products(offset, limit)
+
+
+def get_items_by_name(product_name: str) -> List[EnrichedInventoryItem]:
+    """Return the inventory items of the product with this exact name, raising NotFoundError if there is none."""
+    items = db.get_enriched_items_by_name(product_name)
+
+    if not items:
+        raise NotFoundError(f"Item '{product_name}' not found.")
+
+    return items
+
+
+@cached
+def _search_items(query_lower: str) -> List[EnrichedInventoryItem]:
+    return db.search_enriched_items(query_lower)
+
+
+def search_inventory(query: str) -> List[EnrichedInventoryItem]:
+    """Return the items whose product name, description or SKU contains query, raising NotFoundError if none match."""
+    # Matching ignores case, so queries that differ only in case share one cached result
+    items = _search_items(query.lower())
+
+    if not items:
+        raise NotFoundError(f"No items found matching '{query}'.")
+
+    return items
+
+
+def get_low_stock_items() -> Union[List[EnrichedInventoryItem], str]:
+    """Return the items that need to be reordered, or a message if every item is adequately stocked."""
+    items = db.get_low_stock_items()
+
+    if not items:
+        return "✅ All items are adequately stocked!"
+
+    return items
+
+
+# Item lists longer than this are stored server-side and returned as a link to fetch them on demand
+LARGE_RESULT_THRESHOLD = 50
+RESULT_STORE_TTL_SECONDS = 300.0
+
+_RESULT_STORE: Dict[str, Tuple[float, List[EnrichedInventoryItem]]] = {}
+_RESULT_STORE_LOCK = threading.Lock()
+
+
+def link_large_result(
+    handler: str, params: str, result: Union[List[EnrichedInventoryItem], str]
+) -> Union[List[EnrichedInventoryItem], str, ResourceLink]:
+    """Return a small result (or a message) unchanged, or store a large one and return a link to it.
+
+    Args:
+        handler: Name of the handler that produced the result
+        params: Handler parameters, used with the handler name to key the stored result
+        result: Items returned by the handler, or a user-facing message
+    Returns:
+        The result itself, or a ResourceLink to inventory://results/{key} if it has more than
+        LARGE_RESULT_THRESHOLD items. The stored items can be read once before they expire.
+    """
+    if isinstance(result, str) or len(result) <= LARGE_RESULT_THRESHOLD:
+        return result
+
+    key = hashlib.sha1(f"{handler}:{params}".encode(), usedforsecurity=False).hexdigest()
+    now = time.monotonic()
+    with _RESULT_STORE_LOCK:
+        for expired_key in [k for k, (expires_at, _) in _RESULT_STORE.items() if expires_at <= now]:
+            del _RESULT_STORE[expired_key]
+        _RESULT_STORE[key] = (now + RESULT_STORE_TTL_SECONDS, result)
+
+    return ResourceLink(
+        type="resource_link",
+        name=f"{handler} results",
+        uri=f"inventory://results/{key}",  # type: ignore[arg-type]
+        description=f"{len(result)} items",
+        mimeType="application/json",
+    )
+
+
+def pop_stored_result(key: str) -> Union[List[EnrichedInventoryItem], str]:
+    """Return and forget the items stored under key by link_large_result, or a message if there are none."""
+    with _RESULT_STORE_LOCK:
+        entry = _RESULT_STORE.pop(key, None)
+    if entry is None or entry[0] <= time.monotonic():
+        return f"No stored result found for key '{key}'. It may have expired or already been retrieved."
+    return entry[1]
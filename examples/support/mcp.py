@@ -4,19 +4,17 @@ This module provides shared functionality for handling MCP content blocks,
 converting between MCP and OpenAI formats, and user interaction helpers.
 """
 
+import asyncio
+import io
+import sys
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Union,
 )
 
-from examples.support.media_handler import (
-    decode_binary_file,
-    display_content_from_uri,
-    display_image_content,
-    play_audio_content,
-)
 from mcp.types import (
     AudioContent,
     CallToolResult,
@@ -30,6 +28,60 @@ from mcp.types import (
 from mcp_multi_server.utils import extract_template_variables
 
 
+# Text results are written without flushing; callers flush once per logical unit (e.g. a full tool result)
+def _display_text(content_block: TextContent) -> None:
+    sys.stdout.write(f"[Result] {content_block.text}\n\n")
+
+
+def _display_image(content_block: ImageContent) -> None:
+    # Media helpers (PIL and friends) are imported only when media is actually displayed
+    from examples.support.media_handler import display_image_content
+
+    print("[Result] Image content received")
+    display_image_content(content_block)
+
+
+def _display_audio(content_block: AudioContent) -> None:
+    from examples.support.media_handler import play_audio_content
+
+    print(f"[Result] Audio content received ({content_block.mimeType})")
+    play_audio_content(content_block)
+
+
+def _display_embedded_resource(content_block: EmbeddedResource) -> None:
+    text = getattr(content_block.resource, "text", None)
+    if text is not None:
+        sys.stdout.write(f"[Result] Embedded resource text: {text}\n\n")
+    else:
+        print("[Result] Embedded resource blob")
+        filename = input("Enter filename to save embedded resource (or press Enter to skip): ").strip()
+        if filename:
+            from examples.support.media_handler import decode_binary_file
+
+            decode_binary_file(content_block, filename)
+
+
+def _display_resource_link(content_block: ResourceLink) -> None:
+    from examples.support.media_handler import display_content_from_uri
+
+    print(f"[Result] Resource link: {content_block.uri}")
+    display_content_from_uri(content_block)
+
+
+def _display_unknown(content_block: Any) -> None:
+    sys.stdout.write(f"[Result] {str(content_block)[:80]}\n\n")
+
+
+# Content block handlers keyed by concrete type (MCP content types are leaf classes)
+_DISPLAY_HANDLERS: Dict[type, Callable[[Any], None]] = {
+    TextContent: _display_text,
+    ImageContent: _display_image,
+    AudioContent: _display_audio,
+    EmbeddedResource: _display_embedded_resource,
+    ResourceLink: _display_resource_link,
+}
+
+
 def handle_content_block(
     content_block: ContentBlock,
 ) -> None:
@@ -38,29 +90,43 @@ def handle_content_block(
     Args:
         content_block: Content block from MCP tool result or prompt.
     """
-    if isinstance(content_block, TextContent):
-        print(f"[Result] {content_block.text}\n")
-    elif isinstance(content_block, ImageContent):
-        print("[Result] Image content received")
-        display_image_content(content_block)
-    elif isinstance(content_block, AudioContent):
-        print(f"[Result] Audio content received ({content_block.mimeType})")
-        play_audio_content(content_block)
-    elif isinstance(content_block, EmbeddedResource):
-        if hasattr(content_block.resource, "text"):
-            print(f"[Result] Embedded resource text: {content_block.resource.text}\n")
-        else:
-            print("[Result] Embedded resource blob")
-            filename = input("Enter filename to save embedded resource (or press Enter to skip): ").strip()
-            if filename:
-                decode_binary_file(content_block, filename)
-    elif isinstance(content_block, ResourceLink):
-        print(f"[Result] Resource link: {content_block.uri}")
-        display_content_from_uri(content_block)
-    else:
-        # Unknown content type
-        content_block_text = str(content_block)
-        print(f"[Result] {content_block_text[:min(80, len(content_block_text))]}\n")
+    _DISPLAY_HANDLERS.get(type(content_block), _display_unknown)(content_block)
+
+
+def _text_to_tool(content_block: TextContent) -> Dict[str, Any]:
+    return {"type": "text", "text": content_block.text}
+
+
+def _image_to_tool(content_block: ImageContent) -> Dict[str, Any]:
+    return {"type": "text", "text": f"[Image: {content_block.mimeType} received]"}
+
+
+def _audio_to_tool(content_block: AudioContent) -> Dict[str, Any]:
+    return {"type": "text", "text": f"[Audio: {content_block.mimeType} received]"}
+
+
+def _embedded_resource_to_tool(content_block: EmbeddedResource) -> Dict[str, Any]:
+    text = getattr(content_block.resource, "text", None)
+    if text is not None:
+        return {"type": "text", "text": text}
+    return {"type": "text", "text": "[Embedded resource: binary data received]"}
+
+
+def _resource_link_to_tool(content_block: ResourceLink) -> Dict[str, Any]:
+    return {"type": "text", "text": f"[Resource link: {content_block.uri}]"}
+
+
+def _unknown_to_tool(content_block: Any) -> Dict[str, Any]:
+    return {"type": "text", "text": str(content_block)[:80]}
+
+
+_TOOL_RESPONSE_HANDLERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    TextContent: _text_to_tool,
+    ImageContent: _image_to_tool,
+    AudioContent: _audio_to_tool,
+    EmbeddedResource: _embedded_resource_to_tool,
+    ResourceLink: _resource_link_to_tool,
+}
 
 
 def convert_mcp_content_to_tool_response(
@@ -77,26 +143,51 @@ def convert_mcp_content_to_tool_response(
     Returns:
         Dict with 'type' and 'text' keys, suitable for OpenAI tool messages.
     """
-    if isinstance(content_block, TextContent):
-        return {"type": "text", "text": content_block.text}
+    return _TOOL_RESPONSE_HANDLERS.get(type(content_block), _unknown_to_tool)(content_block)
+
+
+def _text_to_message(content_block: TextContent) -> Union[str, List[Dict[str, Any]]]:
+    return content_block.text
+
+
+def _image_to_message(content_block: ImageContent) -> Union[str, List[Dict[str, Any]]]:
+    # Return array with image_url for OpenAI vision API
+    return [{"type": "image_url", "image_url": {"url": f"data:{content_block.mimeType};base64,{content_block.data}"}}]
 
-    if isinstance(content_block, ImageContent):
-        return {"type": "text", "text": f"[Image: {content_block.mimeType} received]"}
 
-    if isinstance(content_block, AudioContent):
-        return {"type": "text", "text": f"[Audio: {content_block.mimeType} received]"}
+def _audio_to_message(content_block: AudioContent) -> Union[str, List[Dict[str, Any]]]:
+    # Standard GPT-4 cannot process audio, inform the LLM it was played locally
+    return [
+        {
+            "type": "text",
+            "text": f"[Audio content ({content_block.mimeType}) was played locally for the user but cannot be processed by the AI]",
+        }
+    ]
 
-    if isinstance(content_block, EmbeddedResource):
-        if hasattr(content_block.resource, "text"):
-            return {"type": "text", "text": content_block.resource.text}
-        return {"type": "text", "text": "[Embedded resource: binary data received]"}
 
-    if isinstance(content_block, ResourceLink):
-        return {"type": "text", "text": f"[Resource link: {content_block.uri}]"}
+def _embedded_resource_to_message(content_block: EmbeddedResource) -> Union[str, List[Dict[str, Any]]]:
+    text = getattr(content_block.resource, "text", None)
+    if text is not None:
+        return text
+    # TODO: Handle other embedded resource types appropriately
+    return f"[Embedded resource: {str(content_block.resource)[:80]}]"
 
-    # Unknown content type
-    content_block_text = str(content_block)
-    return {"type": "text", "text": content_block_text[: min(80, len(content_block_text))]}
+
+def _resource_link_to_message(content_block: ResourceLink) -> Union[str, List[Dict[str, Any]]]:
+    return f"[Resource link: {content_block.uri}]"
+
+
+def _unknown_to_message(content_block: Any) -> Union[str, List[Dict[str, Any]]]:
+    return str(content_block)[:80]
+
+
+_MESSAGE_HANDLERS: Dict[type, Callable[[Any], Union[str, List[Dict[str, Any]]]]] = {
+    TextContent: _text_to_message,
+    ImageContent: _image_to_message,
+    AudioContent: _audio_to_message,
+    EmbeddedResource: _embedded_resource_to_message,
+    ResourceLink: _resource_link_to_message,
+}
 
 
 def convert_mcp_content_to_message(
@@ -114,37 +205,7 @@ def convert_mcp_content_to_message(
     Returns:
         String for text-only content, array list for media content.
     """
-    if isinstance(content_block, TextContent):
-        return content_block.text
-
-    if isinstance(content_block, ImageContent):
-        # Return array with image_url for OpenAI vision API
-        return [
-            {"type": "image_url", "image_url": {"url": f"data:{content_block.mimeType};base64,{content_block.data}"}}
-        ]
-
-    if isinstance(content_block, AudioContent):
-        # Standard GPT-4 cannot process audio, inform the LLM it was played locally
-        return [
-            {
-                "type": "text",
-                "text": f"[Audio content ({content_block.mimeType}) was played locally for the user but cannot be processed by the AI]",
-            }
-        ]
-
-    if isinstance(content_block, EmbeddedResource):
-        if hasattr(content_block.resource, "text"):
-            return content_block.resource.text
-        # TODO: Handle other embedded resource types appropriately
-        content_block_text = str(content_block.resource)
-        return f"[Embedded resource: {content_block_text[:min(80, len(content_block_text))]}]"
-
-    if isinstance(content_block, ResourceLink):
-        return f"[Resource link: {content_block.uri}]"
-
-    # Unknown content type
-    content_block_text = str(content_block)
-    return content_block_text[: min(80, len(content_block_text))]
+    return _MESSAGE_HANDLERS.get(type(content_block), _unknown_to_message)(content_block)
 
 
 def process_tool_result_content(tool_result: CallToolResult, verbose: bool = True) -> str:
@@ -157,18 +218,22 @@ def process_tool_result_content(tool_result: CallToolResult, verbose: bool = Tru
     Returns:
         String content for OpenAI tool response (images and audio converted to text descriptions).
     """
-    text_parts = []
+    buffer = io.StringIO()
 
-    for content_block in tool_result.content:
-        # Display to user (shows images and play audio locally)
+    for index, content_block in enumerate(tool_result.content):
+        # Display to user as each block is processed (shows images and play audio locally)
         if verbose:
             handle_content_block(content_block)
         # Convert to OpenAI tool format (always returns dict with 'text' key)
-        converted = convert_mcp_content_to_tool_response(content_block)
-        text_parts.append(converted["text"])
+        if index:
+            buffer.write("\n")
+        buffer.write(convert_mcp_content_to_tool_response(content_block)["text"])
+
+    if verbose:
+        sys.stdout.flush()
 
-    # Join all parts into a single string (required for tool role messages)
-    return "\n".join(text_parts) if text_parts else ""
+    # Single string with all parts (required for tool role messages)
+    return buffer.getvalue()
 
 
 def get_prompt_arguments(prompt: Prompt) -> dict[str, str]:
@@ -221,3 +286,15 @@ def get_template_variables_from_user(uri_template: str) -> dict[str, str]:
         values[var] = value
 
     return values
+
+
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin without blocking the running event loop.
+
+    Args:
+        prompt: Text displayed before reading the line.
+
+    Returns:
+        The line read from stdin, without the trailing newline.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
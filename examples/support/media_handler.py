@@ -1,7 +1,12 @@
 """Media handling utilities for displaying and processing various content types."""
 
-import base64
+import functools
 import io
+import mimetypes
+import mmap
+import os
+import posixpath
+import sys
 import tempfile
 import urllib.error
 import urllib.request
@@ -20,11 +25,97 @@ from PIL.Image import (
 )
 
 
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib base64 codecs
+    from pybase64 import (
+        b64decode,
+        b64encode,
+    )
+except ImportError:
+    from base64 import (
+        b64decode,
+        b64encode,
+    )
+
+
+# Files are base64-encoded in chunks of this size (a multiple of 3, so encoded chunks concatenate without padding)
+ENCODE_CHUNK_SIZE = 3 * 1024 * 1024
+
+# MIME type strings below are interned, so every table and every result shares one object per MIME type
+DEFAULT_MIME_TYPE = sys.intern("application/octet-stream")
+PNG_MIME_TYPE = sys.intern("image/png")
+
+# Lookup tables precomputed once from the mimetypes database, so guess_mime_type() gives the same answer as
+# mimetypes.guess_type() with plain dict lookups:
+# - MIME types by lowercase file extension
+# - abbreviated compressed suffixes (e.g. ".tgz" for ".tar.gz"), which mimetypes resolves first
+# - compression suffixes (case-sensitive, as in mimetypes), which leave the type to the extension before them
+mimetypes.init()
+MIME_TYPES_BY_EXTENSION = {ext: sys.intern(mime_type) for ext, mime_type in mimetypes.types_map.items()}
+_ABBREVIATED_SUFFIX_MIME_TYPES = {
+    suffix: sys.intern(mimetypes.guess_type("file" + suffix)[0] or DEFAULT_MIME_TYPE)
+    for suffix in mimetypes.suffix_map
+}
+_ENCODING_EXTENSIONS = frozenset(mimetypes.encodings_map)
+
+# MIME types of the supported audio file extensions
+AUDIO_MIME_TYPES = {
+    ext: sys.intern(mime_type)
+    for ext, mime_type in {
+        "mp3": "audio/mpeg",
+        "wav": "audio/wav",
+        "ogg": "audio/ogg",
+        "flac": "audio/flac",
+        "m4a": "audio/mp4",
+        "aac": "audio/aac",
+    }.items()
+}
+
+
+def guess_mime_type(path: str) -> str:
+    """Return the MIME type for a file path or URI path from its extension, or DEFAULT_MIME_TYPE if unknown."""
+    root, ext = posixpath.splitext(path)
+    abbreviated_mime_type = _ABBREVIATED_SUFFIX_MIME_TYPES.get(ext.lower())
+    if abbreviated_mime_type:
+        return abbreviated_mime_type
+    if ext in _ENCODING_EXTENSIONS:
+        ext = posixpath.splitext(root)[1]
+    return MIME_TYPES_BY_EXTENSION.get(ext.lower(), DEFAULT_MIME_TYPE)
+
+
+def encode_file_base64(file_path: str) -> str:
+    """
+    Base64-encode a file through a read-only memory map, one chunk at a time, so only the current chunk of raw
+    bytes is copied in memory instead of the whole file next to its encoded form.
+    """
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size <= ENCODE_CHUNK_SIZE:
+            # A single chunk (or an empty file, which cannot be memory mapped) is read in one sized allocation
+            return b64encode(file.read(size)).decode("ascii")
+        encoded = bytearray()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # The file is read once from start to end, so let the kernel read ahead aggressively
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            for offset in range(0, len(mapped), ENCODE_CHUNK_SIZE):
+                encoded += b64encode(mapped[offset : offset + ENCODE_CHUNK_SIZE])
+    return encoded.decode("ascii")
+
+
 def get_image(image_path: str) -> tuple[str, str]:
     """
     Load an image from the given path, resize it to a maximum of 1024x1024 pixels,
     convert it to PNG format, and return its base64-encoded data along with the MIME type.
+    Results are cached until the file's modification time or size changes.
     """
+    stat = os.stat(image_path)
+    return _load_image(os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+
+
+# mtime_ns and size are only part of the cache key, so edited files are loaded again
+@functools.lru_cache(maxsize=64)
+def _load_image(image_path: str, mtime_ns: int, size: int) -> tuple[str, str]:  # pylint: disable=unused-argument
     img: Image = PilImage.open(image_path)
     img.thumbnail((1024, 1024))  # Resize to max 1024x1024
 
@@ -35,41 +126,36 @@ def get_image(image_path: str) -> tuple[str, str]:
     # Save as PNG to a bytes buffer in memory
     buffer = io.BytesIO()
     img.save(buffer, format="PNG")
-    buffer.seek(0)
 
-    return base64.b64encode(buffer.getvalue()).decode("utf-8"), "image/png"
+    # Encode straight from a view of the buffer rather than a bytes copy of it
+    with buffer.getbuffer() as png_data:
+        return b64encode(png_data).decode("utf-8"), PNG_MIME_TYPE
 
 
 def get_audio(audio_path: str) -> tuple[str, str]:
     """ "
     Load an audio file from the given path and return its base64-encoded data along with the MIME type.
+    Results are cached until the file's modification time or size changes.
     """
-    import os
+    stat = os.stat(audio_path)
+    return _load_audio(os.path.abspath(audio_path), stat.st_mtime_ns, stat.st_size)
+
 
-    with open(audio_path, "rb") as audio_file:
-        audio_data = audio_file.read()
+@functools.lru_cache(maxsize=64)
+def _load_audio(audio_path: str, mtime_ns: int, size: int) -> tuple[str, str]:  # pylint: disable=unused-argument
+    # Encoded through a memory map, without reading the whole file into memory first
+    audio_data = encode_file_base64(audio_path)
 
     # Get file extension and determine MIME type
     _, ext = os.path.splitext(audio_path.lower())
     ext = ext.lstrip(".")
 
-    # Map common audio extensions to MIME types
-    audio_mime_types = {
-        "mp3": "audio/mpeg",
-        "wav": "audio/wav",
-        "ogg": "audio/ogg",
-        "flac": "audio/flac",
-        "m4a": "audio/mp4",
-        "aac": "audio/aac",
-    }
-
-    mime_type = audio_mime_types.get(ext, "audio/mpeg")  # Default to mp3
-    return base64.b64encode(audio_data).decode("utf-8"), mime_type
+    mime_type = AUDIO_MIME_TYPES.get(ext, AUDIO_MIME_TYPES["mp3"])  # Default to mp3
+    return audio_data, mime_type
 
 
 def open_file_with_system_default(file_path: str) -> None:
     """Open a file with the system's default application."""
-    import os
     import platform
     import subprocess
 
@@ -88,7 +174,7 @@ def display_image_content(image_content: ImageContent) -> None:
     """Display an image from ImageContent by decoding base64 data and showing it."""
     try:
         # Decode base64 image data
-        image_bytes = base64.b64decode(image_content.data)
+        image_bytes = b64decode(image_content.data)
 
         # Assumes that the server sends PNG data
         image: Image = PilImage.open(io.BytesIO(image_bytes))
@@ -109,7 +195,7 @@ def play_audio_content(audio_content: AudioContent) -> None:
     """Display/play an audio from AudioContent by decoding base64 data and playing it."""
     try:
         # Decode base64 audio data
-        audio_bytes = base64.b64decode(audio_content.data)
+        audio_bytes = b64decode(audio_content.data)
 
         # Determine file extension from MIME type
         mime_to_ext = {
@@ -191,7 +277,7 @@ def decode_binary_file(embedded_resource: EmbeddedResource, output_path: str) ->
     try:
         if isinstance(embedded_resource.resource, BlobResourceContents):
             # Decode base64 data
-            binary_data = base64.b64decode(embedded_resource.resource.blob)
+            binary_data = b64decode(embedded_resource.resource.blob)
 
             # Write to file
             with open(output_path, "wb") as output_file:
@@ -229,13 +315,13 @@ def display_content_from_uri(resource_link: ResourceLink) -> None:
         if mime_type.startswith("image/"):
             # Convert to ImageContent and display
             image_content = ImageContent(
-                type="image", data=base64.b64encode(content_bytes).decode("utf-8"), mimeType=mime_type
+                type="image", data=b64encode(content_bytes).decode("utf-8"), mimeType=mime_type
             )
             display_image_content(image_content)
         elif mime_type.startswith("audio/"):
             # Convert to AudioContent and display
             audio_content = AudioContent(
-                type="audio", data=base64.b64encode(content_bytes).decode("utf-8"), mimeType=mime_type
+                type="audio", data=b64encode(content_bytes).decode("utf-8"), mimeType=mime_type
             )
             play_audio_content(audio_content)
         elif mime_type == "application/pdf":
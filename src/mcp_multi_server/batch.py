@@ -0,0 +1,121 @@
+"""Concurrent execution of several tool calls, with optional server-side batching."""
+
+from datetime import timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+import anyio
+from mcp.types import (
+    CallToolResult,
+    TextContent,
+)
+
+from .types import ServerCapabilities
+
+
+if TYPE_CHECKING:
+    from mcp_multi_server.client import MultiServerClient
+
+
+# Name of the optional server-side tool that executes several tool calls in one request
+BATCH_TOOL_NAME = "batch_execute"
+
+
+def supports_batch(capabilities: Optional[ServerCapabilities]) -> bool:
+    """Check whether a server exposes the batch execution tool.
+
+    Args:
+        capabilities: Capabilities discovered from the server, if any.
+
+    Returns:
+        True if the server lists a tool named BATCH_TOOL_NAME, False otherwise.
+    """
+    if capabilities is None or capabilities.tools is None:
+        return False
+    return any(tool.name == BATCH_TOOL_NAME for tool in capabilities.tools.tools)
+
+
+def _error_result(error_message: str) -> CallToolResult:
+    return CallToolResult(content=[TextContent(type="text", text=error_message)], isError=True)
+
+
+async def execute_tool_calls(
+    client: "MultiServerClient",
+    calls: List[Tuple[str, Dict[str, Any]]],
+    read_timeout_seconds: Optional[timedelta] = None,
+) -> List[CallToolResult]:
+    """Execute several tool calls concurrently, grouping them by the server that owns each tool.
+
+    When two or more calls target a server that exposes a ``batch_execute`` tool, they are sent to
+    that server as a single request with the arguments
+    ``{"operations": [{"tool": ..., "arguments": ...}, ...], "maxConcurrent": N, "stopOnError": False}``.
+    The server must answer with ``structuredContent["results"]`` holding one CallToolResult per
+    operation, in order. Every other call is routed individually through the client's call_tool.
+
+    Args:
+        client: Connected client that routes the calls.
+        calls: List of (tool name, arguments) pairs.
+        read_timeout_seconds: Optional timeout for reading each result.
+
+    Returns:
+        One CallToolResult per call, in the same order as ``calls``.
+
+    Raises:
+        RuntimeError: If a call ends up without a result, which would misalign results and calls.
+
+    Note:
+        Unlike call_tool, this function does not raise for tool failures: protocol-level errors and
+        malformed batch responses are returned as error results (isError=True) for the affected calls.
+    """
+    results: List[Optional[CallToolResult]] = [None] * len(calls)
+
+    batches: Dict[str, List[int]] = {}
+    for index, (name, _) in enumerate(calls):
+        server_name = client.tool_to_server.get(name)
+        if server_name is not None and supports_batch(client.capabilities.get(server_name)):
+            batches.setdefault(server_name, []).append(index)
+    batches = {server_name: indices for server_name, indices in batches.items() if len(indices) > 1}
+    batched_indices = {index for indices in batches.values() for index in indices}
+
+    async def run_single(index: int) -> None:
+        name, arguments = calls[index]
+        try:
+            results[index] = await client.call_tool(name, arguments, read_timeout_seconds)
+        except Exception as e:
+            results[index] = _error_result(f"Error executing tool {name}: {e}")
+
+    async def run_batch(server_name: str, indices: List[int]) -> None:
+        operations = [{"tool": calls[index][0], "arguments": calls[index][1]} for index in indices]
+        try:
+            batch_result = await client.sessions[server_name].call_tool(
+                BATCH_TOOL_NAME,
+                {"operations": operations, "maxConcurrent": len(operations), "stopOnError": False},
+                read_timeout_seconds=read_timeout_seconds,
+            )
+            items = (batch_result.structuredContent or {}).get("results")
+            if batch_result.isError or not isinstance(items, list) or len(items) != len(indices):
+                raise ValueError(f"Invalid {BATCH_TOOL_NAME} response from server '{server_name}'")
+            for index, item in zip(indices, items):
+                results[index] = CallToolResult.model_validate(item)
+        except Exception as e:
+            for index in indices:
+                results[index] = _error_result(f"Error executing tool {calls[index][0]}: {e}")
+
+    async with anyio.create_task_group() as tg:
+        for server_name, indices in batches.items():
+            tg.start_soon(run_batch, server_name, indices)
+        for index in range(len(calls)):
+            if index not in batched_indices:
+                tg.start_soon(run_single, index)
+
+    missing = [calls[index][0] for index, result in enumerate(results) if result is None]
+    if missing:
+        raise RuntimeError(f"No result was recorded for tool call(s): {', '.join(missing)}")
+    return cast(List[CallToolResult], results)
@@ -11,6 +11,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -43,6 +44,7 @@ from mcp.types import (
     Tool,
 )
 
+from .batch import execute_tool_calls
 from .config import (
     MCPServersConfig,
     ServerConfig,
@@ -61,7 +63,6 @@ from .utils import (
 # function provided by this library.
 logger = logging.getLogger(__name__)
 
-
 class MultiServerClient:
     """Manages multiple MCP server connections for a MCP host.
 
@@ -100,6 +101,7 @@ class MultiServerClient:
         config_path: Union[str, Path] = "mcp_servers.json",
         *,
         strict_connect: Optional[bool] = None,
+        cached_capabilities: Optional[Dict[str, ServerCapabilities]] = None,
     ) -> None:
         """Initialize the multi-server client.
 
@@ -112,6 +114,9 @@ class MultiServerClient:
                         When True, such a failure is raised instead of skipped. If left as
                         None, the value is read from the MCP_MULTI_SERVER_STRICT_CONNECT
                         environment variable (truthy values: 1/true/yes/on), else False.
+            cached_capabilities: Previously discovered capabilities keyed by server name (e.g. loaded
+                        from an on-disk cache). Servers found here are still connected and initialized,
+                        but skip the list_* discovery requests. The caller is responsible for invalidation.
 
         Note:
             This constructor only sets up the configuration path. The actual connection
@@ -124,6 +129,7 @@ class MultiServerClient:
         self.tool_to_server: Dict[str, str] = {}
         self.prompt_to_server: Dict[str, str] = {}
         self.strict_connect: bool = self._resolve_strict_connect(strict_connect)
+        self.cached_capabilities: Dict[str, ServerCapabilities] = dict(cached_capabilities or {})
         self._stack: Optional[AsyncExitStack] = None
         self._config: Optional[MCPServersConfig] = None
 
@@ -136,7 +142,11 @@ class MultiServerClient:
 
     @classmethod
     def from_config(
-        cls, config_path: Union[str, Path], *, strict_connect: Optional[bool] = None
+        cls,
+        config_path: Union[str, Path],
+        *,
+        strict_connect: Optional[bool] = None,
+        cached_capabilities: Optional[Dict[str, ServerCapabilities]] = None,
     ) -> "MultiServerClient":
         """Create a client from a configuration file path.
 
@@ -146,6 +156,7 @@ class MultiServerClient:
             config_path: Path to the JSON configuration file.
             strict_connect: Connection-failure policy (see __init__). Defaults to None
                         (read from MCP_MULTI_SERVER_STRICT_CONNECT, else False).
+            cached_capabilities: Previously discovered capabilities keyed by server name (see __init__).
 
         Returns:
             A new MultiServerClient instance.
@@ -153,10 +164,16 @@ class MultiServerClient:
         Examples:
             >>> client = MultiServerClient.from_config("my_servers.json")
         """
-        return cls(config_path, strict_connect=strict_connect)
+        return cls(config_path, strict_connect=strict_connect, cached_capabilities=cached_capabilities)
 
     @classmethod
-    def from_dict(cls, config_dict: Dict[str, Any], *, strict_connect: Optional[bool] = None) -> "MultiServerClient":
+    def from_dict(
+        cls,
+        config_dict: Dict[str, Any],
+        *,
+        strict_connect: Optional[bool] = None,
+        cached_capabilities: Optional[Dict[str, ServerCapabilities]] = None,
+    ) -> "MultiServerClient":
         """Create a client from a configuration dictionary.
 
         This method allows programmatic configuration without needing a JSON file.
@@ -166,6 +183,7 @@ class MultiServerClient:
                         format as the JSON file (with "mcpServers" key).
             strict_connect: Connection-failure policy (see __init__). Defaults to None
                         (read from MCP_MULTI_SERVER_STRICT_CONNECT, else False).
+            cached_capabilities: Previously discovered capabilities keyed by server name (see __init__).
 
         Returns:
             A new MultiServerClient instance with the provided configuration.
@@ -191,6 +209,7 @@ class MultiServerClient:
         instance.tool_to_server = {}
         instance.prompt_to_server = {}
         instance.strict_connect = cls._resolve_strict_connect(strict_connect)
+        instance.cached_capabilities = dict(cached_capabilities or {})
         instance._stack = None
         instance._config = MCPServersConfig.model_validate(config_dict)
         return instance
@@ -250,14 +269,39 @@ class MultiServerClient:
 
         logger.info("Connecting to %d MCP servers...", len(config.mcpServers))
 
+        # Transports are opened one by one from this task: their context managers hold anyio
+        # cancel scopes, which must be exited by the same task that entered them.
+        opened: List[Tuple[str, ClientSession]] = []
         for server_name, server_config in config.mcpServers.items():
             try:
-                await self._connect_server(stack, server_name, server_config)
+                opened.append((server_name, await self._open_session(stack, server_name, server_config)))
             except Exception as e:
                 if self.strict_connect:
                     raise
                 logger.warning("Failed to connect to %s: %s", server_name, e)
+
+        # Handshakes and capability discovery are plain request/response exchanges on already
+        # open sessions, so they run concurrently: startup costs the slowest server, not the sum.
+        outcomes: List[Union[ServerCapabilities, Exception]] = [Exception("not initialized")] * len(opened)
+
+        async def initialize(index: int, server_name: str, session: ClientSession) -> None:
+            try:
+                outcomes[index] = await self._initialize_server(session, server_name)
+            except Exception as e:
+                outcomes[index] = e
+
+        async with anyio.create_task_group() as tg:
+            for index, (server_name, session) in enumerate(opened):
+                tg.start_soon(initialize, index, server_name, session)
+
+        # Register in configuration order so tool/prompt collisions resolve deterministically
+        for (server_name, session), outcome in zip(opened, outcomes):
+            if isinstance(outcome, Exception):
+                if self.strict_connect:
+                    raise outcome
+                logger.warning("Failed to connect to %s: %s", server_name, outcome)
                 continue
+            self._register_server(server_name, session, outcome)
 
         logger.info("Successfully connected to %d server(s)", len(self.sessions))
 
@@ -317,6 +361,23 @@ class MultiServerClient:
             discovery means the connection is unusable: nothing is committed and the error
             is re-raised.
         """
+        session = await self._open_session(stack, server_name, server_config)
+        capabilities = await self._initialize_server(session, server_name)
+        self._register_server(server_name, session, capabilities)
+
+    async def _open_session(
+        self, stack: AsyncExitStack, server_name: str, server_config: ServerConfig
+    ) -> ClientSession:
+        """Start a server process and open an MCP session on its stdio transport.
+
+        Args:
+            stack: AsyncExitStack for managing async context managers.
+            server_name: Name identifier for this server.
+            server_config: Server connection parameters.
+
+        Returns:
+            The opened (not yet initialized) session.
+        """
         logger.info("[%s] connecting...", server_name)
 
         # Create server parameters
@@ -324,42 +385,100 @@ class MultiServerClient:
 
         # Connect to server
         read, write = await stack.enter_async_context(stdio_client(params))
-        session = await stack.enter_async_context(ClientSession(read, write))
+        return await stack.enter_async_context(ClientSession(read, write))
+
+    async def _initialize_server(self, session: ClientSession, server_name: str) -> ServerCapabilities:
+        """Run the MCP handshake on an open session and obtain the server capabilities.
+
+        Args:
+            session: Opened session for the server.
+            server_name: Name identifier for this server.
 
+        Returns:
+            The server capabilities, taken from cached_capabilities when available and
+            discovered from the server otherwise.
+        """
         # Initialize session
         await session.initialize()
 
-        # Discover capabilities into LOCAL state first, then commit atomically at the end.
-        #
-        # Deferring registration means a failure mid-discovery never leaves partial ("zombie")
-        # state in the client. Per-capability McpError (e.g. method-not-found) means the server
-        # simply does not implement that capability: warn and continue. A transport-level
-        # failure (ClosedResourceError / BrokenResourceError) or any other unexpected error
-        # means the connection is unusable — re-raise (nothing has been committed) so
-        # connect_all() can apply the strict_connect policy.
-        capabilities = ServerCapabilities(name=server_name)
+        # Capabilities supplied through cached_capabilities skip the list_* round-trips entirely;
+        # routing is rebuilt from them the same way when the server is registered.
+        cached = self.cached_capabilities.get(server_name)
+        if cached is not None:
+            logger.info("[%s] using cached capabilities", server_name)
+            return cached.model_copy(update={"name": server_name})
+        return await self._discover_capabilities(session, server_name)
+
+    def _register_server(self, server_name: str, session: ClientSession, capabilities: ServerCapabilities) -> None:
+        """Commit a fully initialized server: session, capabilities and tool/prompt routing.
+
+        Args:
+            server_name: Name identifier for this server.
+            session: Initialized session for the server.
+            capabilities: Capabilities of the server.
+        """
+        # Map tools and prompts to server (collision check against already-committed and local)
         local_tool_to_server: Dict[str, str] = {}
         local_prompt_to_server: Dict[str, str] = {}
 
+        for tool in capabilities.tools.tools if capabilities.tools else []:
+            existing_server = self.tool_to_server.get(tool.name) or local_tool_to_server.get(tool.name)
+            if existing_server is not None:
+                logger.warning(
+                    "Tool '%s' collision detected! Already provided by '%s', now overridden by '%s'",
+                    tool.name,
+                    existing_server,
+                    server_name,
+                )
+            local_tool_to_server[tool.name] = server_name
+
+        for prompt in capabilities.prompts.prompts if capabilities.prompts else []:
+            existing_server = self.prompt_to_server.get(prompt.name) or local_prompt_to_server.get(prompt.name)
+            if existing_server is not None:
+                logger.warning(
+                    "Prompt '%s' collision detected! Already provided by '%s', now overridden by '%s'",
+                    prompt.name,
+                    existing_server,
+                    server_name,
+                )
+            local_prompt_to_server[prompt.name] = server_name
+
+        # Commit atomically: only reached when discovery completed without a transport/unexpected error.
+        self.sessions[server_name] = session
+        self.capabilities[server_name] = capabilities
+        self.tool_to_server.update(local_tool_to_server)
+        self.prompt_to_server.update(local_prompt_to_server)
+
+    async def _discover_capabilities(self, session: ClientSession, server_name: str) -> ServerCapabilities:
+        """Query a freshly initialized server session for its capabilities.
+
+        Args:
+            session: Initialized session for the server.
+            server_name: Name identifier for this server.
+
+        Returns:
+            Capabilities discovered from the server.
+
+        Raises:
+            anyio.ClosedResourceError, anyio.BrokenResourceError: If the transport dies
+                during capability discovery.
+            Exception: Any other unexpected error during discovery.
+
+        Note:
+            Per-capability McpError (e.g. method-not-found) means the server simply does not
+            implement that capability: warn and continue. A transport-level failure
+            (ClosedResourceError / BrokenResourceError) or any other unexpected error means
+            the connection is unusable and is re-raised so connect_all() can apply the
+            strict_connect policy.
+        """
+        capabilities = ServerCapabilities(name=server_name)
+
         try:
             # Get tools
             try:
                 tools_result = await session.list_tools()
                 capabilities.tools = tools_result
                 logger.info("[%s] Found %d tool(s)", server_name, len(tools_result.tools))
-
-                # Map tools to server (collision check against already-committed and local)
-                for tool in tools_result.tools:
-                    existing_server = self.tool_to_server.get(tool.name) or local_tool_to_server.get(tool.name)
-                    if existing_server is not None:
-                        logger.warning(
-                            "Tool '%s' collision detected! Already provided by '%s', now overridden by '%s'",
-                            tool.name,
-                            existing_server,
-                            server_name,
-                        )
-                    local_tool_to_server[tool.name] = server_name
-
             except McpError as e:
                 logger.warning("Tools not available from [%s] : %s", server_name, e)
 
@@ -384,19 +503,6 @@ class MultiServerClient:
                 prompts_result = await session.list_prompts()
                 capabilities.prompts = prompts_result
                 logger.info("[%s] Found %d prompt(s)", server_name, len(prompts_result.prompts))
-
-                # Map prompts to server (collision check against already-committed and local)
-                for prompt in prompts_result.prompts:
-                    existing_server = self.prompt_to_server.get(prompt.name) or local_prompt_to_server.get(prompt.name)
-                    if existing_server is not None:
-                        logger.warning(
-                            "Prompt '%s' collision detected! Already provided by '%s', now overridden by '%s'",
-                            prompt.name,
-                            existing_server,
-                            server_name,
-                        )
-                    local_prompt_to_server[prompt.name] = server_name
-
             except McpError as e:
                 logger.warning("Prompts not available from [%s] : %s", server_name, e)
 
@@ -411,11 +517,7 @@ class MultiServerClient:
             )
             raise
 
-        # Commit atomically: only reached when discovery completed without a transport/unexpected error.
-        self.sessions[server_name] = session
-        self.capabilities[server_name] = capabilities
-        self.tool_to_server.update(local_tool_to_server)
-        self.prompt_to_server.update(local_prompt_to_server)
+        return capabilities
 
     async def set_logging_level(self, level: LoggingLevel) -> EmptyResult:
         """Set the logging level for the multi-server client and the MCP connected servers.
@@ -443,13 +545,19 @@ class MultiServerClient:
             level = "warning"
         elif level in ("alert", "emergency"):
             level = "critical"
-        for server_name, session in self.sessions.items():
+
+        async def set_server_level(server_name: str, session: ClientSession) -> None:
             try:
                 await session.set_logging_level(level=level)
             except Exception:
                 # Most likely the server doesn't support logging level changes
                 # See https://github.com/jlowin/fastmcp/issues/525
                 logger.warning("Failed to set logging level for server '%s'", server_name)
+
+        # Servers are updated concurrently so the call costs one round trip rather than one per server
+        async with anyio.create_task_group() as tg:
+            for server_name, session in self.sessions.items():
+                tg.start_soon(set_server_level, server_name, session)
         configure_logging(name="mcp_multi_server", level=level.upper())
         return EmptyResult()
 
@@ -730,6 +838,29 @@ class MultiServerClient:
             meta=meta,
         )
 
+    async def call_tools(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        read_timeout_seconds: Optional[timedelta] = None,
+    ) -> List[CallToolResult]:
+        """Execute several tool calls concurrently, grouping them by the server that owns each tool.
+
+        Calls to a server that exposes a ``batch_execute`` tool are sent to it as a single request;
+        see :func:`mcp_multi_server.batch.execute_tool_calls` for the batch protocol.
+
+        Args:
+            calls: List of (tool name, arguments) pairs.
+            read_timeout_seconds: Optional timeout for reading each result.
+
+        Returns:
+            One CallToolResult per call, in the same order as ``calls``.
+
+        Note:
+            Unlike call_tool, this method does not raise: protocol-level errors and malformed
+            batch responses are returned as error results (isError=True) for the affected calls.
+        """
+        return await execute_tool_calls(self, calls, read_timeout_seconds)
+
     async def read_resource(self, uri: Union[str, AnyUrl], server_name: Optional[str] = None) -> ReadResourceResult:
         """Read a resource with optional auto-routing via namespaced URIs.
 
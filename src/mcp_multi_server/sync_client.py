@@ -15,9 +15,12 @@ from datetime import timedelta
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
+    List,
     Literal,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -40,7 +43,6 @@ from mcp.types import (
 
 from .client import MultiServerClient
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -74,6 +76,7 @@ class SyncMultiServerClient:
         config_dict: Optional[Dict[str, Any]] = None,
         *,
         strict_connect: Optional[bool] = None,
+        loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None,
     ):
         """Initialize SyncMultiServerClient.
 
@@ -88,6 +91,8 @@ class SyncMultiServerClient:
                 whose transport dies during discovery is dropped and the rest still connect;
                 when True, such a failure is raised. If None, read from the
                 MCP_MULTI_SERVER_STRICT_CONNECT environment variable, else False.
+            loop_factory: Creates the background event loop, e.g. ``uvloop.new_event_loop``.
+                Defaults to ``asyncio.new_event_loop``.
 
         Raises:
             ValueError: If neither or both config_path and config_dict are provided.
@@ -99,6 +104,7 @@ class SyncMultiServerClient:
         self.config_path = config_path
         self.config_dict = config_dict
         self.strict_connect = strict_connect
+        self.loop_factory = loop_factory or asyncio.new_event_loop
         self.mcp_client: Optional[MultiServerClient] = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.thread: Optional[threading.Thread] = None
@@ -132,7 +138,11 @@ class SyncMultiServerClient:
 
     @classmethod
     def from_config(
-        cls, config_path: Union[str, Path], *, strict_connect: Optional[bool] = None
+        cls,
+        config_path: Union[str, Path],
+        *,
+        strict_connect: Optional[bool] = None,
+        loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None,
     ) -> "SyncMultiServerClient":
         """Create a client from a configuration file path.
 
@@ -142,6 +152,7 @@ class SyncMultiServerClient:
         Args:
             config_path: Path to the JSON configuration file.
             strict_connect: Connection-failure policy (see __init__).
+            loop_factory: Creates the background event loop (see __init__).
 
         Returns:
             A new SyncMultiServerClient instance.
@@ -149,11 +160,15 @@ class SyncMultiServerClient:
         Examples:
             >>> client = SyncMultiServerClient.from_config("mcp_config.json")
         """
-        return cls(config_path=config_path, strict_connect=strict_connect)
+        return cls(config_path=config_path, strict_connect=strict_connect, loop_factory=loop_factory)
 
     @classmethod
     def from_dict(
-        cls, config_dict: Dict[str, Any], *, strict_connect: Optional[bool] = None
+        cls,
+        config_dict: Dict[str, Any],
+        *,
+        strict_connect: Optional[bool] = None,
+        loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None,
     ) -> "SyncMultiServerClient":
         """Create a client from a configuration dictionary.
 
@@ -163,6 +178,7 @@ class SyncMultiServerClient:
             config_dict: Dictionary containing server configurations in the same
                 format as the JSON file (with "mcpServers" key).
             strict_connect: Connection-failure policy (see __init__).
+            loop_factory: Creates the background event loop (see __init__).
 
         Returns:
             A new SyncMultiServerClient instance with the provided configuration.
@@ -178,7 +194,7 @@ class SyncMultiServerClient:
             ... }
             >>> client = SyncMultiServerClient.from_dict(config)
         """
-        return cls(config_dict=config_dict, strict_connect=strict_connect)
+        return cls(config_dict=config_dict, strict_connect=strict_connect, loop_factory=loop_factory)
 
     def _start_background_loop(self) -> None:
         """Start background thread with event loop."""
@@ -190,7 +206,7 @@ class SyncMultiServerClient:
 
     def _run_event_loop(self) -> None:
         """Run persistent event loop in background thread."""
-        self.loop = asyncio.new_event_loop()
+        self.loop = self.loop_factory()
         asyncio.set_event_loop(self.loop)
         self._loop_ready.set()  # Signal that loop is ready
         self.loop.run_forever()
@@ -530,6 +546,37 @@ class SyncMultiServerClient:
             logger.error("Error calling MCP tool '%s': %s", name, e)
             return self._create_error_result(f"Error calling MCP tool '{name}': {e}")
 
+    def call_tools(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        read_timeout_seconds: Optional[timedelta] = None,
+        timeout: Optional[float] = None,
+    ) -> List[CallToolResult]:
+        """Call several MCP tools synchronously, grouped by owning server.
+
+        Args:
+            calls: List of (tool name, arguments) pairs
+            read_timeout_seconds: Optional timeout for reading each result
+            timeout: Maximum seconds to wait for all calls. None means wait forever.
+
+        Returns:
+            One CallToolResult per call, in order. If timeout occurs, every result is an error result.
+        """
+        if self.loop is None or self.mcp_client is None:
+            return [self._create_error_result("MCP client not initialized") for _ in calls]
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.mcp_client.call_tools(calls, read_timeout_seconds=read_timeout_seconds),
+            self.loop,
+        )
+
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            return [
+                self._create_error_result(f"MCP tool '{name}' timed out after {timeout} seconds") for name, _ in calls
+            ]
+
     def read_resource(
         self,
         uri: Union[str, AnyUrl],
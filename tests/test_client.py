@@ -31,6 +31,7 @@ import anyio
 from mcp.shared.exceptions import McpError
 from mcp.types import (
     METHOD_NOT_FOUND,
+    CallToolResult,
     ErrorData,
     ListPromptsResult,
     ListResourcesResult,
@@ -263,6 +264,70 @@ class TestConnectionManagement:
                     assert "resource_server" in client.sessions
                     assert "prompt_server" in client.sessions
 
+    @pytest.mark.asyncio
+    async def test_connect_all_initializes_servers_concurrently(self) -> None:
+        """Test server handshakes overlap instead of running one after another."""
+        config = {
+            "mcpServers": {
+                "first": {"command": "python", "args": ["-m", "first"]},
+                "second": {"command": "python", "args": ["-m", "second"]},
+            }
+        }
+        client = MultiServerClient.from_dict(config)
+        second_started = anyio.Event()
+
+        async def first_initialize() -> None:
+            # Only completes if the second server's handshake starts while this one is pending
+            await second_started.wait()
+
+        async def second_initialize() -> None:
+            second_started.set()
+
+        first_session = _mock_session_empty_discovery(MagicMock())
+        first_session.initialize = AsyncMock(side_effect=first_initialize)
+        second_session = _mock_session_empty_discovery(MagicMock())
+        second_session.initialize = AsyncMock(side_effect=second_initialize)
+
+        with patch("mcp_multi_server.client.stdio_client") as mock_stdio:
+            mock_stdio.return_value.__aenter__ = AsyncMock(return_value=(MagicMock(), MagicMock()))
+            mock_stdio.return_value.__aexit__ = AsyncMock()
+
+            with patch("mcp_multi_server.client.ClientSession") as mock_session_class:
+                contexts = []
+                for session in (first_session, second_session):
+                    context = MagicMock()
+                    context.__aenter__ = AsyncMock(return_value=session)
+                    context.__aexit__ = AsyncMock()
+                    contexts.append(context)
+                mock_session_class.side_effect = contexts
+
+                with anyio.fail_after(2):
+                    async with client:
+                        assert list(client.sessions) == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_cached_capabilities_skip_discovery(self, sample_tools: List[Tool]) -> None:
+        """Test servers with cached capabilities are connected without list_* discovery requests."""
+        config = {"mcpServers": {"tool_server": {"command": "python", "args": ["-m", "test.tool_server"]}}}
+        cached = {"tool_server": ServerCapabilities(name="tool_server", tools=ListToolsResult(tools=sample_tools))}
+        client = MultiServerClient.from_dict(config, cached_capabilities=cached)
+
+        with patch("mcp_multi_server.client.stdio_client") as mock_stdio:
+            mock_stdio.return_value.__aenter__ = AsyncMock(return_value=(MagicMock(), MagicMock()))
+            mock_stdio.return_value.__aexit__ = AsyncMock()
+
+            with patch("mcp_multi_server.client.ClientSession") as mock_session_class:
+                mock_session = _mock_session_empty_discovery(MagicMock())
+                mock_session_class.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+                mock_session_class.return_value.__aexit__ = AsyncMock()
+
+                async with client:
+                    mock_session.initialize.assert_awaited_once()
+                    mock_session.list_tools.assert_not_called()
+                    mock_session.list_prompts.assert_not_called()
+                    assert client.capabilities["tool_server"].tools == cached["tool_server"].tools
+                    assert client.tool_to_server == {"get_weather": "tool_server", "calculate": "tool_server"}
+
 
 class TestConnectionErrorHandling:
     """Tests for strict_connect policy and transport-death handling during discovery."""
@@ -646,6 +711,115 @@ class TestToolRouting:
         assert "not found in server" in result.content[0].text  # type: ignore
 
 
+class TestBatchToolCalls:
+    """Tests for call_tools fan-out and server-side batching."""
+
+    @pytest.mark.asyncio
+    async def test_call_tools_preserves_order_and_converts_errors(
+        self,
+        sample_config_dict: Dict[str, Any],
+        mock_tool_server: MagicMock,
+    ) -> None:
+        """Test call_tools returns one result per call in order, with failures as error results."""
+        client = MultiServerClient.from_dict(sample_config_dict)
+
+        failing_server = MagicMock()
+        failing_server.call_tool = AsyncMock(side_effect=Exception("Server error"))
+
+        client.tool_to_server = {"get_weather": "tool_server", "calculate": "tool_server", "broken": "bad_server"}
+        client.sessions = {"tool_server": mock_tool_server, "bad_server": failing_server}
+
+        results = await client.call_tools(
+            [
+                ("get_weather", {"location": "Paris"}),
+                ("broken", {}),
+                ("not_a_tool", {}),
+                ("calculate", {"expression": "2 + 2"}),
+            ]
+        )
+
+        assert len(results) == 4
+        assert "Paris" in results[0].content[0].text  # type: ignore
+        assert results[1].isError is True
+        assert "Server error" in results[1].content[0].text  # type: ignore
+        assert results[2].isError is True
+        assert "Unknown tool" in results[2].content[0].text  # type: ignore
+        assert results[3].content[0].text == "Result: 4"  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_call_tools_batches_calls_for_supporting_server(
+        self,
+        sample_config_dict: Dict[str, Any],
+        sample_tools: List[Tool],
+    ) -> None:
+        """Test call_tools sends one batch_execute request for several calls to the same server."""
+        client = MultiServerClient.from_dict(sample_config_dict)
+
+        batch_tool = Tool(name="batch_execute", inputSchema={"type": "object"})
+        batch_server = MagicMock()
+        batch_server.call_tool = AsyncMock(
+            return_value=CallToolResult(
+                content=[],
+                structuredContent={
+                    "results": [
+                        {"content": [{"type": "text", "text": "first"}], "isError": False},
+                        {"content": [{"type": "text", "text": "second"}], "isError": False},
+                    ]
+                },
+            )
+        )
+
+        client.tool_to_server = {"get_weather": "tool_server", "calculate": "tool_server"}
+        client.sessions = {"tool_server": batch_server}
+        client.capabilities = {
+            "tool_server": ServerCapabilities(
+                name="tool_server", tools=ListToolsResult(tools=[*sample_tools, batch_tool])
+            )
+        }
+
+        results = await client.call_tools([("get_weather", {"location": "Rome"}), ("calculate", {"expression": "1"})])
+
+        assert [result.content[0].text for result in results] == ["first", "second"]  # type: ignore
+        batch_server.call_tool.assert_called_once_with(
+            "batch_execute",
+            {
+                "operations": [
+                    {"tool": "get_weather", "arguments": {"location": "Rome"}},
+                    {"tool": "calculate", "arguments": {"expression": "1"}},
+                ],
+                "maxConcurrent": 2,
+                "stopOnError": False,
+            },
+            read_timeout_seconds=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_call_tools_invalid_batch_response_returns_errors(
+        self,
+        sample_config_dict: Dict[str, Any],
+        sample_tools: List[Tool],
+    ) -> None:
+        """Test call_tools marks every batched call as failed on a malformed batch response."""
+        client = MultiServerClient.from_dict(sample_config_dict)
+
+        batch_tool = Tool(name="batch_execute", inputSchema={"type": "object"})
+        batch_server = MagicMock()
+        batch_server.call_tool = AsyncMock(return_value=CallToolResult(content=[], structuredContent={}))
+
+        client.tool_to_server = {"get_weather": "tool_server", "calculate": "tool_server"}
+        client.sessions = {"tool_server": batch_server}
+        client.capabilities = {
+            "tool_server": ServerCapabilities(
+                name="tool_server", tools=ListToolsResult(tools=[*sample_tools, batch_tool])
+            )
+        }
+
+        results = await client.call_tools([("get_weather", {"location": "Rome"}), ("calculate", {"expression": "1"})])
+
+        assert all(result.isError for result in results)
+        assert "Invalid batch_execute response" in results[0].content[0].text  # type: ignore
+
+
 class TestResourceRouting:
     """Tests for resource routing to appropriate servers and error handling."""
 
@@ -1023,3 +1197,29 @@ class TestErrorHandling:
 
         with pytest.raises(ValueError, match="Invalid arguments"):
             await client.get_prompt("test_prompt", {})
+
+    @pytest.mark.asyncio
+    async def test_set_logging_level_updates_servers_concurrently(self, sample_config_dict: Dict[str, Any]) -> None:
+        """Test set_logging_level reaches all servers concurrently and tolerates servers that reject it."""
+        client = MultiServerClient.from_dict(sample_config_dict)
+        second_started = anyio.Event()
+
+        async def first_set_level(level: str) -> None:
+            # Only completes if the second server is updated while this one is pending
+            await second_started.wait()
+
+        async def second_set_level(level: str) -> None:
+            second_started.set()
+            raise McpError(ErrorData(code=METHOD_NOT_FOUND, message="Method not found"))
+
+        first_server = MagicMock()
+        first_server.set_logging_level = AsyncMock(side_effect=first_set_level)
+        second_server = MagicMock()
+        second_server.set_logging_level = AsyncMock(side_effect=second_set_level)
+        client.sessions = {"first": first_server, "second": second_server}
+
+        with anyio.fail_after(2):
+            await client.set_logging_level("info")
+
+        first_server.set_logging_level.assert_awaited_once_with(level="info")
+        second_server.set_logging_level.assert_awaited_once_with(level="info")
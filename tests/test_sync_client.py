@@ -6,6 +6,7 @@
 # test file is passed explicitly.
 # pylint: disable=protected-access
 
+import asyncio
 from pathlib import Path
 from typing import (
     Any,
@@ -398,6 +399,48 @@ class TestSyncToolCalling:
             call_kwargs = mock_client.call_tool.call_args[1]
             assert call_kwargs["server_name"] == "tool_server"
 
+    @patch("mcp_multi_server.sync_client.MultiServerClient")
+    def test_call_tools_returns_results(
+        self, mock_client_class: MagicMock, sample_config_dict: Dict[str, Any]
+    ) -> None:
+        """Test call_tools returns the ordered results from underlying client."""
+        mock_client = MagicMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock()
+        mock_client.call_tools = AsyncMock(
+            return_value=[
+                CallToolResult(content=[TextContent(type="text", text="first")], isError=False),
+                CallToolResult(content=[TextContent(type="text", text="second")], isError=False),
+            ]
+        )
+        mock_client_class.from_dict.return_value = mock_client
+
+        with SyncMultiServerClient.from_dict(sample_config_dict) as client:
+            results = client.call_tools([("tool_a", {}), ("tool_b", {"arg": "value"})])
+
+            assert [result.content[0].text for result in results] == ["first", "second"]  # type: ignore
+            mock_client.call_tools.assert_called_once_with(
+                [("tool_a", {}), ("tool_b", {"arg": "value"})], read_timeout_seconds=None
+            )
+
+    @patch("mcp_multi_server.sync_client.MultiServerClient")
+    def test_call_tools_returns_errors_when_not_initialized(
+        self, mock_client_class: MagicMock, sample_config_dict: Dict[str, Any]
+    ) -> None:
+        """Test call_tools returns one error result per call when client not initialized."""
+        mock_client = MagicMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock()
+        mock_client_class.from_dict.return_value = mock_client
+
+        client = SyncMultiServerClient.from_dict(sample_config_dict)
+        client.mcp_client = None  # Simulate uninitialized state
+
+        results = client.call_tools([("tool_a", {}), ("tool_b", {})])
+        assert len(results) == 2
+        assert all(result.isError for result in results)
+        client.shutdown()
+
 
 # ============================================================================
 # Resource Reading Tests
@@ -631,6 +674,25 @@ class TestSyncLifecycle:
         finally:
             client.shutdown()
 
+    @patch("mcp_multi_server.sync_client.MultiServerClient")
+    def test_background_loop_uses_loop_factory(
+        self, mock_client_class: MagicMock, sample_config_dict: Dict[str, Any]
+    ) -> None:
+        """Test that the background loop is created by the loop_factory passed by the caller."""
+        mock_client = MagicMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock()
+        mock_client_class.from_dict.return_value = mock_client
+
+        mock_factory = MagicMock(side_effect=asyncio.new_event_loop)
+        client = SyncMultiServerClient.from_dict(sample_config_dict, loop_factory=mock_factory)
+        try:
+            mock_factory.assert_called_once_with()
+            assert client.loop is not None
+            assert client.loop.is_running()
+        finally:
+            client.shutdown()
+
     @patch("mcp_multi_server.sync_client.MultiServerClient")
     def test_shutdown_stops_thread(self, mock_client_class: MagicMock, sample_config_dict: Dict[str, Any]) -> None:
         """Test that shutdown stops the background thread."""